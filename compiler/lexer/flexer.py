@@ -169,11 +169,108 @@ class Lexer(object):
         return Token(lexeme_type, lexeme)
 """
 
+# ids 0 and 1 are kept for unknown lexemes and the end of the input, as the
+# parser generators number their terminals
+DFA_LEXER_TEMPLATE = """
+from array import array
+
+TOKEN_NAMES = %(token_names)s
+END = 1
+# transitions of every DFA state, and the id of the token it accepts (or 0)
+TRANSITIONS = %(transitions)s
+ACCEPT = %(accept)s
+STOP_CHARS = %(stop_chars)r
+
+
+class Token(object):
+    def __init__(self, type_, lexeme):
+        self.type_ = type_
+        self.lexeme = lexeme
+
+
+def _scan(code, current):
+    \"\"\"
+    Skips the stop chars from current and matches the longest lexeme from
+    there. Returns (token id, start, end), with the id of END at the end of
+    code.
+    \"\"\"
+    size = len(code)
+    while current < size and code[current] in STOP_CHARS:
+        current += 1
+    if current >= size:
+        return END, size, size
+    state = 0
+    position = current
+    token_id = 0
+    end = current
+    while position < size:
+        state = TRANSITIONS[state].get(code[position])
+        if state is None:
+            break
+        position += 1
+        if ACCEPT[state] != 0:
+            token_id = ACCEPT[state]
+            end = position
+    if token_id == 0:
+        raise ValueError('Unknown lexeme: ' + code[current:position + 1])
+    return token_id, current, end
+
+
+def tokenize(code):
+    \"\"\"
+    The ids of the tokens of code and the offsets where each one starts and
+    ends, as arrays. The last id is END, with both offsets at len(code).
+    \"\"\"
+    ids = array('h')
+    starts = array('i')
+    ends = array('i')
+    current = 0
+    while True:
+        token_id, start, current = _scan(code, current)
+        ids.append(token_id)
+        starts.append(start)
+        ends.append(current)
+        if token_id == END:
+            return ids, starts, ends
+
+
+class Lexer(object):
+    def __init__(self, code):
+        self.code = code
+        self.reset()
+
+    def reset(self):
+        self.current = 0
+
+    def get_next_token(self):
+        token_id, start, self.current = _scan(self.code, self.current)
+        if token_id == END:
+            return None
+        return Token(TOKEN_NAMES[token_id], self.code[start:self.current])
+"""
+
+
+def token_names(types):
+    """Names of the token ids of a DFA lexer recognizing types"""
+    return ['', '$'] + sorted(set(types))
+
+
+def _eclosure(nfa, states):
+    closed = set(states)
+    pending = list(states)
+    while len(pending) > 0:
+        state = pending.pop()
+        for target in nfa.get(state, {}).get('', []):
+            if target not in closed:
+                closed.add(target)
+                pending.append(target)
+    return frozenset(closed)
+
 
 class Flexer(object):
     def __init__(self, code, verbose=False):
         self.lines = [line.strip() for line in code.strip().split('\n')
-                      if line.strip()[0] != '#' and len(line.strip()) > 0]
+                      if len(line.strip()) > 0 and line.strip()[0] != '#']
         self.verbose = verbose
         self.state_counter = 1
 
@@ -401,7 +498,7 @@ class Flexer(object):
             self.state_counter += 1
         return nfa
 
-    def generate(self):
+    def build_nfa(self):
         self.final_states = {}
         nfa = NFA()
         nfa.initial = 0
@@ -410,6 +507,65 @@ class Flexer(object):
             line_nfa = self.generate_line(line, numline + 1)
             nfa.update(line_nfa)
             nfa[0][''].append(line_nfa.initial)
+        return nfa
+
+    def build_dfa(self, nfa):
+        """
+        Subset construction: returns the transitions of every DFA state
+        (a dict char -> state, 0 is the initial one) and the token type
+        accepted by every state (None if it does not accept any). Like the
+        NFA lexer, the first rule defined wins.
+        """
+        start = _eclosure(nfa, [0])
+        states = [start]
+        index = {start: 0}
+        transitions = []
+        pending = 0
+        while pending < len(states):
+            moves = {}
+            for state in states[pending]:
+                for char, targets in nfa.get(state, {}).iteritems():
+                    if char != '':
+                        moves.setdefault(char, set()).update(targets)
+            row = {}
+            for char in sorted(moves):
+                target = _eclosure(nfa, moves[char])
+                if target not in index:
+                    index[target] = len(states)
+                    states.append(target)
+                row[char] = index[target]
+            transitions.append(row)
+            pending += 1
+        accept = []
+        for dfa_state in states:
+            finals = [state for state in dfa_state
+                      if state in self.final_states]
+            accept.append(
+                self.final_states[min(finals)] if len(finals) > 0 else None
+            )
+        return transitions, accept
+
+    def generate_dfa(self):
+        """
+        Source of a lexer running the DFA of the rules, that can also give
+        the ids of the tokens (see token_names) with their offsets, for a
+        parser whose terminals are numbered the same way.
+        """
+        transitions, accept = self.build_dfa(self.build_nfa())
+        names = token_names(self.final_states.values())
+        ids = dict((name, id_) for id_, name in enumerate(names))
+        return DFA_LEXER_TEMPLATE % {
+            'token_names': repr(names),
+            'transitions': '[\n' + ''.join(
+                '    %r,\n' % row for row in transitions
+            ) + ']',
+            'accept': repr([ids[type_] if type_ is not None else 0
+                            for type_ in accept]),
+            'stop_chars': ' \t\n',
+        }
+
+    def generate(self):
+        nfa = self.build_nfa()
         # generate code with 4 spaces
         # nfa code will be inside a method, so in total: 8 spaces
         nfa_code  = '        self.goto_nfa = ' + str(nfa) + '\n'
@@ -421,9 +577,12 @@ if __name__ == '__main__':
     import sys
     if len(sys.argv) < 2:
         raise ValueError('Required argument missing')
-    verbose = len(sys.argv) == 3 and sys.argv[2] == '-v'
+    verbose = '-v' in sys.argv[2:]
     with open(sys.argv[1]) as f:
         flexer = Flexer(f.read(), verbose)
-    print flexer.generate()
+    if '--dfa' in sys.argv[2:]:
+        print flexer.generate_dfa()
+    else:
+        print flexer.generate()
     
 
@@ -0,0 +1,97 @@
+"""
+Syntax directed translation: the semantic actions of a grammar are run by
+the LR parser as it reduces, so a program can be translated in the same pass
+that parses it, without building a tree first.
+
+An alternative of a rule names its action in braces after its symbols:
+
+    <expr> ::= <expr> "SUM_OPERATOR" <term> {operation} | <term>
+
+The action is a function of one of the Python modules the grammar imports
+(the first one defining it, in import order). It is called as
+action(context, values) on every reduction by its production, where values
+are the values of the symbols of the production (the tokens for terminals)
+and context is whatever the caller passed to translate, and what it returns
+is the value of the variable. Alternatives without an action take the value
+of their only symbol, or None. Markers, variables with just the empty
+alternative, run their action before anything after them is parsed, which
+is where jump targets are taken for backpatching.
+
+Reductions skipped by LRTable.bypass_unit_reductions do not run their
+actions, so the table of a Translator should not have them bypassed.
+"""
+
+from lalr import build_lalr_table
+from runtime import SHIFT
+from slr import LRParser
+
+
+class UndefinedAction(Exception):
+    def __init__(self, production):
+        self.production = production
+
+    def __str__(self):
+        return 'Undefined action ' + self.production.action + ' of ' + \
+               str(self.production)
+
+
+def _copy(context, values):
+    return values[0] if len(values) == 1 else None
+
+
+def bind_actions(grammar, resolved):
+    """
+    The function of the action of every production of grammar, by
+    production id, looked up in the definition modules of resolved.
+    """
+    modules = [definitions.module for definitions in resolved.definitions()]
+    actions = []
+    for prod in grammar.productions:
+        if prod.action is None:
+            actions.append(_copy)
+            continue
+        for module in modules:
+            action = getattr(module, prod.action, None)
+            if action is not None:
+                actions.append(action)
+                break
+        else:
+            raise UndefinedAction(prod)
+    return actions
+
+
+class Translator(object):
+    """
+    Runs the semantic actions of grammar (with the imports of load_grammar
+    in resolved) over an LRParser, with its LALR(1) table by default.
+    """
+
+    def __init__(self, grammar, resolved, table=None):
+        if table is None:
+            table = build_lalr_table(grammar)
+        self.parser = LRParser(grammar, table)
+        self.actions = bind_actions(grammar, resolved)
+
+    def translate(self, lexer, context=None):
+        """
+        Parses the tokens of lexer running the actions with context and
+        returns the value of the start symbol. It runs on LRParser.events,
+        so tokens are read as the parser needs them and only the values of
+        the stack are kept.
+        """
+        actions = self.actions
+        prod_rhs = self.parser.grammar.prod_rhs
+        values = []
+        for event in self.parser.events(lexer):
+            if event[0] == SHIFT:
+                values.append(event[3])
+                continue
+            prod_id = event[1]
+            size = len(prod_rhs[prod_id])
+            if size > 0:
+                children = values[-size:]
+                del values[-size:]
+            else:
+                children = []
+            values.append(actions[prod_id](context, children))
+        return values[-1]
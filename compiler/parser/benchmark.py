@@ -0,0 +1,211 @@
+#!/usr/bin/env python
+"""
+Benchmarks of the grammar analysis on synthetic grammars of growing size.
+
+Every shape generates BNF source for a given size n:
+* expr: a precedence chain of n left-recursive levels, like example.bnf
+* wide: a single variable with n alternatives
+* nullable: a chain of n nullable variables, each one starting the next
+* lists: n left-recursive separated lists used in sequence
+
+For every shape and size the stages below are timed (best of --repeat runs,
+each one on an input built again from the source) and the growth between
+consecutive sizes is reported as an exponent k such that time ~ n^k. A stage
+that gets slower than --max-seconds is not run for the bigger sizes of that
+shape.
+
+    python -m compiler.parser.benchmark --sizes 10,100,1000 --shapes expr
+"""
+
+from bnf_parser import Grammar, parse_bnf
+from lalr import build_lalr_table
+from predictive import build_parser_table
+from slr import build_slr_table, items
+import argparse
+import math
+import sys
+import timeit
+
+
+def expr_grammar(n):
+    lines = []
+    for i in xrange(n):
+        lines.append('<E%d> ::= <E%d> "OP%d" <E%d> | <E%d>' % (
+            i, i, i, i + 1, i + 1
+        ))
+    lines.append('<E%d> ::= "NUMBER" | "OPEN_PARENS" <E0> "CLOSE_PARENS"' % n)
+    return '\n'.join(lines)
+
+
+def wide_grammar(n):
+    lines = ['<S> ::= <A0>']
+    for i in xrange(n):
+        lines.append('<A0> ::= "T%d" <B> | <B> "U%d"' % (i, i))
+    lines.append('<B> ::= "X" | ""')
+    return '\n'.join(lines)
+
+
+def nullable_grammar(n):
+    lines = ['<S> ::= <N0> "END"']
+    for i in xrange(n):
+        lines.append('<N%d> ::= <N%d> "T%d" | ""' % (i, i + 1, i))
+    lines.append('<N%d> ::= "LAST" | ""' % n)
+    return '\n'.join(lines)
+
+
+def lists_grammar(n):
+    lines = ['<S> ::= ' + ' '.join('<L%d>' % i for i in xrange(n))]
+    for i in xrange(n):
+        lines.append('<L%d> ::= <L%d> "SEP%d" "ITEM%d" | "ITEM%d"' % (
+            i, i, i, i, i
+        ))
+    return '\n'.join(lines)
+
+
+SHAPES = {
+    'expr': expr_grammar,
+    'wide': wide_grammar,
+    'nullable': nullable_grammar,
+    'lists': lists_grammar,
+}
+
+
+def _build_grammar(rules):
+    return Grammar(set(), set(), rules[0].variable, list(rules))
+
+
+def _first_follow(grammar):
+    for var in grammar.variables:
+        grammar.first(var)
+        grammar.follow(var)
+
+
+# (name, function timed, what it receives) the input is produced by the
+# stage named after 'from' (or is the source code for 'source')
+STAGES = [
+    ('load', parse_bnf, 'source'),
+    ('grammar', lambda parsed: _build_grammar(parsed[0]), 'load'),
+    ('first/follow', _first_follow, 'grammar'),
+    ('predictive', build_parser_table, 'grammar'),
+    ('slr items', items, 'grammar'),
+    ('slr table', build_slr_table, 'grammar'),
+    ('lalr table', build_lalr_table, 'grammar'),
+]
+
+
+def _fresh_input(from_, source):
+    """
+    The input of a stage reading from_, produced again (untimed) from
+    source. Grammars memoize their analysis, so every run of a stage needs
+    its own input or it would be timing the lookup of the previous result.
+    """
+    if from_ == 'source':
+        return source
+    for name, function, producer in STAGES:
+        if name == from_:
+            return function(_fresh_input(producer, source))
+    raise ValueError('Unknown stage: ' + from_)
+
+
+def _time(function, from_, source, repeat):
+    best = None
+    result = None
+    for i in xrange(repeat):
+        argument = _fresh_input(from_, source)
+        start = timeit.default_timer()
+        result = function(argument)
+        elapsed = timeit.default_timer() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    return best, result
+
+
+def run_shape(shape, sizes, stages, repeat, max_seconds):
+    """Returns {stage: [(size, seconds or None)]}"""
+    results = dict((name, []) for name, f, from_ in STAGES)
+    skipped = set()
+    for size in sizes:
+        source = SHAPES[shape](size)
+        outputs = {'source': source}
+        for name, function, from_ in STAGES:
+            if name in skipped or outputs.get(from_) is None:
+                results[name].append((size, None))
+                continue
+            if name not in stages and not _needed(name, stages):
+                continue
+            try:
+                seconds, outputs[name] = _time(
+                    function,
+                    from_,
+                    source,
+                    repeat
+                )
+            except Exception as e:
+                print >> sys.stderr, '%s %s(%d): %s' % (
+                    name, shape, size, e
+                )
+                skipped.add(name)
+                results[name].append((size, None))
+                continue
+            results[name].append((size, seconds))
+            if seconds > max_seconds:
+                skipped.add(name)
+    return dict((name, r) for name, r in results.iteritems()
+                if name in stages)
+
+
+def _needed(name, stages):
+    """Whether the output of stage name feeds one of the stages asked for"""
+    for other, function, from_ in STAGES:
+        if from_ == name and (other in stages or _needed(other, stages)):
+            return True
+    return False
+
+
+def report(shape, results, stages):
+    print 'Shape: ' + shape
+    for name in stages:
+        print '  ' + name
+        previous = None
+        for size, seconds in results[name]:
+            if seconds is None:
+                print '    n=%-8d skipped' % size
+                previous = None
+                continue
+            line = '    n=%-8d %10.4fs' % (size, seconds)
+            if previous is not None and previous[1] > 0 and seconds > 0:
+                growth = math.log(seconds / previous[1]) / \
+                    math.log(float(size) / previous[0])
+                line += '   ~n^%.2f' % growth
+            print line
+            previous = (size, seconds)
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--shapes', default=','.join(sorted(SHAPES)))
+    parser.add_argument('--sizes', default='10,20,40,80,160')
+    parser.add_argument(
+        '--stages',
+        default=','.join(name for name, f, from_ in STAGES)
+    )
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--max-seconds', type=float, default=10.0)
+    args = parser.parse_args(argv)
+    sizes = [int(size) for size in args.sizes.split(',')]
+    stages = args.stages.split(',')
+    for shape in args.shapes.split(','):
+        if shape not in SHAPES:
+            raise ValueError('Unknown shape: ' + shape)
+        results = run_shape(
+            shape,
+            sizes,
+            stages,
+            args.repeat,
+            args.max_seconds
+        )
+        report(shape, results, stages)
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -10,8 +10,8 @@ class Lexer(object):
         self.code = code
         self.stop_chars = [' ', '\t', '\n']
         # black magic incantions go here (autogenerated NFA)
-        self.goto_nfa = {0: {'': [1, 245, 251, 253, 497]}, 1: {'<': [2]}, 2: {'': [3]}, 3: {'': [4, 6, 8, 10, 12, 14, 16, 18, 20, 22, 24, 26, 28, 30, 32, 34, 36, 38, 40, 42, 44, 46, 48, 50, 52, 54, 56, 58, 60, 62, 64, 66, 68, 70, 72, 74, 76, 78, 80, 82, 84, 86, 88, 90, 92, 94, 96, 98, 100, 102, 104, 106, 108]}, 4: {'a': [5]}, 5: {'': [110]}, 6: {'b': [7]}, 7: {'': [110]}, 8: {'c': [9]}, 9: {'': [110]}, 10: {'d': [11]}, 11: {'': [110]}, 12: {'e': [13]}, 13: {'': [110]}, 14: {'f': [15]}, 15: {'': [110]}, 16: {'g': [17]}, 17: {'': [110]}, 18: {'h': [19]}, 19: {'': [110]}, 20: {'i': [21]}, 21: {'': [110]}, 22: {'j': [23]}, 23: {'': [110]}, 24: {'k': [25]}, 25: {'': [110]}, 26: {'l': [27]}, 27: {'': [110]}, 28: {'m': [29]}, 29: {'': [110]}, 30: {'n': [31]}, 31: {'': [110]}, 32: {'o': [33]}, 33: {'': [110]}, 34: {'p': [35]}, 35: {'': [110]}, 36: {'q': [37]}, 37: {'': [110]}, 38: {'r': [39]}, 39: {'': [110]}, 40: {'s': [41]}, 41: {'': [110]}, 42: {'t': [43]}, 43: {'': [110]}, 44: {'u': [45]}, 45: {'': [110]}, 46: {'v': [47]}, 47: {'': [110]}, 48: {'w': [49]}, 49: {'': [110]}, 50: {'x': [51]}, 51: {'': [110]}, 52: {'y': [53]}, 53: {'': [110]}, 54: {'z': [55]}, 55: {'': [110]}, 56: {'A': [57]}, 57: {'': [110]}, 58: {'B': [59]}, 59: {'': [110]}, 60: {'C': [61]}, 61: {'': [110]}, 62: {'D': [63]}, 63: {'': [110]}, 64: {'E': [65]}, 65: {'': [110]}, 66: {'F': [67]}, 67: {'': [110]}, 68: {'G': [69]}, 69: {'': [110]}, 70: {'H': [71]}, 71: {'': [110]}, 72: {'I': [73]}, 73: {'': [110]}, 74: {'J': [75]}, 75: {'': [110]}, 76: {'K': [77]}, 77: {'': [110]}, 78: {'L': [79]}, 79: {'': [110]}, 80: {'M': [81]}, 81: {'': [110]}, 82: {'N': [83]}, 83: {'': [110]}, 84: {'O': [85]}, 85: {'': [110]}, 86: {'P': [87]}, 87: {'': [110]}, 88: {'Q': [89]}, 89: {'': [110]}, 90: {'R': [91]}, 91: {'': [110]}, 92: {'S': [93]}, 93: {'': [110]}, 94: {'T': [95]}, 95: {'': [110]}, 96: {'U': [97]}, 97: {'': [110]}, 98: {'V': [99]}, 99: {'': [110]}, 100: {'W': [101]}, 101: {'': [110]}, 102: {'X': [103]}, 103: {'': [110]}, 104: {'Y': [105]}, 105: {'': [110]}, 106: {'Z': [107]}, 107: {'': [110]}, 108: {'_': [109]}, 109: {'': [110]}, 110: {'': [111]}, 111: {'': [112, 242]}, 112: {'': [113, 115, 117, 119, 121, 123, 125, 127, 129, 131, 133, 135, 137, 139, 141, 143, 145, 147, 149, 151, 153, 155, 157, 159, 161, 163, 165, 167, 169, 171, 173, 175, 177, 179, 181, 183, 185, 187, 189, 191, 193, 195, 197, 199, 201, 203, 205, 207, 209, 211, 213, 215, 217, 219, 221, 223, 225, 227, 229, 231, 233, 235, 237, 239]}, 113: {'A': [114]}, 114: {'': [241]}, 115: {'B': [116]}, 116: {'': [241]}, 117: {'C': [118]}, 118: {'': [241]}, 119: {'D': [120]}, 120: {'': [241]}, 121: {'E': [122]}, 122: {'': [241]}, 123: {'F': [124]}, 124: {'': [241]}, 125: {'G': [126]}, 126: {'': [241]}, 127: {'H': [128]}, 128: {'': [241]}, 129: {'I': [130]}, 130: {'': [241]}, 131: {'J': [132]}, 132: {'': [241]}, 133: {'K': [134]}, 134: {'': [241]}, 135: {'L': [136]}, 136: {'': [241]}, 137: {'M': [138]}, 138: {'': [241]}, 139: {'N': [140]}, 140: {'': [241]}, 141: {'O': [142]}, 142: {'': [241]}, 143: {'P': [144]}, 144: {'': [241]}, 145: {'Q': [146]}, 146: {'': [241]}, 147: {'R': [148]}, 148: {'': [241]}, 149: {'S': [150]}, 150: {'': [241]}, 151: {'T': [152]}, 152: {'': [241]}, 153: {'U': [154]}, 154: {'': [241]}, 155: {'V': [156]}, 156: {'': [241]}, 157: {'W': [158]}, 158: {'': [241]}, 159: {'X': [160]}, 160: {'': [241]}, 161: {'Y': [162]}, 162: {'': [241]}, 163: {'Z': [164]}, 164: {'': [241]}, 165: {'-': [166]}, 166: {'': [241]}, 167: {'0': [168]}, 168: {'': [241]}, 169: {'1': [170]}, 170: {'': [241]}, 171: {'2': [172]}, 172: {'': [241]}, 173: {'3': [174]}, 174: {'': [241]}, 175: {'4': [176]}, 176: {'': [241]}, 177: {'5': [178]}, 178: {'': [241]}, 179: {'6': [180]}, 180: {'': [241]}, 181: {'7': [182]}, 182: {'': [241]}, 183: {'8': [184]}, 184: {'': [241]}, 185: {'9': [186]}, 186: {'': [241]}, 187: {'a': [188]}, 188: {'': [241]}, 189: {'b': [190]}, 190: {'': [241]}, 191: {'c': [192]}, 192: {'': [241]}, 193: {'d': [194]}, 194: {'': [241]}, 195: {'e': [196]}, 196: {'': [241]}, 197: {'f': [198]}, 198: {'': [241]}, 199: {'g': [200]}, 200: {'': [241]}, 201: {'h': [202]}, 202: {'': [241]}, 203: {'i': [204]}, 204: {'': [241]}, 205: {'j': [206]}, 206: {'': [241]}, 207: {'k': [208]}, 208: {'': [241]}, 209: {'l': [210]}, 210: {'': [241]}, 211: {'m': [212]}, 212: {'': [241]}, 213: {'n': [214]}, 214: {'': [241]}, 215: {'o': [216]}, 216: {'': [241]}, 217: {'p': [218]}, 218: {'': [241]}, 219: {'q': [220]}, 220: {'': [241]}, 221: {'r': [222]}, 222: {'': [241]}, 223: {'s': [224]}, 224: {'': [241]}, 225: {'t': [226]}, 226: {'': [241]}, 227: {'u': [228]}, 228: {'': [241]}, 229: {'v': [230]}, 230: {'': [241]}, 231: {'w': [232]}, 232: {'': [241]}, 233: {'x': [234]}, 234: {'': [241]}, 235: {'y': [236]}, 236: {'': [241]}, 237: {'z': [238]}, 238: {'': [241]}, 239: {'_': [240]}, 240: {'': [241]}, 241: {'': [112, 242]}, 242: {'': [243]}, 243: {'>': [244]}, 245: {':': [246]}, 246: {'': [247]}, 247: {':': [248]}, 248: {'': [249]}, 249: {'=': [250]}, 251: {'|': [252]}, 253: {'"': [254]}, 254: {'': [255]}, 255: {'': [256, 258, 260, 262, 264, 266, 268, 270, 272, 274, 276, 278, 280, 282, 284, 286, 288, 290, 292, 294, 296, 298, 300, 302, 304, 306, 308, 310, 312, 314, 316, 318, 320, 322, 324, 326, 328, 330, 332, 334, 336, 338, 340, 342, 344, 346, 348, 350, 352, 354, 356, 358, 360]}, 256: {'a': [257]}, 257: {'': [362]}, 258: {'b': [259]}, 259: {'': [362]}, 260: {'c': [261]}, 261: {'': [362]}, 262: {'d': [263]}, 263: {'': [362]}, 264: {'e': [265]}, 265: {'': [362]}, 266: {'f': [267]}, 267: {'': [362]}, 268: {'g': [269]}, 269: {'': [362]}, 270: {'h': [271]}, 271: {'': [362]}, 272: {'i': [273]}, 273: {'': [362]}, 274: {'j': [275]}, 275: {'': [362]}, 276: {'k': [277]}, 277: {'': [362]}, 278: {'l': [279]}, 279: {'': [362]}, 280: {'m': [281]}, 281: {'': [362]}, 282: {'n': [283]}, 283: {'': [362]}, 284: {'o': [285]}, 285: {'': [362]}, 286: {'p': [287]}, 287: {'': [362]}, 288: {'q': [289]}, 289: {'': [362]}, 290: {'r': [291]}, 291: {'': [362]}, 292: {'s': [293]}, 293: {'': [362]}, 294: {'t': [295]}, 295: {'': [362]}, 296: {'u': [297]}, 297: {'': [362]}, 298: {'v': [299]}, 299: {'': [362]}, 300: {'w': [301]}, 301: {'': [362]}, 302: {'x': [303]}, 303: {'': [362]}, 304: {'y': [305]}, 305: {'': [362]}, 306: {'z': [307]}, 307: {'': [362]}, 308: {'A': [309]}, 309: {'': [362]}, 310: {'B': [311]}, 311: {'': [362]}, 312: {'C': [313]}, 313: {'': [362]}, 314: {'D': [315]}, 315: {'': [362]}, 316: {'E': [317]}, 317: {'': [362]}, 318: {'F': [319]}, 319: {'': [362]}, 320: {'G': [321]}, 321: {'': [362]}, 322: {'H': [323]}, 323: {'': [362]}, 324: {'I': [325]}, 325: {'': [362]}, 326: {'J': [327]}, 327: {'': [362]}, 328: {'K': [329]}, 329: {'': [362]}, 330: {'L': [331]}, 331: {'': [362]}, 332: {'M': [333]}, 333: {'': [362]}, 334: {'N': [335]}, 335: {'': [362]}, 336: {'O': [337]}, 337: {'': [362]}, 338: {'P': [339]}, 339: {'': [362]}, 340: {'Q': [341]}, 341: {'': [362]}, 342: {'R': [343]}, 343: {'': [362]}, 344: {'S': [345]}, 345: {'': [362]}, 346: {'T': [347]}, 347: {'': [362]}, 348: {'U': [349]}, 349: {'': [362]}, 350: {'V': [351]}, 351: {'': [362]}, 352: {'W': [353]}, 353: {'': [362]}, 354: {'X': [355]}, 355: {'': [362]}, 356: {'Y': [357]}, 357: {'': [362]}, 358: {'Z': [359]}, 359: {'': [362]}, 360: {'_': [361]}, 361: {'': [362]}, 362: {'': [363]}, 363: {'': [364, 494]}, 364: {'': [365, 367, 369, 371, 373, 375, 377, 379, 381, 383, 385, 387, 389, 391, 393, 395, 397, 399, 401, 403, 405, 407, 409, 411, 413, 415, 417, 419, 421, 423, 425, 427, 429, 431, 433, 435, 437, 439, 441, 443, 445, 447, 449, 451, 453, 455, 457, 459, 461, 463, 465, 467, 469, 471, 473, 475, 477, 479, 481, 483, 485, 487, 489, 491]}, 365: {'A': [366]}, 366: {'': [493]}, 367: {'B': [368]}, 368: {'': [493]}, 369: {'C': [370]}, 370: {'': [493]}, 371: {'D': [372]}, 372: {'': [493]}, 373: {'E': [374]}, 374: {'': [493]}, 375: {'F': [376]}, 376: {'': [493]}, 377: {'G': [378]}, 378: {'': [493]}, 379: {'H': [380]}, 380: {'': [493]}, 381: {'I': [382]}, 382: {'': [493]}, 383: {'J': [384]}, 384: {'': [493]}, 385: {'K': [386]}, 386: {'': [493]}, 387: {'L': [388]}, 388: {'': [493]}, 389: {'M': [390]}, 390: {'': [493]}, 391: {'N': [392]}, 392: {'': [493]}, 393: {'O': [394]}, 394: {'': [493]}, 395: {'P': [396]}, 396: {'': [493]}, 397: {'Q': [398]}, 398: {'': [493]}, 399: {'R': [400]}, 400: {'': [493]}, 401: {'S': [402]}, 402: {'': [493]}, 403: {'T': [404]}, 404: {'': [493]}, 405: {'U': [406]}, 406: {'': [493]}, 407: {'V': [408]}, 408: {'': [493]}, 409: {'W': [410]}, 410: {'': [493]}, 411: {'X': [412]}, 412: {'': [493]}, 413: {'Y': [414]}, 414: {'': [493]}, 415: {'Z': [416]}, 416: {'': [493]}, 417: {'-': [418]}, 418: {'': [493]}, 419: {'0': [420]}, 420: {'': [493]}, 421: {'1': [422]}, 422: {'': [493]}, 423: {'2': [424]}, 424: {'': [493]}, 425: {'3': [426]}, 426: {'': [493]}, 427: {'4': [428]}, 428: {'': [493]}, 429: {'5': [430]}, 430: {'': [493]}, 431: {'6': [432]}, 432: {'': [493]}, 433: {'7': [434]}, 434: {'': [493]}, 435: {'8': [436]}, 436: {'': [493]}, 437: {'9': [438]}, 438: {'': [493]}, 439: {'a': [440]}, 440: {'': [493]}, 441: {'b': [442]}, 442: {'': [493]}, 443: {'c': [444]}, 444: {'': [493]}, 445: {'d': [446]}, 446: {'': [493]}, 447: {'e': [448]}, 448: {'': [493]}, 449: {'f': [450]}, 450: {'': [493]}, 451: {'g': [452]}, 452: {'': [493]}, 453: {'h': [454]}, 454: {'': [493]}, 455: {'i': [456]}, 456: {'': [493]}, 457: {'j': [458]}, 458: {'': [493]}, 459: {'k': [460]}, 460: {'': [493]}, 461: {'l': [462]}, 462: {'': [493]}, 463: {'m': [464]}, 464: {'': [493]}, 465: {'n': [466]}, 466: {'': [493]}, 467: {'o': [468]}, 468: {'': [493]}, 469: {'p': [470]}, 470: {'': [493]}, 471: {'q': [472]}, 472: {'': [493]}, 473: {'r': [474]}, 474: {'': [493]}, 475: {'s': [476]}, 476: {'': [493]}, 477: {'t': [478]}, 478: {'': [493]}, 479: {'u': [480]}, 480: {'': [493]}, 481: {'v': [482]}, 482: {'': [493]}, 483: {'w': [484]}, 484: {'': [493]}, 485: {'x': [486]}, 486: {'': [493]}, 487: {'y': [488]}, 488: {'': [493]}, 489: {'z': [490]}, 490: {'': [493]}, 491: {'_': [492]}, 492: {'': [493]}, 493: {'': [364, 494]}, 494: {'': [495]}, 495: {'"': [496]}, 497: {'"': [498]}, 498: {'': [499]}, 499: {'"': [500]}}
-        self.final_states= {496: 'RULE_TERMINAL', 252: 'OR', 250: 'RULE_DEFINITION', 244: 'RULE_NAME', 500: 'EMPTY'}
+        self.goto_nfa = {0: {'': [1, 245, 251, 253, 497, 501, 515, 741]}, 1: {'<': [2]}, 2: {'': [3]}, 3: {'': [4, 6, 8, 10, 12, 14, 16, 18, 20, 22, 24, 26, 28, 30, 32, 34, 36, 38, 40, 42, 44, 46, 48, 50, 52, 54, 56, 58, 60, 62, 64, 66, 68, 70, 72, 74, 76, 78, 80, 82, 84, 86, 88, 90, 92, 94, 96, 98, 100, 102, 104, 106, 108]}, 4: {'a': [5]}, 5: {'': [110]}, 6: {'b': [7]}, 7: {'': [110]}, 8: {'c': [9]}, 9: {'': [110]}, 10: {'d': [11]}, 11: {'': [110]}, 12: {'e': [13]}, 13: {'': [110]}, 14: {'f': [15]}, 15: {'': [110]}, 16: {'g': [17]}, 17: {'': [110]}, 18: {'h': [19]}, 19: {'': [110]}, 20: {'i': [21]}, 21: {'': [110]}, 22: {'j': [23]}, 23: {'': [110]}, 24: {'k': [25]}, 25: {'': [110]}, 26: {'l': [27]}, 27: {'': [110]}, 28: {'m': [29]}, 29: {'': [110]}, 30: {'n': [31]}, 31: {'': [110]}, 32: {'o': [33]}, 33: {'': [110]}, 34: {'p': [35]}, 35: {'': [110]}, 36: {'q': [37]}, 37: {'': [110]}, 38: {'r': [39]}, 39: {'': [110]}, 40: {'s': [41]}, 41: {'': [110]}, 42: {'t': [43]}, 43: {'': [110]}, 44: {'u': [45]}, 45: {'': [110]}, 46: {'v': [47]}, 47: {'': [110]}, 48: {'w': [49]}, 49: {'': [110]}, 50: {'x': [51]}, 51: {'': [110]}, 52: {'y': [53]}, 53: {'': [110]}, 54: {'z': [55]}, 55: {'': [110]}, 56: {'A': [57]}, 57: {'': [110]}, 58: {'B': [59]}, 59: {'': [110]}, 60: {'C': [61]}, 61: {'': [110]}, 62: {'D': [63]}, 63: {'': [110]}, 64: {'E': [65]}, 65: {'': [110]}, 66: {'F': [67]}, 67: {'': [110]}, 68: {'G': [69]}, 69: {'': [110]}, 70: {'H': [71]}, 71: {'': [110]}, 72: {'I': [73]}, 73: {'': [110]}, 74: {'J': [75]}, 75: {'': [110]}, 76: {'K': [77]}, 77: {'': [110]}, 78: {'L': [79]}, 79: {'': [110]}, 80: {'M': [81]}, 81: {'': [110]}, 82: {'N': [83]}, 83: {'': [110]}, 84: {'O': [85]}, 85: {'': [110]}, 86: {'P': [87]}, 87: {'': [110]}, 88: {'Q': [89]}, 89: {'': [110]}, 90: {'R': [91]}, 91: {'': [110]}, 92: {'S': [93]}, 93: {'': [110]}, 94: {'T': [95]}, 95: {'': [110]}, 96: {'U': [97]}, 97: {'': [110]}, 98: {'V': [99]}, 99: {'': [110]}, 100: {'W': [101]}, 101: {'': [110]}, 102: {'X': [103]}, 103: {'': [110]}, 104: {'Y': [105]}, 105: {'': [110]}, 106: {'Z': [107]}, 107: {'': [110]}, 108: {'_': [109]}, 109: {'': [110]}, 110: {'': [111]}, 111: {'': [112, 242]}, 112: {'': [113, 115, 117, 119, 121, 123, 125, 127, 129, 131, 133, 135, 137, 139, 141, 143, 145, 147, 149, 151, 153, 155, 157, 159, 161, 163, 165, 167, 169, 171, 173, 175, 177, 179, 181, 183, 185, 187, 189, 191, 193, 195, 197, 199, 201, 203, 205, 207, 209, 211, 213, 215, 217, 219, 221, 223, 225, 227, 229, 231, 233, 235, 237, 239]}, 113: {'A': [114]}, 114: {'': [241]}, 115: {'B': [116]}, 116: {'': [241]}, 117: {'C': [118]}, 118: {'': [241]}, 119: {'D': [120]}, 120: {'': [241]}, 121: {'E': [122]}, 122: {'': [241]}, 123: {'F': [124]}, 124: {'': [241]}, 125: {'G': [126]}, 126: {'': [241]}, 127: {'H': [128]}, 128: {'': [241]}, 129: {'I': [130]}, 130: {'': [241]}, 131: {'J': [132]}, 132: {'': [241]}, 133: {'K': [134]}, 134: {'': [241]}, 135: {'L': [136]}, 136: {'': [241]}, 137: {'M': [138]}, 138: {'': [241]}, 139: {'N': [140]}, 140: {'': [241]}, 141: {'O': [142]}, 142: {'': [241]}, 143: {'P': [144]}, 144: {'': [241]}, 145: {'Q': [146]}, 146: {'': [241]}, 147: {'R': [148]}, 148: {'': [241]}, 149: {'S': [150]}, 150: {'': [241]}, 151: {'T': [152]}, 152: {'': [241]}, 153: {'U': [154]}, 154: {'': [241]}, 155: {'V': [156]}, 156: {'': [241]}, 157: {'W': [158]}, 158: {'': [241]}, 159: {'X': [160]}, 160: {'': [241]}, 161: {'Y': [162]}, 162: {'': [241]}, 163: {'Z': [164]}, 164: {'': [241]}, 165: {'-': [166]}, 166: {'': [241]}, 167: {'0': [168]}, 168: {'': [241]}, 169: {'1': [170]}, 170: {'': [241]}, 171: {'2': [172]}, 172: {'': [241]}, 173: {'3': [174]}, 174: {'': [241]}, 175: {'4': [176]}, 176: {'': [241]}, 177: {'5': [178]}, 178: {'': [241]}, 179: {'6': [180]}, 180: {'': [241]}, 181: {'7': [182]}, 182: {'': [241]}, 183: {'8': [184]}, 184: {'': [241]}, 185: {'9': [186]}, 186: {'': [241]}, 187: {'a': [188]}, 188: {'': [241]}, 189: {'b': [190]}, 190: {'': [241]}, 191: {'c': [192]}, 192: {'': [241]}, 193: {'d': [194]}, 194: {'': [241]}, 195: {'e': [196]}, 196: {'': [241]}, 197: {'f': [198]}, 198: {'': [241]}, 199: {'g': [200]}, 200: {'': [241]}, 201: {'h': [202]}, 202: {'': [241]}, 203: {'i': [204]}, 204: {'': [241]}, 205: {'j': [206]}, 206: {'': [241]}, 207: {'k': [208]}, 208: {'': [241]}, 209: {'l': [210]}, 210: {'': [241]}, 211: {'m': [212]}, 212: {'': [241]}, 213: {'n': [214]}, 214: {'': [241]}, 215: {'o': [216]}, 216: {'': [241]}, 217: {'p': [218]}, 218: {'': [241]}, 219: {'q': [220]}, 220: {'': [241]}, 221: {'r': [222]}, 222: {'': [241]}, 223: {'s': [224]}, 224: {'': [241]}, 225: {'t': [226]}, 226: {'': [241]}, 227: {'u': [228]}, 228: {'': [241]}, 229: {'v': [230]}, 230: {'': [241]}, 231: {'w': [232]}, 232: {'': [241]}, 233: {'x': [234]}, 234: {'': [241]}, 235: {'y': [236]}, 236: {'': [241]}, 237: {'z': [238]}, 238: {'': [241]}, 239: {'_': [240]}, 240: {'': [241]}, 241: {'': [112, 242]}, 242: {'': [243]}, 243: {'>': [244]}, 245: {':': [246]}, 246: {'': [247]}, 247: {':': [248]}, 248: {'': [249]}, 249: {'=': [250]}, 251: {'|': [252]}, 253: {'"': [254]}, 254: {'': [255]}, 255: {'': [256, 258, 260, 262, 264, 266, 268, 270, 272, 274, 276, 278, 280, 282, 284, 286, 288, 290, 292, 294, 296, 298, 300, 302, 304, 306, 308, 310, 312, 314, 316, 318, 320, 322, 324, 326, 328, 330, 332, 334, 336, 338, 340, 342, 344, 346, 348, 350, 352, 354, 356, 358, 360]}, 256: {'a': [257]}, 257: {'': [362]}, 258: {'b': [259]}, 259: {'': [362]}, 260: {'c': [261]}, 261: {'': [362]}, 262: {'d': [263]}, 263: {'': [362]}, 264: {'e': [265]}, 265: {'': [362]}, 266: {'f': [267]}, 267: {'': [362]}, 268: {'g': [269]}, 269: {'': [362]}, 270: {'h': [271]}, 271: {'': [362]}, 272: {'i': [273]}, 273: {'': [362]}, 274: {'j': [275]}, 275: {'': [362]}, 276: {'k': [277]}, 277: {'': [362]}, 278: {'l': [279]}, 279: {'': [362]}, 280: {'m': [281]}, 281: {'': [362]}, 282: {'n': [283]}, 283: {'': [362]}, 284: {'o': [285]}, 285: {'': [362]}, 286: {'p': [287]}, 287: {'': [362]}, 288: {'q': [289]}, 289: {'': [362]}, 290: {'r': [291]}, 291: {'': [362]}, 292: {'s': [293]}, 293: {'': [362]}, 294: {'t': [295]}, 295: {'': [362]}, 296: {'u': [297]}, 297: {'': [362]}, 298: {'v': [299]}, 299: {'': [362]}, 300: {'w': [301]}, 301: {'': [362]}, 302: {'x': [303]}, 303: {'': [362]}, 304: {'y': [305]}, 305: {'': [362]}, 306: {'z': [307]}, 307: {'': [362]}, 308: {'A': [309]}, 309: {'': [362]}, 310: {'B': [311]}, 311: {'': [362]}, 312: {'C': [313]}, 313: {'': [362]}, 314: {'D': [315]}, 315: {'': [362]}, 316: {'E': [317]}, 317: {'': [362]}, 318: {'F': [319]}, 319: {'': [362]}, 320: {'G': [321]}, 321: {'': [362]}, 322: {'H': [323]}, 323: {'': [362]}, 324: {'I': [325]}, 325: {'': [362]}, 326: {'J': [327]}, 327: {'': [362]}, 328: {'K': [329]}, 329: {'': [362]}, 330: {'L': [331]}, 331: {'': [362]}, 332: {'M': [333]}, 333: {'': [362]}, 334: {'N': [335]}, 335: {'': [362]}, 336: {'O': [337]}, 337: {'': [362]}, 338: {'P': [339]}, 339: {'': [362]}, 340: {'Q': [341]}, 341: {'': [362]}, 342: {'R': [343]}, 343: {'': [362]}, 344: {'S': [345]}, 345: {'': [362]}, 346: {'T': [347]}, 347: {'': [362]}, 348: {'U': [349]}, 349: {'': [362]}, 350: {'V': [351]}, 351: {'': [362]}, 352: {'W': [353]}, 353: {'': [362]}, 354: {'X': [355]}, 355: {'': [362]}, 356: {'Y': [357]}, 357: {'': [362]}, 358: {'Z': [359]}, 359: {'': [362]}, 360: {'_': [361]}, 361: {'': [362]}, 362: {'': [363]}, 363: {'': [364, 494]}, 364: {'': [365, 367, 369, 371, 373, 375, 377, 379, 381, 383, 385, 387, 389, 391, 393, 395, 397, 399, 401, 403, 405, 407, 409, 411, 413, 415, 417, 419, 421, 423, 425, 427, 429, 431, 433, 435, 437, 439, 441, 443, 445, 447, 449, 451, 453, 455, 457, 459, 461, 463, 465, 467, 469, 471, 473, 475, 477, 479, 481, 483, 485, 487, 489, 491]}, 365: {'A': [366]}, 366: {'': [493]}, 367: {'B': [368]}, 368: {'': [493]}, 369: {'C': [370]}, 370: {'': [493]}, 371: {'D': [372]}, 372: {'': [493]}, 373: {'E': [374]}, 374: {'': [493]}, 375: {'F': [376]}, 376: {'': [493]}, 377: {'G': [378]}, 378: {'': [493]}, 379: {'H': [380]}, 380: {'': [493]}, 381: {'I': [382]}, 382: {'': [493]}, 383: {'J': [384]}, 384: {'': [493]}, 385: {'K': [386]}, 386: {'': [493]}, 387: {'L': [388]}, 388: {'': [493]}, 389: {'M': [390]}, 390: {'': [493]}, 391: {'N': [392]}, 392: {'': [493]}, 393: {'O': [394]}, 394: {'': [493]}, 395: {'P': [396]}, 396: {'': [493]}, 397: {'Q': [398]}, 398: {'': [493]}, 399: {'R': [400]}, 400: {'': [493]}, 401: {'S': [402]}, 402: {'': [493]}, 403: {'T': [404]}, 404: {'': [493]}, 405: {'U': [406]}, 406: {'': [493]}, 407: {'V': [408]}, 408: {'': [493]}, 409: {'W': [410]}, 410: {'': [493]}, 411: {'X': [412]}, 412: {'': [493]}, 413: {'Y': [414]}, 414: {'': [493]}, 415: {'Z': [416]}, 416: {'': [493]}, 417: {'-': [418]}, 418: {'': [493]}, 419: {'0': [420]}, 420: {'': [493]}, 421: {'1': [422]}, 422: {'': [493]}, 423: {'2': [424]}, 424: {'': [493]}, 425: {'3': [426]}, 426: {'': [493]}, 427: {'4': [428]}, 428: {'': [493]}, 429: {'5': [430]}, 430: {'': [493]}, 431: {'6': [432]}, 432: {'': [493]}, 433: {'7': [434]}, 434: {'': [493]}, 435: {'8': [436]}, 436: {'': [493]}, 437: {'9': [438]}, 438: {'': [493]}, 439: {'a': [440]}, 440: {'': [493]}, 441: {'b': [442]}, 442: {'': [493]}, 443: {'c': [444]}, 444: {'': [493]}, 445: {'d': [446]}, 446: {'': [493]}, 447: {'e': [448]}, 448: {'': [493]}, 449: {'f': [450]}, 450: {'': [493]}, 451: {'g': [452]}, 452: {'': [493]}, 453: {'h': [454]}, 454: {'': [493]}, 455: {'i': [456]}, 456: {'': [493]}, 457: {'j': [458]}, 458: {'': [493]}, 459: {'k': [460]}, 460: {'': [493]}, 461: {'l': [462]}, 462: {'': [493]}, 463: {'m': [464]}, 464: {'': [493]}, 465: {'n': [466]}, 466: {'': [493]}, 467: {'o': [468]}, 468: {'': [493]}, 469: {'p': [470]}, 470: {'': [493]}, 471: {'q': [472]}, 472: {'': [493]}, 473: {'r': [474]}, 474: {'': [493]}, 475: {'s': [476]}, 476: {'': [493]}, 477: {'t': [478]}, 478: {'': [493]}, 479: {'u': [480]}, 480: {'': [493]}, 481: {'v': [482]}, 482: {'': [493]}, 483: {'w': [484]}, 484: {'': [493]}, 485: {'x': [486]}, 486: {'': [493]}, 487: {'y': [488]}, 488: {'': [493]}, 489: {'z': [490]}, 490: {'': [493]}, 491: {'_': [492]}, 492: {'': [493]}, 493: {'': [364, 494]}, 494: {'': [495]}, 495: {'"': [496]}, 497: {'"': [498]}, 498: {'': [499]}, 499: {'"': [500]}, 501: {'%': [502]}, 502: {'': [503]}, 503: {'i': [504]}, 504: {'': [505]}, 505: {'m': [506]}, 506: {'': [507]}, 507: {'p': [508]}, 508: {'': [509]}, 509: {'o': [510]}, 510: {'': [511]}, 511: {'r': [512]}, 512: {'': [513]}, 513: {'t': [514]}, 515: {'': [516, 518, 520, 522, 524, 526, 528, 530, 532, 534, 536, 538, 540, 542, 544, 546, 548, 550, 552, 554, 556, 558, 560, 562, 564, 566, 568, 570, 572, 574, 576, 578, 580, 582, 584, 586, 588, 590, 592, 594, 596, 598, 600, 602, 604, 606, 608, 610, 612, 614, 616, 618, 620, 622, 624]}, 516: {'.': [517]}, 517: {'': [626]}, 518: {'a': [519]}, 519: {'': [626]}, 520: {'b': [521]}, 521: {'': [626]}, 522: {'c': [523]}, 523: {'': [626]}, 524: {'d': [525]}, 525: {'': [626]}, 526: {'e': [527]}, 527: {'': [626]}, 528: {'f': [529]}, 529: {'': [626]}, 530: {'g': [531]}, 531: {'': [626]}, 532: {'h': [533]}, 533: {'': [626]}, 534: {'i': [535]}, 535: {'': [626]}, 536: {'j': [537]}, 537: {'': [626]}, 538: {'k': [539]}, 539: {'': [626]}, 540: {'l': [541]}, 541: {'': [626]}, 542: {'m': [543]}, 543: {'': [626]}, 544: {'n': [545]}, 545: {'': [626]}, 546: {'o': [547]}, 547: {'': [626]}, 548: {'p': [549]}, 549: {'': [626]}, 550: {'q': [551]}, 551: {'': [626]}, 552: {'r': [553]}, 553: {'': [626]}, 554: {'s': [555]}, 555: {'': [626]}, 556: {'t': [557]}, 557: {'': [626]}, 558: {'u': [559]}, 559: {'': [626]}, 560: {'v': [561]}, 561: {'': [626]}, 562: {'w': [563]}, 563: {'': [626]}, 564: {'x': [565]}, 565: {'': [626]}, 566: {'y': [567]}, 567: {'': [626]}, 568: {'z': [569]}, 569: {'': [626]}, 570: {'A': [571]}, 571: {'': [626]}, 572: {'B': [573]}, 573: {'': [626]}, 574: {'C': [575]}, 575: {'': [626]}, 576: {'D': [577]}, 577: {'': [626]}, 578: {'E': [579]}, 579: {'': [626]}, 580: {'F': [581]}, 581: {'': [626]}, 582: {'G': [583]}, 583: {'': [626]}, 584: {'H': [585]}, 585: {'': [626]}, 586: {'I': [587]}, 587: {'': [626]}, 588: {'J': [589]}, 589: {'': [626]}, 590: {'K': [591]}, 591: {'': [626]}, 592: {'L': [593]}, 593: {'': [626]}, 594: {'M': [595]}, 595: {'': [626]}, 596: {'N': [597]}, 597: {'': [626]}, 598: {'O': [599]}, 599: {'': [626]}, 600: {'P': [601]}, 601: {'': [626]}, 602: {'Q': [603]}, 603: {'': [626]}, 604: {'R': [605]}, 605: {'': [626]}, 606: {'S': [607]}, 607: {'': [626]}, 608: {'T': [609]}, 609: {'': [626]}, 610: {'U': [611]}, 611: {'': [626]}, 612: {'V': [613]}, 613: {'': [626]}, 614: {'W': [615]}, 615: {'': [626]}, 616: {'X': [617]}, 617: {'': [626]}, 618: {'Y': [619]}, 619: {'': [626]}, 620: {'Z': [621]}, 621: {'': [626]}, 622: {'_': [623]}, 623: {'': [626]}, 624: {'/': [625]}, 625: {'': [626]}, 626: {'': [627]}, 627: {'': [628, 740]}, 628: {'': [629, 631, 633, 635, 637, 639, 641, 643, 645, 647, 649, 651, 653, 655, 657, 659, 661, 663, 665, 667, 669, 671, 673, 675, 677, 679, 681, 683, 685, 687, 689, 691, 693, 695, 697, 699, 701, 703, 705, 707, 709, 711, 713, 715, 717, 719, 721, 723, 725, 727, 729, 731, 733, 735, 737]}, 629: {'.': [630]}, 630: {'': [739]}, 631: {'a': [632]}, 632: {'': [739]}, 633: {'b': [634]}, 634: {'': [739]}, 635: {'c': [636]}, 636: {'': [739]}, 637: {'d': [638]}, 638: {'': [739]}, 639: {'e': [640]}, 640: {'': [739]}, 641: {'f': [642]}, 642: {'': [739]}, 643: {'g': [644]}, 644: {'': [739]}, 645: {'h': [646]}, 646: {'': [739]}, 647: {'i': [648]}, 648: {'': [739]}, 649: {'j': [650]}, 650: {'': [739]}, 651: {'k': [652]}, 652: {'': [739]}, 653: {'l': [654]}, 654: {'': [739]}, 655: {'m': [656]}, 656: {'': [739]}, 657: {'n': [658]}, 658: {'': [739]}, 659: {'o': [660]}, 660: {'': [739]}, 661: {'p': [662]}, 662: {'': [739]}, 663: {'q': [664]}, 664: {'': [739]}, 665: {'r': [666]}, 666: {'': [739]}, 667: {'s': [668]}, 668: {'': [739]}, 669: {'t': [670]}, 670: {'': [739]}, 671: {'u': [672]}, 672: {'': [739]}, 673: {'v': [674]}, 674: {'': [739]}, 675: {'w': [676]}, 676: {'': [739]}, 677: {'x': [678]}, 678: {'': [739]}, 679: {'y': [680]}, 680: {'': [739]}, 681: {'z': [682]}, 682: {'': [739]}, 683: {'A': [684]}, 684: {'': [739]}, 685: {'B': [686]}, 686: {'': [739]}, 687: {'C': [688]}, 688: {'': [739]}, 689: {'D': [690]}, 690: {'': [739]}, 691: {'E': [692]}, 692: {'': [739]}, 693: {'F': [694]}, 694: {'': [739]}, 695: {'G': [696]}, 696: {'': [739]}, 697: {'H': [698]}, 698: {'': [739]}, 699: {'I': [700]}, 700: {'': [739]}, 701: {'J': [702]}, 702: {'': [739]}, 703: {'K': [704]}, 704: {'': [739]}, 705: {'L': [706]}, 706: {'': [739]}, 707: {'M': [708]}, 708: {'': [739]}, 709: {'N': [710]}, 710: {'': [739]}, 711: {'O': [712]}, 712: {'': [739]}, 713: {'P': [714]}, 714: {'': [739]}, 715: {'Q': [716]}, 716: {'': [739]}, 717: {'R': [718]}, 718: {'': [739]}, 719: {'S': [720]}, 720: {'': [739]}, 721: {'T': [722]}, 722: {'': [739]}, 723: {'U': [724]}, 724: {'': [739]}, 725: {'V': [726]}, 726: {'': [739]}, 727: {'W': [728]}, 728: {'': [739]}, 729: {'X': [730]}, 730: {'': [739]}, 731: {'Y': [732]}, 732: {'': [739]}, 733: {'Z': [734]}, 734: {'': [739]}, 735: {'_': [736]}, 736: {'': [739]}, 737: {'/': [738]}, 738: {'': [739]}, 739: {'': [628, 740]}, 741: {'{': [742]}, 742: {'': [743]}, 743: {'': [744, 746, 748, 750, 752, 754, 756, 758, 760, 762, 764, 766, 768, 770, 772, 774, 776, 778, 780, 782, 784, 786, 788, 790, 792, 794, 796, 798, 800, 802, 804, 806, 808, 810, 812, 814, 816, 818, 820, 822, 824, 826, 828, 830, 832, 834, 836, 838, 840, 842, 844, 846, 848]}, 744: {'a': [745]}, 745: {'': [850]}, 746: {'b': [747]}, 747: {'': [850]}, 748: {'c': [749]}, 749: {'': [850]}, 750: {'d': [751]}, 751: {'': [850]}, 752: {'e': [753]}, 753: {'': [850]}, 754: {'f': [755]}, 755: {'': [850]}, 756: {'g': [757]}, 757: {'': [850]}, 758: {'h': [759]}, 759: {'': [850]}, 760: {'i': [761]}, 761: {'': [850]}, 762: {'j': [763]}, 763: {'': [850]}, 764: {'k': [765]}, 765: {'': [850]}, 766: {'l': [767]}, 767: {'': [850]}, 768: {'m': [769]}, 769: {'': [850]}, 770: {'n': [771]}, 771: {'': [850]}, 772: {'o': [773]}, 773: {'': [850]}, 774: {'p': [775]}, 775: {'': [850]}, 776: {'q': [777]}, 777: {'': [850]}, 778: {'r': [779]}, 779: {'': [850]}, 780: {'s': [781]}, 781: {'': [850]}, 782: {'t': [783]}, 783: {'': [850]}, 784: {'u': [785]}, 785: {'': [850]}, 786: {'v': [787]}, 787: {'': [850]}, 788: {'w': [789]}, 789: {'': [850]}, 790: {'x': [791]}, 791: {'': [850]}, 792: {'y': [793]}, 793: {'': [850]}, 794: {'z': [795]}, 795: {'': [850]}, 796: {'A': [797]}, 797: {'': [850]}, 798: {'B': [799]}, 799: {'': [850]}, 800: {'C': [801]}, 801: {'': [850]}, 802: {'D': [803]}, 803: {'': [850]}, 804: {'E': [805]}, 805: {'': [850]}, 806: {'F': [807]}, 807: {'': [850]}, 808: {'G': [809]}, 809: {'': [850]}, 810: {'H': [811]}, 811: {'': [850]}, 812: {'I': [813]}, 813: {'': [850]}, 814: {'J': [815]}, 815: {'': [850]}, 816: {'K': [817]}, 817: {'': [850]}, 818: {'L': [819]}, 819: {'': [850]}, 820: {'M': [821]}, 821: {'': [850]}, 822: {'N': [823]}, 823: {'': [850]}, 824: {'O': [825]}, 825: {'': [850]}, 826: {'P': [827]}, 827: {'': [850]}, 828: {'Q': [829]}, 829: {'': [850]}, 830: {'R': [831]}, 831: {'': [850]}, 832: {'S': [833]}, 833: {'': [850]}, 834: {'T': [835]}, 835: {'': [850]}, 836: {'U': [837]}, 837: {'': [850]}, 838: {'V': [839]}, 839: {'': [850]}, 840: {'W': [841]}, 841: {'': [850]}, 842: {'X': [843]}, 843: {'': [850]}, 844: {'Y': [845]}, 845: {'': [850]}, 846: {'Z': [847]}, 847: {'': [850]}, 848: {'_': [849]}, 849: {'': [850]}, 850: {'': [851]}, 851: {'': [852, 980]}, 852: {'': [853, 855, 857, 859, 861, 863, 865, 867, 869, 871, 873, 875, 877, 879, 881, 883, 885, 887, 889, 891, 893, 895, 897, 899, 901, 903, 905, 907, 909, 911, 913, 915, 917, 919, 921, 923, 925, 927, 929, 931, 933, 935, 937, 939, 941, 943, 945, 947, 949, 951, 953, 955, 957, 959, 961, 963, 965, 967, 969, 971, 973, 975, 977]}, 853: {'a': [854]}, 854: {'': [979]}, 855: {'b': [856]}, 856: {'': [979]}, 857: {'c': [858]}, 858: {'': [979]}, 859: {'d': [860]}, 860: {'': [979]}, 861: {'e': [862]}, 862: {'': [979]}, 863: {'f': [864]}, 864: {'': [979]}, 865: {'g': [866]}, 866: {'': [979]}, 867: {'h': [868]}, 868: {'': [979]}, 869: {'i': [870]}, 870: {'': [979]}, 871: {'j': [872]}, 872: {'': [979]}, 873: {'k': [874]}, 874: {'': [979]}, 875: {'l': [876]}, 876: {'': [979]}, 877: {'m': [878]}, 878: {'': [979]}, 879: {'n': [880]}, 880: {'': [979]}, 881: {'o': [882]}, 882: {'': [979]}, 883: {'p': [884]}, 884: {'': [979]}, 885: {'q': [886]}, 886: {'': [979]}, 887: {'r': [888]}, 888: {'': [979]}, 889: {'s': [890]}, 890: {'': [979]}, 891: {'t': [892]}, 892: {'': [979]}, 893: {'u': [894]}, 894: {'': [979]}, 895: {'v': [896]}, 896: {'': [979]}, 897: {'w': [898]}, 898: {'': [979]}, 899: {'x': [900]}, 900: {'': [979]}, 901: {'y': [902]}, 902: {'': [979]}, 903: {'z': [904]}, 904: {'': [979]}, 905: {'A': [906]}, 906: {'': [979]}, 907: {'B': [908]}, 908: {'': [979]}, 909: {'C': [910]}, 910: {'': [979]}, 911: {'D': [912]}, 912: {'': [979]}, 913: {'E': [914]}, 914: {'': [979]}, 915: {'F': [916]}, 916: {'': [979]}, 917: {'G': [918]}, 918: {'': [979]}, 919: {'H': [920]}, 920: {'': [979]}, 921: {'I': [922]}, 922: {'': [979]}, 923: {'J': [924]}, 924: {'': [979]}, 925: {'K': [926]}, 926: {'': [979]}, 927: {'L': [928]}, 928: {'': [979]}, 929: {'M': [930]}, 930: {'': [979]}, 931: {'N': [932]}, 932: {'': [979]}, 933: {'O': [934]}, 934: {'': [979]}, 935: {'P': [936]}, 936: {'': [979]}, 937: {'Q': [938]}, 938: {'': [979]}, 939: {'R': [940]}, 940: {'': [979]}, 941: {'S': [942]}, 942: {'': [979]}, 943: {'T': [944]}, 944: {'': [979]}, 945: {'U': [946]}, 946: {'': [979]}, 947: {'V': [948]}, 948: {'': [979]}, 949: {'W': [950]}, 950: {'': [979]}, 951: {'X': [952]}, 952: {'': [979]}, 953: {'Y': [954]}, 954: {'': [979]}, 955: {'Z': [956]}, 956: {'': [979]}, 957: {'0': [958]}, 958: {'': [979]}, 959: {'1': [960]}, 960: {'': [979]}, 961: {'2': [962]}, 962: {'': [979]}, 963: {'3': [964]}, 964: {'': [979]}, 965: {'4': [966]}, 966: {'': [979]}, 967: {'5': [968]}, 968: {'': [979]}, 969: {'6': [970]}, 970: {'': [979]}, 971: {'7': [972]}, 972: {'': [979]}, 973: {'8': [974]}, 974: {'': [979]}, 975: {'9': [976]}, 976: {'': [979]}, 977: {'_': [978]}, 978: {'': [979]}, 979: {'': [852, 980]}, 980: {'': [981]}, 981: {'}': [982]}}
+        self.final_states= {514: 'IMPORT_COMMAND', 740: 'IMPORT_ARGUMENT', 496: 'RULE_TERMINAL', 244: 'RULE_NAME', 982: 'ACTION', 500: 'EMPTY', 250: 'RULE_DEFINITION', 252: 'OR'}
 
         self.reset()
 
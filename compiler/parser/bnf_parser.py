@@ -2,9 +2,9 @@
 Simple parser and structure containing the grammar defined in BNF
 """
 
-from bnf_lexer import Lexer
-import re
+from digraph import digraph
 import os
+import re
 
 class UnexpectedBNFToken(Exception):
     def __init__(self, msg):
@@ -14,7 +14,33 @@ class UnexpectedBNFToken(Exception):
         return 'Unexpected token: ' + self.msg
 
 
+# Symbol ids reserved in every grammar: the empty string and the end marker.
+# Real terminals follow them, and variables come after all the terminals.
+EMPTY = 0
+END = 1
+EMPTY_BIT = 1 << EMPTY
+
+
+def iter_bits(bits):
+    """Yields the index of every bit set in an int bitset, lowest first"""
+    while bits:
+        lowest = bits & -bits
+        yield lowest.bit_length() - 1
+        bits ^= lowest
+
+
 class Grammar(object):
+    """
+    Besides the Production objects, the grammar keeps an interned version
+    of itself: every symbol has a dense int id (see symbol_names), each
+    production is a tuple of ids in prod_rhs, and FIRST/FOLLOW sets are
+    int bitsets over terminal ids. Bit EMPTY in a FIRST set means that the
+    symbol (or string) is nullable.
+
+    FIRST and FOLLOW are only computed when first needed, so a grammar can
+    be transformed or reduced without paying for its analysis.
+    """
+
     def __init__(self, variables, terminals, start, prods):
         self.variables = variables
         self.variables.add('#')
@@ -25,11 +51,76 @@ class Grammar(object):
         self.prods_per_var = {}
         self.cached_firsts = {}
         self.cached_follows = {}
-        for p in self.productions:
-            if p.variable.name not in self.prods_per_var.keys():
+        self.cached_suffix_firsts = {}
+        for id_, p in enumerate(self.productions):
+            p.id_ = id_
+            if p.variable.name not in self.prods_per_var:
                 self.prods_per_var[p.variable.name] = []
             self.prods_per_var[p.variable.name].append(p)
-        self._build_follow()
+            for sym in p.production:
+                if isinstance(sym, Terminal):
+                    self.terminals.add(sym.name)
+                elif isinstance(sym, Variable):
+                    self.variables.add(sym.name)
+        # variables that only appear on the left side are variables too
+        self.variables.update(self.prods_per_var.keys())
+        self._intern()
+        self._first_bits = None
+        self._follow_bits = None
+        self._predictions = None
+
+    @property
+    def first_bits(self):
+        """FIRST bitset of every symbol id, computed on first use"""
+        if self._first_bits is None:
+            self._build_first()
+        return self._first_bits
+
+    @property
+    def follow_bits(self):
+        """FOLLOW bitset of every symbol id (0 for terminals)"""
+        if self._follow_bits is None:
+            self._build_follow()
+        return self._follow_bits
+
+    @property
+    def predictions(self):
+        """
+        Start items predicted by every symbol id: the frozenset of the
+        items B -> . y of every B that the variable derives leftmost (itself
+        included), empty for terminals. Computed on first use.
+        """
+        if self._predictions is None:
+            self._build_predictions()
+        return self._predictions
+
+    def _intern(self):
+        self.symbol_names = ['', '$'] + sorted(self.terminals)
+        self.n_terminals = len(self.symbol_names)
+        self.symbol_names.extend(sorted(self.variables))
+        self.terminal_ids = {}
+        self.variable_ids = {}
+        for id_, name in enumerate(self.symbol_names):
+            if id_ < self.n_terminals:
+                self.terminal_ids[name] = id_
+            else:
+                self.variable_ids[name] = id_
+        self.prod_lhs = []
+        self.prod_rhs = []
+        self.prods_of = [[] for name in self.symbol_names]
+        for prod in self.productions:
+            lhs = self.variable_ids[prod.variable.name]
+            self.prod_lhs.append(lhs)
+            self.prod_rhs.append(tuple(
+                self.symbol_id(sym) for sym in prod.production if sym != ''
+            ))
+            self.prods_of[lhs].append(prod.id_)
+
+    def symbol_id(self, symbol):
+        """Id of a Terminal or Variable object"""
+        if isinstance(symbol, Terminal):
+            return self.terminal_ids[symbol.name]
+        return self.variable_ids[symbol.name]
 
     def is_terminal(self, symbol):
         return symbol in self.terminals
@@ -37,87 +128,188 @@ class Grammar(object):
     def is_variable(self, symbol):
         return symbol in self.variables
 
+    def is_nullable(self, symbol):
+        id_ = self.variable_ids.get(symbol)
+        return id_ is not None and self.first_bits[id_] & EMPTY_BIT != 0
+
     def get_productions_for_variable(self, var):
         return self.prods_per_var.get(var, [])
 
-    def _get_first(self, symbol):
-        if self.is_terminal(symbol):
-            return set([symbol])
-        firsts = set()
-        prods = self.get_productions_for_variable(symbol)
-        for prod in prods:
-            if len(prod.production) == 1 and prod.production[0] == '':
-                # empty production
-                firsts.add('')
-            else:
-                for prod_symbol in prod.production:
-                    if prod_symbol.name == symbol:
-                        continue
-                    current_first = self.first(prod_symbol.name)
-                    firsts.update(current_first)
-                    if '' not in current_first:
+    def terminal_set(self, bits):
+        """Converts a bitset of terminal ids into a set of names"""
+        return set(self.symbol_names[id_] for id_ in iter_bits(bits))
+
+    def _build_first(self):
+        """
+        Computes FIRST and nullable for every variable in one fixed-point
+        pass. A variable is only revisited when the FIRST set of a symbol
+        in one of its productions changed, so indirect left recursion
+        converges instead of recursing.
+        """
+        n_terminals = self.n_terminals
+        first = [0] * len(self.symbol_names)
+        for id_ in xrange(END, n_terminals):
+            first[id_] = 1 << id_
+        dependents = [set() for name in self.symbol_names]
+        for prod_id, rhs in enumerate(self.prod_rhs):
+            for sym in rhs:
+                if sym >= n_terminals:
+                    dependents[sym].add(self.prod_lhs[prod_id])
+
+        worklist = [var for var in xrange(n_terminals, len(first))
+                    if len(self.prods_of[var]) > 0]
+        queued = set(worklist)
+        not_empty = ~EMPTY_BIT
+        while len(worklist) > 0:
+            var = worklist.pop()
+            queued.discard(var)
+            bits = first[var]
+            for prod_id in self.prods_of[var]:
+                for sym in self.prod_rhs[prod_id]:
+                    sym_first = first[sym]
+                    bits |= sym_first & not_empty
+                    if not sym_first & EMPTY_BIT:
                         break
-        return firsts
+                else:
+                    bits |= EMPTY_BIT
+            if bits != first[var]:
+                first[var] = bits
+                for dependent in dependents[var]:
+                    if dependent not in queued:
+                        queued.add(dependent)
+                        worklist.append(dependent)
+        self._first_bits = first
 
     def _build_follow(self):
-        if len(self.cached_follows) == 0:
-            for var in self.variables:
-                self.cached_follows[var] = set()
-            self.cached_follows['#'].add('$')
-
-        pending = {var: set() for var in self.variables}
-        for prod in self.productions:
-            for i, sym in enumerate(prod.production):
-                if sym == '' or self.is_terminal(sym.name):
+        """
+        FOLLOW(B) starts with FIRST of whatever comes after B in every
+        production, and includes FOLLOW(A) whenever A -> xBy with y
+        nullable. The inclusions are solved with the digraph algorithm, so
+        every set is propagated once per strongly connected component.
+        """
+        n_terminals = self.n_terminals
+        variables = range(n_terminals, len(self.symbol_names))
+        initial = dict((var, 0) for var in variables)
+        initial[self.variable_ids['#']] = 1 << END
+        includes = dict((var, set()) for var in variables)
+        for prod_id, rhs in enumerate(self.prod_rhs):
+            lhs = self.prod_lhs[prod_id]
+            suffixes = self.suffix_first_bits(prod_id)
+            for i, sym in enumerate(rhs):
+                if sym < n_terminals:
                     continue
-                if i < len(prod.production) - 1:
-                    current_first = ['']
-                    with_empty = False
-                    while '' in current_first and i < len(prod.production) - 1:
-                        current_first = self.first(prod.production[i + 1].name)
-                        with_empty = '' in current_first
-                        self.cached_follows[sym.name].update(
-                            current_first.difference(set(['']))
-                        )
-                        i += 1
-                    if i == len(prod.production) - 1 and \
-                       prod.variable.name != sym.name and \
-                       with_empty:
-                        pending[prod.variable.name].add(sym.name)
-                elif sym.name != prod.variable.name:
-                    pending[prod.variable.name].add(sym.name)
-
-        for var, pend in pending.iteritems():
-            self._update_follow(pending, var)
-
-    def _update_follow(self, pending, symbol):
-            current_follow = self.cached_follows[symbol]
-            for var in pending[symbol]:
-                if var == symbol:
-                    continue
-                len_previous = len(self.cached_follows[var])
-                self.cached_follows[var].update(current_follow)
-                if len(self.cached_follows[var]) > len_previous:
-                    self._update_follow(pending, var)
-
+                rest = suffixes[i + 1]
+                initial[sym] |= rest & ~EMPTY_BIT
+                if rest & EMPTY_BIT and sym != lhs:
+                    includes[sym].add(lhs)
+        follows = digraph(variables, includes, initial)
+        self._follow_bits = [follows.get(id_, 0)
+                             for id_ in xrange(len(self.symbol_names))]
+
+    def _build_predictions(self):
+        """
+        A predicts its own productions and everything predicted by the
+        variables its productions start with; the relation is solved with
+        the digraph algorithm over bitsets of production ids, so each
+        strongly connected component is closed once.
+        """
+        n_terminals = self.n_terminals
+        variables = range(n_terminals, len(self.symbol_names))
+        initial = {}
+        starts = {}
+        for var in variables:
+            bits = 0
+            starts[var] = set()
+            for prod_id in self.prods_of[var]:
+                bits |= 1 << prod_id
+                rhs = self.prod_rhs[prod_id]
+                if len(rhs) > 0 and rhs[0] >= n_terminals:
+                    starts[var].add(rhs[0])
+            initial[var] = bits
+        predicted = digraph(variables, starts, initial)
+        self._predictions = [frozenset()] * n_terminals
+        items = {}
+        for var in variables:
+            bits = predicted[var]
+            # variables in the same cycle share their set
+            if bits not in items:
+                items[bits] = frozenset(
+                    self.productions[prod_id].item(0)
+                    for prod_id in iter_bits(bits)
+                )
+            self._predictions.append(items[bits])
 
     def first(self, symbol):
+        if self.is_terminal(symbol):
+            return set([symbol])
         first = self.cached_firsts.get(symbol)
         if first is None:
-            first = self._get_first(symbol)
+            id_ = self.variable_ids.get(symbol)
+            first = set() if id_ is None else \
+                self.terminal_set(self.first_bits[id_])
             self.cached_firsts[symbol] = first
         return first
 
+    def first_bits_of_string(self, symbol_ids):
+        bits = 0
+        for sym in symbol_ids:
+            sym_first = self.first_bits[sym]
+            bits |= sym_first & ~EMPTY_BIT
+            if not sym_first & EMPTY_BIT:
+                return bits
+        return bits | EMPTY_BIT
+
+    def first_of_string(self, symbols):
+        """FIRST of a sequence of production symbols ('' means empty)"""
+        return self.terminal_set(self.first_bits_of_string(
+            self.symbol_id(sym) for sym in symbols if sym != ''
+        ))
+
+    def suffix_first_bits(self, prod_id):
+        """
+        FIRST bitsets of every suffix of a production: element i is FIRST
+        of prod_rhs[prod_id][i:]. They are computed together (right to
+        left) the first time the production is asked for.
+        """
+        suffixes = self.cached_suffix_firsts.get(prod_id)
+        if suffixes is None:
+            rhs = self.prod_rhs[prod_id]
+            suffixes = [EMPTY_BIT] * (len(rhs) + 1)
+            for i in xrange(len(rhs) - 1, -1, -1):
+                sym_first = self.first_bits[rhs[i]]
+                if sym_first & EMPTY_BIT:
+                    suffixes[i] = (sym_first & ~EMPTY_BIT) | suffixes[i + 1]
+                else:
+                    suffixes[i] = sym_first
+            self.cached_suffix_firsts[prod_id] = suffixes
+        return suffixes
+
+    def first_of_suffix(self, production, position):
+        """FIRST of production.production[position:]"""
+        suffixes = self.suffix_first_bits(production.id_)
+        return self.terminal_set(suffixes[min(position, len(suffixes) - 1)])
+
     def follow(self, symbol):
         if self.is_terminal(symbol):
             raise ValueError('Follow only defined for variables')
-        return self.cached_follows[symbol]
+        follow = self.cached_follows.get(symbol)
+        if follow is None:
+            follow = self.terminal_set(
+                self.follow_bits[self.variable_ids[symbol]]
+            )
+            self.cached_follows[symbol] = follow
+        return follow
 
 
 class Production(object):
-    def __init__(self, variable, production):
+    def __init__(self, variable, production, action=None):
         self.variable = variable
         self.production = production
+        # name of the semantic action of the alternative (see actions.py)
+        self.action = action
+        # the symbols without the empty string
+        self.body = tuple(sym for sym in production if sym != '')
+        self._items = None
 
     def _get_prod_string(self):
         buff = ''
@@ -136,80 +328,124 @@ class Production(object):
     def __repr__(self):
         return str(self)
 
+    def item(self, dot):
+        """The (interned) item of this production with the dot at dot"""
+        if self._items is None:
+            self._items = [Item(self, i) for i in xrange(len(self.body) + 1)]
+        return self._items[dot]
+
     def generate_all_items(self):
-        for i in xrange(len(self.production)):
-            yield Item(self, i)
+        for i in xrange(len(self.body) + 1):
+            yield self.item(i)
 
 
 class Item(object):
+    """
+    An LR(0) item: the production with id prod_id with the dot before its
+    symbol number dot (the empty string takes no place). Hashing, equality
+    and advance only look at those two ints, and the items of a production
+    are interned (see Production.item), so advance creates nothing.
+    """
+    __slots__ = ('production', 'prod_id', 'dot', '_hash')
+
     def __init__(self, production, position):
-        self.variable = production.variable
-        self._original_prod = production
-        self.production = production.production[:position]
-        self.production.append('.')
-        self.production.extend(production.production[position:])
+        self.production = production
+        self.prod_id = production.id_
+        self.dot = position
+        self._hash = hash((self.prod_id, position))
+
+    @property
+    def variable(self):
+        return self.production.variable
+
+    def is_complete(self):
+        return self.dot == len(self.production.body)
+
+    def next_symbol(self):
+        """The symbol after the dot, None if the item is complete"""
+        body = self.production.body
+        if self.dot == len(body):
+            return None
+        return body[self.dot]
 
     def advance(self):
-        pos = self.production.index('.')
-        if pos == len(self.production) - 1:
+        if self.dot == len(self.production.body):
             return self
-        return Item(self._original_prod, pos + 1)
+        return self.production.item(self.dot + 1)
 
     def __hash__(self):
-        return hash((
-            self.variable,
-            str(self._original_prod),
-            self.production.index('.')
-        ))
+        return self._hash
+
+    def __eq__(self, other):
+        return self is other or (
+            isinstance(other, Item) and
+            other.prod_id == self.prod_id and
+            other.dot == self.dot
+        )
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __getstate__(self):
+        return (self.production, self.prod_id, self.dot)
+
+    def __setstate__(self, state):
+        # the production may not be restored yet, so its id is not read
+        self.production, self.prod_id, self.dot = state
+        self._hash = hash((self.prod_id, self.dot))
 
     def _get_prod_string(self):
         buff = ''
-        for sym in self.production:
-            if sym == '':
-                buff += '(empty)'
-            if sym == '.':
+        for i, sym in enumerate(self.production.body):
+            if i == self.dot:
                 buff += ' . '
-            elif isinstance(sym, Terminal):
+            if isinstance(sym, Terminal):
                 buff += '"' + sym.name + '"'
             else:
                 buff += '<' + sym.name + '>'
+        if self.is_complete():
+            buff += ' . '
         return buff
 
-
     def __str__(self):
         return self.variable.name + ' -> ' + self._get_prod_string()
 
     def __repr__(self):
         return str(self)
 
-    def __eq__(self, other):
-        if not isinstance(other, Item):
-            return False
-        if other.variable != self.variable:
-            return False
-        if len(other.production) != len(self.production):
-            return False
-        for p, q in zip(other.production, self.production):
-            if p != q:
-                return False
-        return True
-
 
 class Variable(object):
+    __slots__ = ('name',)
+
     def __init__(self, name):
-        self.name = re.sub('<|>', '', name)
+        self.name = name.strip('<>')
 
     def __eq__(self, other):
         return isinstance(other, Variable) and other.name == self.name
 
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return hash(self.name)
+
 
 class Terminal(object):
+    __slots__ = ('name',)
+
     def __init__(self, name):
-        self.name = re.sub('"', '', name)
+        self.name = name.strip('"')
 
     def __eq__(self, other):
         return isinstance(other, Terminal) and other.name == self.name
 
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        # different from a Variable with the same name
+        return hash(('"', self.name))
+
 
 class ImportCommand(object):
     
@@ -217,85 +453,129 @@ class ImportCommand(object):
         self.filename = os.path.normpath(os.path.join(cwd, filename))
 
 
-def build_grammar_and_commands(code, cwd):
-    lines = [line.strip() for line in code.strip().split('\n')
-             if line.strip()[0] != '#' and len(line.strip()) > 0]
+def build_grammar_and_commands(code, cwd='.'):
+    rules, commands = parse_bnf(code, cwd)
+    if len(rules) == 0:
+        raise UnexpectedBNFToken('End of data')
+    # first defined rule is start symbol
+    start_symbol = rules[0].variable
+    return (Grammar(set(), set(), start_symbol, rules), commands)
+
+
+# Same tokens as bnf.lex, plus comments and whitespace which are skipped.
+_TOKEN_RE = re.compile(r'''
+    (?P<RULE_NAME><[a-zA-Z_][A-Z\-0-9a-z_]*>)
+  | (?P<RULE_DEFINITION>::=)
+  | (?P<OR>\|)
+  | (?P<EMPTY>"")
+  | (?P<RULE_TERMINAL>"[a-zA-Z_][A-Z\-0-9a-z_]*")
+  | (?P<ACTION>\{[a-zA-Z_][a-zA-Z0-9_]*\})
+  | (?P<IMPORT_COMMAND>%import)
+  | (?P<IMPORT_ARGUMENT>[.a-zA-Z_/][.a-zA-Z_/]*)
+  | (?P<COMMENT>\#[^\n]*)
+  | (?P<SPACE>\s+)
+''', re.VERBOSE)
+
+_SKIPPED_TOKENS = frozenset(['COMMENT', 'SPACE'])
+
+
+def _tokenize(code):
+    match = _TOKEN_RE.match
+    pos = 0
+    end = len(code)
+    while pos < end:
+        m = match(code, pos)
+        if m is None:
+            numline = code.count('\n', 0, pos) + 1
+            raise UnexpectedBNFToken(
+                repr(code[pos]) + ' in line ' + str(numline)
+            )
+        type_ = m.lastgroup
+        pos = m.end()
+        if type_ not in _SKIPPED_TOKENS:
+            yield type_, m.group()
+
+
+def parse_bnf(code, cwd='.'):
+    """
+    Reads a whole BNF file in a single pass over its tokens and returns the
+    list of productions and the list of commands (imports) in it.
+
+    A rule ends where the next one begins, which is known once a rule name
+    is followed by '::='. Until then the rule name is held in
+    pending_name, so every token is looked at once. An alternative can end
+    with the name of its semantic action in braces ({name}), which is kept
+    in Production.action.
+    """
     rules = []
-    terminals = set()
-    variables = set()
-    start_symbol = None
     commands = []
-    for line in lines:
-        lexer = Lexer(line)
-        for prod in _parse_line(lexer, cwd):
-            if isinstance(prod, ImportCommand):
-                commands.append(prod)
+    symbols = {}
+    variable = None
+    alternative = None
+    pending_name = None
+    tokens = _tokenize(code)
+    for type_, lexeme in tokens:
+        if pending_name is not None:
+            if type_ == 'RULE_DEFINITION':
+                _end_alternative(rules, variable, alternative)
+                variable = _get_symbol(symbols, pending_name, Variable)
+                alternative = []
+                pending_name = None
                 continue
-            rules.append(prod)
-            if start_symbol is None:
-                # first defined rule is start symbol
-                start_symbol = prod.variable
-            for symbol in prod.production:
-                if isinstance(symbol, Variable):
-                    variables.add(symbol.name)
-                elif isinstance(symbol, Terminal):
-                    terminals.add(symbol.name)
-    return (Grammar(variables, terminals, start_symbol, rules), commands)
-
-def _match(lexer, token_types, allow_empty=False):
-    if not isinstance(token_types, list):
-        token_types = [token_types]
-    token = lexer.get_next_token()
-    if token is None:
-        if allow_empty:
-            return None
+            _add_symbol(alternative, symbols, pending_name, Variable)
+            pending_name = None
+
+        if type_ == 'RULE_NAME':
+            pending_name = lexeme
+        elif type_ == 'RULE_TERMINAL':
+            _add_symbol(alternative, symbols, lexeme, Terminal)
+        elif type_ == 'EMPTY':
+            if alternative is None or len(alternative) > 0:
+                raise UnexpectedBNFToken(type_)
+            alternative.append('')
+        elif type_ == 'ACTION':
+            if alternative is None or len(alternative) == 0:
+                raise UnexpectedBNFToken(type_)
+            # the action closes the alternative
+            _end_alternative(rules, variable, alternative, lexeme[1:-1])
+            alternative = None
+        elif type_ == 'OR' and variable is not None:
+            _end_alternative(rules, variable, alternative)
+            alternative = []
+        elif type_ == 'IMPORT_COMMAND':
+            _end_alternative(rules, variable, alternative)
+            variable = alternative = None
+            type_, lexeme = next(tokens, ('End of data', None))
+            if type_ != 'IMPORT_ARGUMENT':
+                raise UnexpectedBNFToken(type_)
+            commands.append(ImportCommand(lexeme, cwd))
         else:
-            raise UnexpectedBNFToken('End of data')
-    if token.type_ not in token_types:
-        if allow_empty:
-            return None
-        raise UnexpectedBNFToken(token.type_)
-    return token
-
-def _parse_line(lexer, cwd):
-    token = _match(lexer, ['RULE_NAME', 'IMPORT_COMMAND']) 
-    if token.type_ == 'IMPORT_COMMAND':
-        token = _match(lexer, 'IMPORT_ARGUMENT')
-        return [ImportCommand(token.lexeme, cwd)]
-    # not a command, continue with regular BNF
-    rule_name = Variable(token.lexeme)
-    _match(lexer, 'RULE_DEFINITION')
-    productions = _parse_productions(lexer)
-    for prod in productions:
-        yield Production(rule_name, prod)
-
-def _parse_productions(lexer):
-    rules = []
-    prod = _parse_production(lexer)
-    if prod is None:
-        raise UnexpectedBNFToken('Empty rule')
+            raise UnexpectedBNFToken(type_)
 
-    while prod is not None:
-        rules.append(prod)
-        prod = _parse_production(lexer)
-
-    return rules
-
-def _parse_production(lexer):
-    token = _match(lexer, ['EMPTY', 'RULE_NAME', 'RULE_TERMINAL'], True)
-    if token is None:
-        return None
-    if token.type_ == 'EMPTY':
-        _match(lexer, 'OR', True)
-        return ['']
-    prod = []
-    while token is not None:
-        if token.type_ == 'RULE_NAME':
-            prod.append(Variable(token.lexeme))
-        else:
-            prod.append(Terminal(token.lexeme))
-        token = _match(lexer, ['RULE_NAME', 'RULE_TERMINAL', 'OR'], True)
-        if token is not None and token.type_ == 'OR':
-            token = None
-    return prod
- 
+    if pending_name is not None:
+        _add_symbol(alternative, symbols, pending_name, Variable)
+    _end_alternative(rules, variable, alternative)
+    return rules, commands
+
+
+def _get_symbol(symbols, lexeme, symbol_class):
+    # the lexeme keeps its <> or "" so variables and terminals never clash
+    symbol = symbols.get(lexeme)
+    if symbol is None:
+        symbol = symbols[lexeme] = symbol_class(lexeme)
+    return symbol
+
+
+def _add_symbol(alternative, symbols, lexeme, symbol_class):
+    if alternative is None or alternative == ['']:
+        raise UnexpectedBNFToken(lexeme)
+    alternative.append(_get_symbol(symbols, lexeme, symbol_class))
+
+
+def _end_alternative(rules, variable, alternative, action=None):
+    # alternative is None once an action has closed it
+    if variable is None or alternative is None:
+        return
+    if len(alternative) == 0:
+        raise UnexpectedBNFToken('Empty rule')
+    rules.append(Production(variable, alternative, action))
@@ -0,0 +1,138 @@
+"""
+Persistent cache of analyzed grammars and the tables generated from them.
+
+An entry is keyed by a hash of the grammar's source and of the generator
+itself (the sources of this package), so changing either one invalidates it.
+The entry also records the hash of every file the grammar imports, and it is
+only used while all of them still match. Entries are pickled with the FIRST
+and FOLLOW sets and the predictions of the grammar, so loading one only
+costs reading the file back.
+
+    cache = GrammarCache()
+    cached = cache.load('lang.bnf')
+    table = cached.table('predictive', predictive.build_parser_table)
+"""
+
+from imports import load_grammar
+import cPickle as pickle
+import glob
+import hashlib
+import os
+import tempfile
+
+# bump when the layout of the entries changes
+CACHE_FORMAT = 2
+
+
+def _get_generator_version():
+    digest = hashlib.sha1(str(CACHE_FORMAT))
+    package = os.path.dirname(os.path.abspath(__file__))
+    for filename in sorted(glob.glob(os.path.join(package, '*.py'))):
+        with open(filename) as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+GENERATOR_VERSION = _get_generator_version()
+
+
+def default_cache_dir():
+    return os.environ.get(
+        'COMPLETE_PARSER_CACHE',
+        os.path.join(os.path.expanduser('~'), '.cache', 'complete-parser')
+    )
+
+
+def _file_digest(filename):
+    with open(filename) as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+
+class CachedGrammar(object):
+    def __init__(self, cache, path, grammar, dependencies, tables):
+        self._cache = cache
+        self._path = path
+        self.grammar = grammar
+        # [(filename, digest)] of every imported file
+        self.dependencies = dependencies
+        self.tables = tables
+
+    def table(self, name, builder):
+        """
+        Returns the table stored as name, building it with
+        builder(grammar) and saving it the first time.
+        """
+        table = self.tables.get(name)
+        if table is None:
+            table = self.tables[name] = builder(self.grammar)
+            self.save()
+        return table
+
+    def save(self):
+        self._cache.write(self._path, {
+            'version': GENERATOR_VERSION,
+            'grammar': self.grammar,
+            'dependencies': self.dependencies,
+            'tables': self.tables,
+        })
+
+
+class GrammarCache(object):
+    def __init__(self, cache_dir=None):
+        self.cache_dir = cache_dir or default_cache_dir()
+
+    def _entry_path(self, filename):
+        digest = hashlib.sha1(GENERATOR_VERSION)
+        digest.update(os.path.abspath(filename))
+        digest.update(_file_digest(filename))
+        return os.path.join(self.cache_dir, digest.hexdigest() + '.pickle')
+
+    def load(self, filename, processes=None):
+        path = self._entry_path(filename)
+        entry = self.read(path)
+        if entry is not None:
+            return CachedGrammar(
+                self,
+                path,
+                entry['grammar'],
+                entry['dependencies'],
+                entry['tables']
+            )
+        grammar, resolved = load_grammar(filename, processes)
+        # the analysis is lazy, it is run now so the entry saves it
+        grammar.first_bits
+        grammar.follow_bits
+        grammar.predictions
+        dependencies = [(m.filename, m.digest) for m in resolved.modules[1:]]
+        cached = CachedGrammar(self, path, grammar, dependencies, {})
+        cached.save()
+        return cached
+
+    def read(self, path):
+        """The entry stored in path, or None if it is missing or stale"""
+        try:
+            with open(path, 'rb') as f:
+                entry = pickle.load(f)
+        except (IOError, EOFError, pickle.UnpicklingError):
+            return None
+        if entry.get('version') != GENERATOR_VERSION:
+            return None
+        for filename, digest in entry['dependencies']:
+            try:
+                if _file_digest(filename) != digest:
+                    return None
+            except IOError:
+                return None
+        return entry
+
+    def write(self, path, entry):
+        if not os.path.isdir(self.cache_dir):
+            os.makedirs(self.cache_dir)
+        # written aside and renamed, so readers never see half an entry
+        fd, temp_path = tempfile.mkstemp(dir=self.cache_dir)
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump(entry, f, pickle.HIGHEST_PROTOCOL)
+        os.rename(temp_path, path)
+
+    def clear(self):
+        for path in glob.glob(os.path.join(self.cache_dir, '*.pickle')):
+            os.remove(path)
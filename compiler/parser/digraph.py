@@ -0,0 +1,66 @@
+"""
+DeRemer and Pennello's digraph algorithm: given a relation R and an initial
+value F'(x) for every node, computes
+
+    F(x) = F'(x) | union of F(y) for every y such that x R y
+
+Every strongly connected component of R ends up with a single shared value,
+so each value is propagated once. The traversal keeps an explicit stack
+instead of recursing, so long chains do not hit Python's recursion limit.
+"""
+
+import sys
+
+_DONE = sys.maxint
+
+
+def digraph(nodes, relation, initial):
+    """
+    relation maps a node to the nodes it is related to, initial maps every
+    node to its initial value. Values only need to support |, so sets and
+    int bitsets both work. Returns a new dict with the final values.
+    """
+    result = dict(initial)
+    depth = {}
+    stack = []
+    for node in nodes:
+        if node not in depth:
+            _traverse(node, relation, result, depth, stack)
+    return result
+
+
+def _traverse(start, relation, result, depth, stack):
+    stack.append(start)
+    depth[start] = len(stack)
+    frames = [(start, iter(relation.get(start, ())), len(stack))]
+    while len(frames) > 0:
+        node, edges, node_depth = frames[-1]
+        descended = False
+        for related in edges:
+            if related not in depth:
+                stack.append(related)
+                depth[related] = len(stack)
+                frames.append(
+                    (related, iter(relation.get(related, ())), len(stack))
+                )
+                descended = True
+                break
+            depth[node] = min(depth[node], depth[related])
+            result[node] = result[node] | result[related]
+        if descended:
+            continue
+
+        frames.pop()
+        if depth[node] == node_depth:
+            # node is the root of a strongly connected component
+            value = result[node]
+            while True:
+                member = stack.pop()
+                depth[member] = _DONE
+                result[member] = value
+                if member == node:
+                    break
+        if len(frames) > 0:
+            parent = frames[-1][0]
+            depth[parent] = min(depth[parent], depth[node])
+            result[parent] = result[parent] | result[node]
@@ -0,0 +1,208 @@
+"""
+Resolution of %import commands.
+
+Imported files can be other grammars (.bnf), whose productions are added to
+the importing grammar, or Python definition modules (.py) such as the
+expression classes used by the semantic actions of a language. Every file is
+loaded once per process: loaded modules are memoized by path and checked
+against the file's mtime and size (and its hash when those changed), so a
+grammar shared by many entry points is not parsed again.
+
+Imports are resolved level by level: all the files imported by the current
+level do not depend on each other, so they are loaded concurrently in a
+thread pool.
+"""
+
+from bnf_parser import Grammar, Production, UnexpectedBNFToken, parse_bnf
+from multiprocessing.pool import ThreadPool
+import hashlib
+import imp
+import importlib
+import os
+import sys
+import threading
+
+
+class GrammarModule(object):
+    def __init__(self, filename, digest, rules, commands):
+        self.filename = filename
+        self.digest = digest
+        self.rules = rules
+        self.commands = commands
+
+
+class DefinitionsModule(object):
+    def __init__(self, filename, digest, module):
+        self.filename = filename
+        self.digest = digest
+        self.module = module
+        self.commands = []
+
+
+class ResolvedImports(object):
+    """
+    modules keeps every loaded file in the order it was discovered, graph
+    maps every file to the files it imports.
+    """
+    def __init__(self):
+        self.modules = []
+        self.graph = {}
+
+    def grammars(self):
+        return [m for m in self.modules if isinstance(m, GrammarModule)]
+
+    def definitions(self):
+        return [m for m in self.modules if isinstance(m, DefinitionsModule)]
+
+
+# filename -> (mtime, size, loaded module)
+_cache = {}
+_cache_lock = threading.Lock()
+_file_locks = {}
+
+
+def clear_cache():
+    with _cache_lock:
+        _cache.clear()
+
+
+def load_module(filename):
+    filename = os.path.abspath(filename)
+    with _cache_lock:
+        file_lock = _file_locks.setdefault(filename, threading.Lock())
+    # only one thread loads a given file, the others wait for its result
+    with file_lock:
+        stat = os.stat(filename)
+        cached = _cache.get(filename)
+        stamp = (stat.st_mtime, stat.st_size)
+        if cached is not None and cached[:2] == stamp:
+            return cached[2]
+        with open(filename) as f:
+            source = f.read()
+        digest = hashlib.sha1(source).hexdigest()
+        if cached is not None and cached[2].digest == digest:
+            # touched but not changed
+            module = cached[2]
+        else:
+            module = _load_source(filename, digest, source, cached)
+        _cache[filename] = stamp + (module,)
+        return module
+
+
+def _load_source(filename, digest, source, cached):
+    extension = os.path.splitext(filename)[1]
+    if extension == '.bnf':
+        rules, commands = parse_bnf(source, os.path.dirname(filename))
+        return GrammarModule(filename, digest, rules, commands)
+    if extension == '.py':
+        if cached is not None:
+            module = reload(cached[2].module)
+        else:
+            module = _import_python(filename)
+        return DefinitionsModule(filename, digest, module)
+    raise ValueError('Unknown import type: ' + filename)
+
+
+def _import_python(filename):
+    name = _get_module_name(filename)
+    if name is not None:
+        return importlib.import_module(name)
+    name = os.path.splitext(os.path.basename(filename))[0]
+    return imp.load_source(name, filename)
+
+
+def _get_module_name(filename):
+    """
+    Dotted name of filename if it is inside a package reachable from
+    sys.path (so its relative imports work), None otherwise.
+    """
+    best = None
+    for entry in sys.path:
+        base = os.path.abspath(entry or '.')
+        if not filename.startswith(base + os.sep):
+            continue
+        parts = os.path.splitext(filename[len(base) + 1:])[0].split(os.sep)
+        package = base
+        for part in parts[:-1]:
+            package = os.path.join(package, part)
+            if not os.path.exists(os.path.join(package, '__init__.py')):
+                break
+        else:
+            if best is None or len(parts) < len(best):
+                best = parts
+    if best is None:
+        return None
+    return '.'.join(best)
+
+
+def resolve_imports(commands, processes=None, seen=None):
+    """
+    Loads every file imported by commands, and the files imported by
+    those, and so on. Files in seen are not loaded again.
+    """
+    resolved = ResolvedImports()
+    if seen is None:
+        seen = set()
+    frontier = _new_files(commands, seen)
+    pool = None
+    try:
+        while len(frontier) > 0:
+            if len(frontier) > 1 and processes != 1:
+                if pool is None:
+                    pool = ThreadPool(processes)
+                modules = pool.map(load_module, frontier)
+            else:
+                modules = [load_module(f) for f in frontier]
+            frontier = []
+            for module in modules:
+                resolved.modules.append(module)
+                resolved.graph[module.filename] = [
+                    os.path.abspath(command.filename)
+                    for command in module.commands
+                ]
+                frontier.extend(_new_files(module.commands, seen))
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+    return resolved
+
+
+def _new_files(commands, seen):
+    files = []
+    for command in commands:
+        filename = os.path.abspath(command.filename)
+        if filename not in seen:
+            seen.add(filename)
+            files.append(filename)
+    return files
+
+
+def load_grammar(filename, processes=None):
+    """
+    Builds the grammar defined in filename together with the productions
+    of every grammar it imports (directly or not). The start symbol is the
+    first rule of filename. Returns the grammar and the resolved imports.
+    """
+    main = load_module(filename)
+    if not isinstance(main, GrammarModule):
+        raise ValueError('Not a grammar: ' + filename)
+    resolved = resolve_imports(
+        main.commands,
+        processes,
+        set([main.filename])
+    )
+    resolved.modules.insert(0, main)
+    resolved.graph[main.filename] = [
+        os.path.abspath(command.filename) for command in main.commands
+    ]
+    rules = []
+    for module in resolved.grammars():
+        # the grammar numbers its productions, so cached ones are not shared
+        for rule in module.rules:
+            rules.append(
+                Production(rule.variable, rule.production, rule.action)
+            )
+    if len(rules) == 0:
+        raise UnexpectedBNFToken('End of data')
+    return Grammar(set(), set(), rules[0].variable, rules), resolved
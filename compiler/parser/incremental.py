@@ -0,0 +1,224 @@
+"""
+Incremental LR parsing: after an edit only the damaged part of the input is
+parsed again, the subtrees of the previous tree around it are reused whole.
+
+Every node of the tree remembers the number of tokens it covers and the
+parser state it was started in (the state on top of the stack when its first
+token was shifted). An LR parser in that state reading those same tokens and
+the same following token takes the same actions, so when the parser reaches
+a node of the old tree in its state, and neither the node nor the token after
+it were edited, the node can be pushed as it is, with a single goto. Nodes
+that do not qualify are broken down into their children, like tree-sitter
+does, so the work done is about the size of the edit plus the depth of the
+tree, not the size of the input. The exception are long lists written with
+left recursion (<E> ::= <E> "SUM_OPERATOR" <T>): every list node ends at the
+end of the list, so after an edit the items that follow it are reused one
+by one.
+
+    parser = IncrementalParser(grammar)
+    tree = parser.parse(tokens)
+    # tokens 10 to 12 were re-lexed into new_tokens
+    tree = parser.edit(10, 12, new_tokens)
+
+Re-lexing is left to the caller: the lexers produce tokens from the whole
+text, so the tokens of the edited region (usually from the start of the first
+token touched to the end of the last one) are lexed again and given to edit.
+"""
+
+from bnf_parser import EMPTY, END
+from runtime import ParseNode, UnexpectedToken
+from slr import build_slr_table
+
+
+class IncrementalNode(ParseNode):
+    """A ParseNode with the state it started in and its width in tokens"""
+    __slots__ = ('state', 'width')
+
+    def __init__(self, symbol, production=None, children=None, token=None,
+                 state=0, width=0):
+        super(IncrementalNode, self).__init__(
+            symbol,
+            production,
+            children,
+            token
+        )
+        self.state = state
+        self.width = width
+
+
+class _Cursor(object):
+    """
+    Walks the nodes of the previous tree left to right, computing where
+    every node starts (in the old token positions) on the way.
+    """
+
+    def __init__(self, root):
+        # (node, start, index of node among its siblings)
+        self.frames = [(root, 0, 0)]
+
+    def seek(self, position):
+        """
+        The outermost node starting at position, or None if none does.
+        Positions must not go backwards between calls.
+        """
+        frames = self.frames
+        while len(frames) > 0:
+            node, start, index = frames[-1]
+            end = start + node.width
+            if start > position:
+                return None
+            if node.width == 0 or end <= position:
+                self._next()
+            elif start == position:
+                return node
+            else:
+                frames.append((node.children[0], start, 0))
+        return None
+
+    def descend(self):
+        """Moves to the first child of the current node"""
+        node, start, index = self.frames[-1]
+        if len(node.children) > 0:
+            self.frames.append((node.children[0], start, 0))
+        else:
+            self._next()
+
+    def _next(self):
+        frames = self.frames
+        while len(frames) > 1:
+            node, start, index = frames.pop()
+            siblings = frames[-1][0].children
+            if index + 1 < len(siblings):
+                frames.append((
+                    siblings[index + 1],
+                    start + node.width,
+                    index + 1
+                ))
+                return
+        del frames[:]
+
+
+class IncrementalParser(object):
+    """
+    Shift-reduce parser over an LRTable that keeps its last tree and tokens
+    so edit can parse them again incrementally. reused counts the subtrees
+    taken from the previous tree by the last parse.
+    """
+
+    def __init__(self, grammar, table=None):
+        self.grammar = grammar
+        self.table = table if table is not None else build_slr_table(grammar)
+        self.tokens = []
+        self.tree = None
+        self.reused = 0
+
+    def parse(self, tokens):
+        """Parses tokens (a list) from scratch and returns the tree"""
+        tokens = list(tokens)
+        self.tree = self._parse(tokens, None, 0, 0, 0)
+        self.tokens = tokens
+        return self.tree
+
+    def edit(self, start, end, new_tokens):
+        """
+        Replaces the tokens from start to end (excluded) with new_tokens
+        and returns the new tree. On a syntax error UnexpectedToken is
+        raised and the previous tree and tokens are kept.
+        """
+        if self.tree is None:
+            raise ValueError('Nothing parsed yet')
+        new_tokens = list(new_tokens)
+        tokens = self.tokens[:start] + new_tokens + self.tokens[end:]
+        tree = self._parse(tokens, self.tree, start, end, len(new_tokens))
+        self.tree = tree
+        self.tokens = tokens
+        return tree
+
+    def _parse(self, tokens, old_tree, start, end, inserted):
+        grammar = self.grammar
+        table = self.table
+        terminal_ids = grammar.terminal_ids
+        names = grammar.symbol_names
+        productions = grammar.productions
+        prod_lhs = grammar.prod_lhs
+        prod_rhs = grammar.prod_rhs
+        variable_ids = grammar.variable_ids
+        get_action = table.get_action
+        get_goto = table.get_goto
+        accept = table.accept
+        cursor = _Cursor(old_tree) if old_tree is not None else None
+        # old position = new position - delta after the edit
+        delta = inserted - (end - start)
+        self.reused = 0
+
+        states = [0]
+        values = []
+        position = 0
+        n_tokens = len(tokens)
+        while True:
+            state = states[-1]
+            if position < n_tokens:
+                token = tokens[position]
+                term = terminal_ids.get(token.type_, EMPTY)
+            else:
+                token = None
+                term = END
+            act = get_action(state, term)
+            if act > 0 and cursor is not None:
+                if position < start:
+                    old_position = position
+                elif position >= start + inserted:
+                    old_position = position - delta
+                else:
+                    old_position = None
+                node = None
+                if old_position is not None:
+                    node = cursor.seek(old_position)
+                while node is not None and node.production is not None:
+                    undamaged = old_position + node.width < start or \
+                        old_position >= end
+                    if node.state == state and undamaged:
+                        break
+                    cursor.descend()
+                    node = cursor.seek(old_position)
+                if node is not None and node.production is not None:
+                    # the whole subtree is parsed as before
+                    states.append(get_goto(state, variable_ids[node.symbol]))
+                    values.append(node)
+                    position += node.width
+                    self.reused += 1
+                    continue
+            if act > 0:
+                values.append(IncrementalNode(
+                    token.type_,
+                    token=token,
+                    state=state,
+                    width=1
+                ))
+                states.append(act)
+                position += 1
+            elif act < 0:
+                prod_id = -act - 1
+                if prod_id == accept:
+                    if term != END:
+                        break
+                    return values[-1]
+                size = len(prod_rhs[prod_id])
+                if size > 0:
+                    children = values[-size:]
+                    del values[-size:]
+                    del states[-size:]
+                else:
+                    children = []
+                node_state = states[-1]
+                values.append(IncrementalNode(
+                    names[prod_lhs[prod_id]],
+                    productions[prod_id],
+                    children,
+                    state=node_state,
+                    width=sum(child.width for child in children)
+                ))
+                states.append(get_goto(node_state, prod_lhs[prod_id]))
+            else:
+                break
+        raise UnexpectedToken(token, table.expected(states[-1]))
@@ -0,0 +1,100 @@
+"""
+LALR(1) lookaheads for the LR(0) automaton, computed with DeRemer and
+Pennello's relations over the nonterminal transitions (p, A) of the automaton
+(the gotos on a variable A from a state p):
+
+* DR(p, A): the terminals shifted by the state reached on A
+* (p, A) reads (r, C): r is that state and it has a goto on a nullable C
+* (p, A) includes (p', B): B -> x A y with y nullable and p' goes to p on x
+* (q, A -> w) lookback (p, A): p goes to q on w
+
+Read is DR closed over reads and Follow is Read closed over includes, both
+with the digraph algorithm, and the lookahead of reducing A -> w in q is the
+union of Follow over its lookbacks. The table has the states of the LR(0)
+automaton, like SLR, but only reduces where the state can be followed by the
+terminal, not wherever FOLLOW(A) allows it.
+"""
+
+from bnf_parser import EMPTY_BIT, END
+from digraph import digraph
+from slr import LRTable, build_automaton
+
+
+def lalr_lookaheads(automaton):
+    """
+    {(state, prod_id): bitset of terminals} for every complete item of the
+    automaton.
+    """
+    grammar = automaton.grammar
+    n_terminals = grammar.n_terminals
+    transitions = automaton.transitions
+    first_bits = grammar.first_bits
+    prod_rhs = grammar.prod_rhs
+
+    # the nonterminal transitions, numbered
+    edges = []
+    edge_of = {}
+    for state, targets in enumerate(transitions):
+        for symbol in sorted(targets):
+            if symbol >= n_terminals:
+                edge_of[state, symbol] = len(edges)
+                edges.append((state, symbol))
+
+    direct = {}
+    reads = {}
+    for edge, (state, var) in enumerate(edges):
+        target = transitions[state][var]
+        bits = 0
+        related = []
+        for symbol in transitions[target]:
+            if symbol < n_terminals:
+                bits |= 1 << symbol
+            elif first_bits[symbol] & EMPTY_BIT:
+                related.append(edge_of[target, symbol])
+        direct[edge] = bits
+        reads[edge] = related
+    start = grammar.variable_ids[grammar.start]
+    start_symbol = grammar.prod_rhs[grammar.prods_of[start][0]][0]
+    # the start symbol is followed by the end of the input
+    direct[edge_of[0, start_symbol]] |= 1 << END
+    read = digraph(xrange(len(edges)), reads, direct)
+
+    includes = dict((edge, []) for edge in xrange(len(edges)))
+    lookback = {}
+    for edge, (state, var) in enumerate(edges):
+        for prod_id in grammar.prods_of[var]:
+            rhs = prod_rhs[prod_id]
+            suffixes = grammar.suffix_first_bits(prod_id)
+            current = state
+            for i, symbol in enumerate(rhs):
+                if symbol >= n_terminals and suffixes[i + 1] & EMPTY_BIT:
+                    includes[edge_of[current, symbol]].append(edge)
+                current = transitions[current][symbol]
+            lookback.setdefault((current, prod_id), []).append(edge)
+    follow = digraph(xrange(len(edges)), includes, read)
+
+    lookaheads = {}
+    for key, related in lookback.iteritems():
+        bits = 0
+        for edge in related:
+            bits |= follow[edge]
+        lookaheads[key] = bits
+    # the augmented production has no transition on '#' to look back to
+    for prod_id in grammar.prods_of[start]:
+        lookaheads[transitions[0][start_symbol], prod_id] = 1 << END
+    return lookaheads
+
+
+def build_lalr_table(grammar, automaton=None, strict=False):
+    """
+    LALR(1) table of grammar (see LRTable). Like build_slr_table it does not
+    remove useless symbols, pass the grammar of transform.reduce_grammar.
+    """
+    if automaton is None:
+        automaton = build_automaton(grammar)
+    lookaheads = lalr_lookaheads(automaton)
+    return LRTable(
+        automaton,
+        lambda state, prod_id: lookaheads.get((state, prod_id), 0),
+        strict
+    )
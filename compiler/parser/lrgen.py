@@ -0,0 +1,259 @@
+#!/usr/bin/env python
+"""
+Generator of standalone LR parsers.
+
+Like flexer.py does for lexers, it writes a Python module from a BNF grammar:
+the useless symbols of the grammar are removed (see transform.reduce_grammar),
+its LALR(1) table (or the SLR(1) one with --slr) is built and compressed
+(see LRTable.compress), and its arrays are written out together with the
+shift-reduce loop that runs them. The module imports nothing but
+array, so loading it costs no grammar analysis at all.
+
+    python -m compiler.parser.lrgen grammar.bnf > grammar_parser.py
+
+The generated Parser takes a lexer (anything with get_next_token) and its
+parse method returns the parse tree as nested (variable, children) tuples
+whose leaves are the tokens, like the parsers of rdgen.py. parse(reduce)
+calls reduce(prod_id, values) on every reduction instead, PRODUCTIONS has
+the text of every production.
+
+With --lexer spec.lex the terminals are numbered like the tokens of the DFA
+lexer that flexer.py --dfa generates from spec.lex, so the ids it produces
+go straight into parse_ids, without creating any token:
+
+    ids, starts, ends = lexer.tokenize(code)
+    tree = parser.parse_ids(ids)
+
+The leaves are then the positions of the tokens in ids.
+"""
+
+from ..lexer.flexer import Flexer, token_names
+from bnf_parser import EMPTY, END
+from imports import load_grammar
+from lalr import build_lalr_table
+from slr import build_automaton, build_slr_table
+from transform import reduce_grammar
+import argparse
+import sys
+import textwrap
+
+PARSER_TEMPLATE = """
+# Generated by lrgen.py, do not edit
+from array import array
+
+TERMINAL_NAMES = %(terminal_names)s
+TERMINALS = dict((name, id_) for id_, name in enumerate(TERMINAL_NAMES))
+VARIABLES = %(variables)s
+PRODUCTIONS = %(productions)s
+# index in VARIABLES of the variable of every production
+PROD_LHS = %(prod_lhs)s
+PROD_LENGTH = %(prod_length)s
+ACCEPT = %(accept)d
+
+DEFAULT_ACTION = %(default_action)s
+ACTION_BASE = %(action_base)s
+ACTION_CHECK = %(action_check)s
+ACTION_VALUE = %(action_value)s
+DEFAULT_GOTO = %(default_goto)s
+GOTO_BASE = %(goto_base)s
+GOTO_CHECK = %(goto_check)s
+GOTO_VALUE = %(goto_value)s
+
+
+class UnexpectedToken(Exception):
+    def __init__(self, token, expected, position=None):
+        self.token = token
+        self.expected = sorted(expected)
+        self.position = position
+        if token is None:
+            self.msg = 'End of data'
+        elif position is not None:
+            # parse_ids only knows the name of the token
+            self.msg = token + ' (token ' + str(position) + ')'
+        else:
+            self.msg = token.type_ + ' (' + token.lexeme + ')'
+
+    def __str__(self):
+        return 'Unexpected token: ' + self.msg + ', expected one of: ' + \\
+               ', '.join(self.expected)
+
+
+def _expected(state):
+    base = ACTION_BASE[state]
+    expected = [TERMINAL_NAMES[term]
+                for term in range(%(end)d, len(TERMINAL_NAMES))
+                if ACTION_CHECK[base + term] == state]
+    if DEFAULT_ACTION[state] == -(ACCEPT + 1):
+        expected.append(TERMINAL_NAMES[%(end)d])
+    return expected
+
+
+def _node(prod_id, values):
+    return (VARIABLES[PROD_LHS[prod_id]], values)
+
+
+def parse_ids(ids, reduce=_node, leaves=None):
+    \"\"\"
+    Parses the terminal ids in ids (ending with %(end)d, the end of the
+    input). The value of the terminal at position i is leaves[i], or i
+    itself without leaves.
+    \"\"\"
+    states = [0]
+    values = []
+    state = 0
+    position = 0
+    term = ids[0]
+    while True:
+        slot = ACTION_BASE[state] + term
+        if ACTION_CHECK[slot] == state:
+            act = ACTION_VALUE[slot]
+        else:
+            act = DEFAULT_ACTION[state]
+        if act > 0:
+            values.append(position if leaves is None else leaves[position])
+            states.append(act)
+            state = act
+            position += 1
+            term = ids[position]
+        elif act < 0:
+            prod_id = -act - 1
+            if prod_id == ACCEPT:
+                if term != %(end)d:
+                    break
+                return values[-1]
+            size = PROD_LENGTH[prod_id]
+            if size > 0:
+                children = values[-size:]
+                del values[-size:]
+                del states[-size:]
+            else:
+                children = []
+            var = PROD_LHS[prod_id]
+            slot = GOTO_BASE[var] + states[-1]
+            if GOTO_CHECK[slot] == var:
+                state = GOTO_VALUE[slot]
+            else:
+                state = DEFAULT_GOTO[var]
+            states.append(state)
+            values.append(reduce(prod_id, children))
+        else:
+            break
+    if leaves is not None:
+        raise UnexpectedToken(leaves[position], _expected(state))
+    name = None if term == %(end)d else TERMINAL_NAMES[term]
+    raise UnexpectedToken(name, _expected(state), position)
+
+
+class Parser(object):
+    def __init__(self, lexer):
+        self.lexer = lexer
+
+    def parse(self, reduce=_node):
+        ids = []
+        tokens = []
+        token = self.lexer.get_next_token()
+        while token is not None:
+            ids.append(TERMINALS.get(token.type_, %(empty)d))
+            tokens.append(token)
+            token = self.lexer.get_next_token()
+        ids.append(%(end)d)
+        tokens.append(None)
+        return parse_ids(ids, reduce, tokens)
+"""
+
+
+def _array(values):
+    """Source of an array literal of values, wrapped"""
+    if hasattr(values, 'typecode'):
+        typecode = values.typecode
+    else:
+        values = list(values)
+        small = all(-2 ** 15 <= value < 2 ** 15 for value in values)
+        typecode = 'h' if small else 'i'
+    items = ', '.join(str(value) for value in values)
+    if len(items) < 50:
+        return 'array(%r, [%s])' % (typecode, items)
+    lines = textwrap.wrap(items, 75)
+    return 'array(%r, [\n    %s\n])' % (typecode, '\n    '.join(lines))
+
+
+def _list(values):
+    """Source of a list of strings, one per line"""
+    return '[\n' + ''.join('    %r,\n' % value for value in values) + ']'
+
+
+def lexer_token_names(filename):
+    """
+    Names of the token ids of the DFA lexer flexer.py --dfa generates from
+    the spec in filename, taken from the rules the flexer itself reads.
+    """
+    with open(filename) as f:
+        flexer = Flexer(f.read())
+    flexer.build_nfa()
+    return token_names(flexer.final_states.values())
+
+
+def generate(grammar, table=None):
+    """Source of the parser module of grammar (with its LALR(1) table)"""
+    if table is None:
+        table = build_lalr_table(grammar)
+    if table.action_rows is not None:
+        table.compress()
+    n_terminals = grammar.n_terminals
+    return PARSER_TEMPLATE % {
+        'terminal_names': _list(table.terminal_names),
+        'variables': _list(grammar.symbol_names[n_terminals:]),
+        'productions': _list(str(prod) for prod in grammar.productions),
+        'prod_lhs': _array(lhs - n_terminals for lhs in grammar.prod_lhs),
+        'prod_length': _array(len(rhs) for rhs in grammar.prod_rhs),
+        'accept': table.accept,
+        'default_action': _array(table.default_action),
+        'action_base': _array(table.action_base),
+        'action_check': _array(table.action_check),
+        'action_value': _array(table.action_value),
+        'default_goto': _array(table.default_goto),
+        'goto_base': _array(table.goto_base),
+        'goto_check': _array(table.goto_check),
+        'goto_value': _array(table.goto_value),
+        'end': END,
+        'empty': EMPTY,
+    }
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('grammar')
+    parser.add_argument('--slr', action='store_true',
+                        help='build an SLR(1) table instead of LALR(1)')
+    parser.add_argument('--processes', type=int, default=None,
+                        help='build the LR(0) states with a process pool')
+    parser.add_argument('--bypass-units', action='store_true',
+                        help='skip the reductions by unit productions '
+                             '(see LRTable.bypass_unit_reductions)')
+    parser.add_argument('--lexer', default=None,
+                        help='number the terminals like the DFA lexer of '
+                             'this .lex spec')
+    args = parser.parse_args(argv)
+    grammar, resolved = load_grammar(args.grammar)
+    # the tables get no states, columns or rows for useless symbols
+    grammar, report = reduce_grammar(grammar)
+    for prod in report.removed:
+        print >> sys.stderr, 'Useless production removed: ' + str(prod)
+    automaton = build_automaton(grammar, args.processes)
+    if args.slr:
+        table = build_slr_table(grammar, automaton)
+    else:
+        table = build_lalr_table(grammar, automaton)
+    for conflict in table.conflicts:
+        print >> sys.stderr, 'Conflict: ' + str(conflict)
+    if args.bypass_units:
+        table.bypass_unit_reductions()
+    if args.lexer is not None:
+        missing = table.renumber_terminals(lexer_token_names(args.lexer))
+        for name in missing:
+            print >> sys.stderr, 'Terminal not produced by the lexer: ' + name
+    print generate(grammar, table)
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -1,50 +1,287 @@
-from .bnf_parser import build_grammar
+from .bnf_parser import build_grammar_and_commands, iter_bits, EMPTY, \
+    EMPTY_BIT, END
+from .runtime import REDUCE, SHIFT, ParseNode, UnexpectedToken, \
+    pack_rows
+from .transform import to_ll1
+from array import array
 import sys
+import os
 
-def _get_chained_first(grammar, production):
-    if production[0] == '':
-        return ['']
 
-    current_first = ['']
-    firsts = set()
-    while '' in current_first and len(production) > 0:
-        current_first = grammar.first(production[0])
-        production = production[1:]
-        firsts.update(current_first.difference(set([''])))
-    if len(production) == 0:
-        firsts.add('')
-    return firsts
+class AmbiguousGrammar(Exception):
+    def __init__(self, conflicts):
+        self.conflicts = conflicts
+
+    def __str__(self):
+        return 'Ambiguous grammar!\n' + \
+               '\n'.join(str(conflict) for conflict in self.conflicts)
+
+
+class Conflict(object):
+    def __init__(self, var, term, chosen, rejected):
+        self.var = var
+        self.term = term
+        self.chosen = chosen
+        self.rejected = rejected
+
+    def __str__(self):
+        return 'table[' + self.var + '][' + self.term + ']: ' + \
+               str(self.chosen) + ' (chosen) / ' + str(self.rejected)
+
+
+class ParseTable(dict):
+    """
+    So we can keep the conflicts found while building it
+    """
+    def __init__(self):
+        super(ParseTable, self).__init__()
+        self.conflicts = []
 
 
 def add_to_parse_table(parse_table, var, term, prod):
-    #if parse_table[var][term] is not None:
-    #    raise ValueError('Ambiguous grammar!')
-    # TODO: Check if productions is really equal to another, if not, then raise
-    # an error!
+    current = parse_table[var].get(term)
+    if current is not None and current is not prod:
+        # the first production (in definition order) wins
+        parse_table.conflicts.append(Conflict(var, term, current, prod))
+        return
     parse_table[var][term] = prod
 
 
-def build_parser_table(grammar):
-    parse_table = {}
+def build_parser_table(grammar, strict=False):
+    """
+    Builds the predictive table of grammar. Entries claimed by more than one
+    production are recorded in the conflicts of the table, or raise
+    AmbiguousGrammar if strict.
+    """
+    parse_table = ParseTable()
     for var in grammar.variables:
         parse_table[var] = {}
         for term in grammar.terminals:
             parse_table[var][term] = None
+    names = grammar.symbol_names
     for prod in grammar.productions:
         var = prod.variable.name
-        for term in grammar.first(var):
-            if term == '':
-                continue
-            add_to_parse_table(parse_table, var, term, prod)
-        if '' in _get_chained_first(grammar, prod.production):
-            for term in grammar.follow(var):
-                add_to_parse_table(parse_table, var, term, prod)
+        firsts = grammar.suffix_first_bits(prod.id_)[0]
+        for term in iter_bits(firsts & ~EMPTY_BIT):
+            add_to_parse_table(parse_table, var, names[term], prod)
+        if firsts & EMPTY_BIT:
+            follows = grammar.follow_bits[grammar.prod_lhs[prod.id_]]
+            for term in iter_bits(follows):
+                add_to_parse_table(parse_table, var, names[term], prod)
+    if strict and len(parse_table.conflicts) > 0:
+        raise AmbiguousGrammar(parse_table.conflicts)
     return parse_table
 
+
+def build_ll1_parser_table(grammar, strict=False):
+    """
+    DenseParseTable of grammar once left recursion is removed and common
+    prefixes are factored out. Returns the transformed grammar too, since
+    the table refers to its productions and symbol ids.
+    """
+    grammar = to_ll1(grammar)
+    return grammar, DenseParseTable(grammar, strict)
+
+
+class DenseParseTable(object):
+    """
+    The predictive table over the interned grammar: entry [var][term] is the
+    id of the production to expand or -1. Every variable has a row (an array
+    indexed by terminal id) in rows, so a lookup is a single index
+    operation.
+
+    compress() packs the rows with row displacement: row var is stored
+    from base[var] on in value, and a slot belongs to var only if
+    check[slot] == var. That needs two lookups per step, but only the
+    non empty entries take space.
+    """
+
+    def __init__(self, grammar, strict=False):
+        self.n_terminals = grammar.n_terminals
+        n_vars = len(grammar.symbol_names) - self.n_terminals
+        self.typecode = 'h' if len(grammar.productions) < 2 ** 15 else 'i'
+        empty_row = array(self.typecode, [-1]) * self.n_terminals
+        self.rows = [array(self.typecode, empty_row) for i in xrange(n_vars)]
+        self.base = self.check = self.value = None
+        self.conflicts = []
+        names = grammar.symbol_names
+        for prod_id, lhs in enumerate(grammar.prod_lhs):
+            row = self.rows[lhs - self.n_terminals]
+            firsts = grammar.suffix_first_bits(prod_id)[0]
+            terms = firsts & ~EMPTY_BIT
+            if firsts & EMPTY_BIT:
+                terms |= grammar.follow_bits[lhs]
+            for term in iter_bits(terms):
+                if row[term] == -1:
+                    row[term] = prod_id
+                elif row[term] != prod_id:
+                    # the first production (in definition order) wins
+                    self.conflicts.append(Conflict(
+                        names[lhs],
+                        names[term],
+                        grammar.productions[row[term]],
+                        grammar.productions[prod_id]
+                    ))
+        if strict and len(self.conflicts) > 0:
+            raise AmbiguousGrammar(self.conflicts)
+
+    def get(self, var, term):
+        """Production id for variable id var and terminal id term, or -1"""
+        if self.rows is not None:
+            return self.rows[var - self.n_terminals][term]
+        slot = self.base[var - self.n_terminals] + term
+        if self.check[slot] != var - self.n_terminals:
+            return -1
+        return self.value[slot]
+
+    def compress(self):
+        """Packs the rows with first fit row displacement (in place)"""
+        rows = [[(term, prod) for term, prod in enumerate(row) if prod != -1]
+                for row in self.rows]
+        self.base, self.check, self.value = pack_rows(
+            rows,
+            self.n_terminals,
+            self.typecode
+        )
+        self.rows = None
+        return self
+
+
+class PredictiveParser(object):
+    """
+    Table driven LL(1) parser over a DenseParseTable. The symbols still to
+    be matched are kept in an explicit stack, so the depth of the input is
+    only bounded by memory and every token is handled in constant time
+    (plus the size of the productions expanded before it).
+
+    Without a table one is built strictly, so a grammar that is not LL(1)
+    raises AmbiguousGrammar instead of being parsed with the first
+    production of every conflict.
+    """
+
+    def __init__(self, grammar, table=None):
+        self.grammar = grammar
+        if table is None:
+            table = DenseParseTable(grammar, strict=True)
+        self.table = table
+
+    def parse(self, lexer):
+        """
+        Parses the tokens of lexer (anything with a get_next_token method
+        returning tokens with type_ and lexeme, and None at the end) and
+        returns the parse tree.
+        """
+        grammar = self.grammar
+        names = grammar.symbol_names
+        n_terminals = grammar.n_terminals
+        terminal_ids = grammar.terminal_ids
+        prod_rhs = grammar.prod_rhs
+        rows = self.table.rows
+        base = self.table.base
+        check = self.table.check
+        value = self.table.value
+
+        root = ParseNode(grammar.start)
+        stack = [(grammar.variable_ids[grammar.start], root)]
+        token = lexer.get_next_token()
+        lookahead = END if token is None else \
+            terminal_ids.get(token.type_, EMPTY)
+        while len(stack) > 0:
+            sym, node = stack.pop()
+            if sym < n_terminals:
+                if sym != lookahead:
+                    raise UnexpectedToken(token, [names[sym]])
+                node.token = token
+                token = lexer.get_next_token()
+                lookahead = END if token is None else \
+                    terminal_ids.get(token.type_, EMPTY)
+                continue
+            var = sym - n_terminals
+            if rows is not None:
+                prod_id = rows[var][lookahead]
+            else:
+                slot = base[var] + lookahead
+                prod_id = value[slot] if check[slot] == var else -1
+            if prod_id == -1:
+                raise UnexpectedToken(token, [
+                    names[term] for term in xrange(END, n_terminals)
+                    if self.table.get(sym, term) != -1
+                ])
+            node.production = grammar.productions[prod_id]
+            rhs = prod_rhs[prod_id]
+            node.children = [ParseNode(names[child]) for child in rhs]
+            for i in xrange(len(rhs) - 1, -1, -1):
+                stack.append((rhs[i], node.children[i]))
+        if token is not None:
+            raise UnexpectedToken(token, ['$'])
+        return root
+
+    def events(self, lexer):
+        """
+        Generator of the shift and reduce events (see runtime) of parsing
+        the tokens of lexer, read as they are needed. A production is
+        reported once all its symbols are matched, so the reductions come
+        in the same order as from an LR parser.
+        """
+        grammar = self.grammar
+        names = grammar.symbol_names
+        n_terminals = grammar.n_terminals
+        terminal_ids = grammar.terminal_ids
+        prod_rhs = grammar.prod_rhs
+        augmented = len(grammar.productions) - 1
+        get = self.table.get
+
+        # symbols to match, and (-1 - production id, start) entries that
+        # mark where the symbols of a production end
+        stack = [(grammar.variable_ids[grammar.start], 0)]
+        position = 0
+        token = lexer.get_next_token()
+        lookahead = END if token is None else \
+            terminal_ids.get(token.type_, EMPTY)
+        while len(stack) > 0:
+            sym, start = stack.pop()
+            if sym < 0:
+                yield (REDUCE, -1 - sym, start, position)
+                continue
+            if sym < n_terminals:
+                if sym != lookahead:
+                    raise UnexpectedToken(token, [names[sym]])
+                yield (SHIFT, sym, position, token)
+                position += 1
+                token = lexer.get_next_token()
+                lookahead = END if token is None else \
+                    terminal_ids.get(token.type_, EMPTY)
+                continue
+            prod_id = get(sym, lookahead)
+            if prod_id == -1:
+                raise UnexpectedToken(token, [
+                    names[term] for term in xrange(END, n_terminals)
+                    if get(sym, term) != -1
+                ])
+            if prod_id != augmented:
+                stack.append((-1 - prod_id, position))
+            rhs = prod_rhs[prod_id]
+            for i in xrange(len(rhs) - 1, -1, -1):
+                stack.append((rhs[i], 0))
+        if token is not None:
+            raise UnexpectedToken(token, ['$'])
+
+
 if __name__ == '__main__':
     filename = sys.argv[1]
     with open(filename) as f:
         code = f.read()
-    g = build_grammar(code)
-    print build_parser_table(g)
-
+    g, commands = build_grammar_and_commands(
+        code,
+        os.path.dirname(filename)
+    )
+    g, table = build_ll1_parser_table(g)
+    names = g.symbol_names
+    for var in xrange(g.n_terminals, len(names)):
+        print names[var]
+        for term in xrange(END, g.n_terminals):
+            prod_id = table.get(var, term)
+            if prod_id != -1:
+                print '    %s: %s' % (names[term], g.productions[prod_id])
+    for conflict in table.conflicts:
+        print 'Conflict: ' + str(conflict)
@@ -0,0 +1,237 @@
+#!/usr/bin/env python
+"""
+Generator of standalone recursive descent parsers.
+
+Like flexer.py does for lexers, it writes a Python module from a BNF grammar:
+the grammar is made LL(1) (see transform.to_ll1), its predictive table is
+built, and every variable becomes a function that picks its production by
+comparing the id of the lookahead token with the ids the table has for it.
+The module needs neither the grammar nor the table at runtime.
+
+    python -m compiler.parser.rdgen grammar.bnf > grammar_parser.py
+
+The generated Parser takes a lexer (anything with get_next_token) and its
+parse method returns the parse tree as nested (variable, children) tuples
+whose leaves are the tokens. Nesting in the input becomes recursion in the
+parser, so it is bound by Python's recursion limit. Lists do not: to_ll1
+turns left recursive lists into tail recursive variables
+(A-prime -> x A-prime | ""), whose functions are loops that match one x per
+iteration and nest the levels into the same tree afterwards.
+"""
+
+from bnf_parser import EMPTY, END
+from imports import load_grammar
+from predictive import DenseParseTable
+from transform import to_ll1
+import re
+import sys
+
+PARSER_TEMPLATE = """
+# Generated by rdgen.py, do not edit
+
+TERMINALS = %(terminals)s
+NAMES = %(names)s
+%(sets)s
+
+class UnexpectedToken(Exception):
+    def __init__(self, token, expected):
+        self.token = token
+        self.expected = expected
+        if token is None:
+            self.msg = 'End of data'
+        else:
+            self.msg = token.type_ + ' (' + token.lexeme + ')'
+
+    def __str__(self):
+        return 'Unexpected token: ' + self.msg + ', expected one of: ' + \\
+               ', '.join(self.expected)
+
+
+class Parser(object):
+    def __init__(self, lexer):
+        self.lexer = lexer
+        self._advance()
+
+    def _advance(self):
+        self.token = self.lexer.get_next_token()
+        if self.token is None:
+            self.lookahead = %(end)d
+        else:
+            self.lookahead = TERMINALS.get(self.token.type_, %(empty)d)
+
+    def _match(self, term):
+        if self.lookahead != term:
+            raise UnexpectedToken(self.token, [NAMES[term]])
+        token = self.token
+        self._advance()
+        return token
+
+    def _error(self, expected):
+        raise UnexpectedToken(self.token, [NAMES[term] for term in expected])
+
+    def parse(self):
+        tree = self.%(start)s()
+        if self.lookahead != %(end)d:
+            self._error([%(end)d])
+        return tree
+%(functions)s
+"""
+
+
+def _function_names(grammar):
+    names = {}
+    taken = set()
+    for var in sorted(grammar.variable_ids.itervalues()):
+        base = 'parse_' + re.sub(r'\W', '_', grammar.symbol_names[var])
+        name = base
+        counter = 2
+        while name in taken:
+            name = base + str(counter)
+            counter += 1
+        taken.add(name)
+        names[var] = name
+    return names
+
+
+def _condition(terms, sets):
+    if len(terms) <= 3:
+        return ' or '.join('la == %d' % term for term in terms)
+    key = tuple(terms)
+    if key not in sets:
+        sets[key] = '_LOOKAHEAD_%d' % len(sets)
+    return 'la in ' + sets[key]
+
+
+def _is_tail_recursive(grammar, var):
+    """
+    Whether the productions of var are one empty production and others of
+    the form x var, with var nowhere in x
+    """
+    empty = 0
+    for prod_id in grammar.prods_of[var]:
+        rhs = grammar.prod_rhs[prod_id]
+        if len(rhs) == 0:
+            empty += 1
+        elif len(rhs) < 2 or rhs[-1] != var or var in rhs[:-1]:
+            return False
+    return empty == 1 and len(grammar.prods_of[var]) > 1
+
+
+def _children(grammar, rhs, functions):
+    children = []
+    for sym in rhs:
+        if sym < grammar.n_terminals:
+            children.append('self._match(%d)' % sym)
+        else:
+            children.append('self.%s()' % functions[sym])
+    return ', '.join(children)
+
+
+def _generate_loop(grammar, var, by_prod, functions, sets):
+    """Function of a tail recursive variable (see _is_tail_recursive)"""
+    name = grammar.symbol_names[var]
+    lines = [
+        '',
+        '    def %s(self):' % functions[var],
+        '        levels = []',
+        '        while True:',
+        '            la = self.lookahead',
+    ]
+    keyword = 'if'
+    for prod_id in sorted(by_prod):
+        lines.append('            %s %s:' % (
+            keyword,
+            _condition(by_prod[prod_id], sets)
+        ))
+        keyword = 'elif'
+        rhs = grammar.prod_rhs[prod_id]
+        if len(rhs) == 0:
+            lines.append('                break')
+        else:
+            lines.append('                levels.append([%s])' % _children(
+                grammar,
+                rhs[:-1],
+                functions
+            ))
+    lines.extend([
+        '            else:',
+        '                self._error(%r)' % sorted(
+            term for terms in by_prod.itervalues() for term in terms
+        ),
+        '        tree = (%r, [])' % name,
+        '        for children in reversed(levels):',
+        '            children.append(tree)',
+        '            tree = (%r, children)' % name,
+        '        return tree',
+    ])
+    return '\n'.join(lines)
+
+
+def _generate_function(grammar, table, var, functions, sets):
+    n_terminals = grammar.n_terminals
+    row = table.rows[var - n_terminals]
+    # lookahead ids per production, in production order
+    by_prod = {}
+    for term in xrange(END, n_terminals):
+        if row[term] != -1:
+            by_prod.setdefault(row[term], []).append(term)
+    if _is_tail_recursive(grammar, var):
+        return _generate_loop(grammar, var, by_prod, functions, sets)
+    name = grammar.symbol_names[var]
+    lines = [
+        '',
+        '    def %s(self):' % functions[var],
+        '        la = self.lookahead',
+    ]
+    keyword = 'if'
+    for prod_id in sorted(by_prod):
+        lines.append('        %s %s:' % (
+            keyword,
+            _condition(by_prod[prod_id], sets)
+        ))
+        keyword = 'elif'
+        lines.append('            return (%r, [%s])' % (
+            name,
+            _children(grammar, grammar.prod_rhs[prod_id], functions)
+        ))
+    lines.append('        self._error(%r)' % sorted(
+        term for terms in by_prod.itervalues() for term in terms
+    ))
+    return '\n'.join(lines)
+
+
+def generate(grammar):
+    """Source of the parser module of grammar (which must be LL(1))"""
+    table = DenseParseTable(grammar, strict=True)
+    functions = _function_names(grammar)
+    sets = {}
+    bodies = []
+    start = grammar.variable_ids['#']
+    for var in sorted(functions):
+        if var != start:
+            bodies.append(
+                _generate_function(grammar, table, var, functions, sets)
+            )
+    start_symbol = grammar.productions[-1].production[0]
+    terminals = dict(
+        (name, id_) for name, id_ in grammar.terminal_ids.iteritems()
+        if id_ > END
+    )
+    return PARSER_TEMPLATE % {
+        'terminals': repr(terminals),
+        'names': repr(grammar.symbol_names[:grammar.n_terminals]),
+        'sets': '\n'.join('%s = frozenset(%r)' % (name, list(terms))
+                          for terms, name in sorted(sets.items(),
+                                                    key=lambda s: s[1])),
+        'start': functions[grammar.variable_ids[start_symbol.name]],
+        'end': END,
+        'empty': EMPTY,
+        'functions': '\n'.join(bodies),
+    }
+
+
+if __name__ == '__main__':
+    if len(sys.argv) < 2:
+        raise ValueError('Required argument missing')
+    grammar, resolved = load_grammar(sys.argv[1])
+    print generate(to_ll1(grammar))
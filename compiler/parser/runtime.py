@@ -0,0 +1,111 @@
+"""
+Structures shared by the parse drivers: the nodes of the parse trees they
+build, the events they emit, the error raised on a syntax error and the
+packing of their tables.
+"""
+
+from array import array
+
+# The events methods of the drivers yield, instead of building a tree,
+#   (SHIFT, terminal id, position, token) when a token is matched and
+#   (REDUCE, production id, start, end) when a production is complete,
+# with positions counted in tokens and end excluded. The reductions come
+# in postorder, the productions of the augmented start symbol are left out.
+SHIFT = 'shift'
+REDUCE = 'reduce'
+
+
+class UnexpectedToken(Exception):
+    def __init__(self, token, expected):
+        self.token = token
+        self.expected = sorted(expected)
+        if token is None:
+            self.msg = 'End of data'
+        else:
+            self.msg = token.type_ + ' (' + token.lexeme + ')'
+
+    def __str__(self):
+        return 'Unexpected token: ' + self.msg + ', expected one of: ' + \
+               ', '.join(self.expected)
+
+
+class ParseNode(object):
+    """
+    A node of a parse tree: the symbol (a variable or terminal name), the
+    production used to expand it (variables only), its children and, for
+    terminals, the token matched.
+    """
+    __slots__ = ('symbol', 'production', 'children', 'token')
+
+    def __init__(self, symbol, production=None, children=None, token=None):
+        self.symbol = symbol
+        self.production = production
+        self.children = children if children is not None else []
+        self.token = token
+
+    def iter_tokens(self):
+        """The tokens under this node, left to right (without recursion)"""
+        pending = [self]
+        while len(pending) > 0:
+            node = pending.pop()
+            if node.token is not None:
+                yield node.token
+            pending.extend(reversed(node.children))
+
+    def __repr__(self):
+        if self.token is not None:
+            return '<' + self.symbol + ' ' + repr(self.token.lexeme) + '>'
+        return '<' + self.symbol + ': ' + \
+               ' '.join(child.symbol for child in self.children) + '>'
+
+
+def pack_rows(rows, width, typecode):
+    """
+    First fit row displacement of rows (lists of (column, value)) whose
+    columns are below width: row r is stored from base[r] on in value, and
+    slot belongs to r only if check[slot] == r.
+
+    The search for a row starts at the lowest free slot and only tries the
+    offsets that put its first column on a free slot, so it does not walk
+    again over the packed part of the arrays.
+    """
+    base = array('i', [0]) * len(rows)
+    # used[slot] is 1 if slot is taken, free is the lowest free slot
+    used = bytearray()
+    free = 0
+    # denser rows first, they are the hardest to fit
+    order = sorted(xrange(len(rows)), key=lambda row: -len(rows[row]))
+    size = 0
+    for row in order:
+        entries = rows[row]
+        if len(entries) == 0:
+            continue
+        first = min(column for column, value in entries)
+        slot = max(free, first)
+        while True:
+            found = used.find('\x00', slot)
+            slot = found if found != -1 else max(slot, len(used))
+            offset = slot - first
+            if all(offset + column >= len(used) or
+                   used[offset + column] == 0
+                   for column, value in entries):
+                break
+            slot += 1
+        end = offset + max(column for column, value in entries) + 1
+        if end > len(used):
+            used.extend('\x00' * (end - len(used)))
+        for column, value in entries:
+            used[offset + column] = 1
+        free = used.find('\x00', free)
+        if free == -1:
+            free = len(used)
+        base[row] = offset
+        size = max(size, offset)
+    # every lookup base + column stays inside the arrays
+    check = array('i', [-1]) * (size + width)
+    value = array(typecode, [0]) * (size + width)
+    for row, entries in enumerate(rows):
+        for column, entry in entries:
+            check[base[row] + column] = row
+            value[base[row] + column] = entry
+    return base, check, value
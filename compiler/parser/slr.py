@@ -1,69 +1,707 @@
-from bnf_parser import Item, Variable, Terminal
-from itertools import chain
+from array import array
+from bnf_parser import EMPTY, END, iter_bits
+from collections import deque
+from multiprocessing import Pool
+from predictive import AmbiguousGrammar
+from runtime import REDUCE, SHIFT, ParseNode, UnexpectedToken, pack_rows
+
 
 def closure(items, grammar):
+    """
+    The kernel items plus the start items predicted by the variables after
+    their dots, taken from the grammar's cached predictions.
+    """
     closed = set(items)
-    added = True
-    last_size = len(closed)
-    while added:
-        added = False
-        closed_iter = set(closed)
-        for item in closed:
-            len_right = len(item.production)
-            pos = item.production.index('.')
-            if pos == -1 or pos == len_right - 1:
-                continue
-            next_symbol = item.production[pos + 1]
-            if grammar.is_variable(next_symbol.name):
-                for rule in grammar.get_productions_for_variable(
-                    next_symbol.name
-                ):
-                    closed_iter.add(Item(rule, 0))
-                    added = len(closed_iter) > last_size
-                    if added:
-                        last_size = len(closed_iter)
-        closed = closed_iter
+    prod_rhs = grammar.prod_rhs
+    n_terminals = grammar.n_terminals
+    predictions = grammar.predictions
+    seen = set()
+    for item in items:
+        rhs = prod_rhs[item.prod_id]
+        if item.dot < len(rhs):
+            symbol = rhs[item.dot]
+            if symbol >= n_terminals and symbol not in seen:
+                seen.add(symbol)
+                closed.update(predictions[symbol])
     return closed
 
+
 def goto(items, symbol, grammar):
-    acc = set()
+    symbol = grammar.terminal_ids.get(symbol, grammar.variable_ids.get(symbol))
+    prod_rhs = grammar.prod_rhs
+    kernel = []
     for item in items:
-        acc.update(_individual_goto(item, symbol, grammar))
-    return acc
-
-def _individual_goto(item, symbol, grammar):
-    pos = item.production.index('.')
-    if grammar.is_terminal(symbol):
-        symbol = Terminal(symbol)
-    elif grammar.is_variable(symbol):
-        symbol = Variable(symbol)
-    if pos == -1 or pos == len(item.production) - 1 or \
-       item.production[pos + 1] != symbol:
+        rhs = prod_rhs[item.prod_id]
+        if item.dot < len(rhs) and rhs[item.dot] == symbol:
+            kernel.append(item.advance())
+    if len(kernel) == 0:
         return set()
-    new_item = item.advance()
-    return closure(new_item, grammar)
+    return closure(kernel, grammar)
+
+
+class LR0Automaton(object):
+    """
+    The canonical collection of LR(0) item sets. State i has the kernel
+    kernels[i] and the item set states[i] (its closure); transitions[i]
+    maps the id of every symbol with a goto from state i to the target
+    state. State 0 is the closure of the augmented start production.
+    """
+
+    def __init__(self, grammar):
+        self.grammar = grammar
+        self.kernels = []
+        self.states = []
+        self.transitions = []
+
+    def goto(self, state, symbol):
+        """Target state of the goto on symbol (a name) or None"""
+        id_ = self.grammar.terminal_ids.get(symbol)
+        if id_ is None:
+            id_ = self.grammar.variable_ids.get(symbol)
+        return self.transitions[state].get(id_)
+
+
+def build_automaton(grammar, processes=None):
+    """
+    Worklist construction: every state is closed and its gotos computed
+    exactly once, and the kernels reached are looked up in a dict, so each
+    distinct kernel becomes exactly one state. States are numbered in the
+    order they are discovered, following the symbols in id order.
+
+    With processes > 1 the states are expanded by a pool of that many
+    processes instead (see _build_parallel), numbered the same way.
+    """
+    if processes is not None and processes > 1:
+        return _build_parallel(grammar, processes)
+    automaton = LR0Automaton(grammar)
+    start = grammar.get_productions_for_variable('#')[0].item(0)
+    prod_rhs = grammar.prod_rhs
+    state_of = {}
+    pending = deque()
+
+    def add_state(kernel):
+        state = state_of.get(kernel)
+        if state is None:
+            state = state_of[kernel] = len(automaton.kernels)
+            automaton.kernels.append(kernel)
+            automaton.states.append(None)
+            automaton.transitions.append({})
+            pending.append(state)
+        return state
+
+    add_state(frozenset([start]))
+    while len(pending) > 0:
+        state = pending.popleft()
+        items = closure(automaton.kernels[state], grammar)
+        automaton.states[state] = frozenset(items)
+        kernels = {}
+        for item in items:
+            rhs = prod_rhs[item.prod_id]
+            if item.dot < len(rhs):
+                kernels.setdefault(rhs[item.dot], []).append(item.advance())
+        transitions = automaton.transitions[state]
+        for symbol in sorted(kernels):
+            transitions[symbol] = add_state(frozenset(kernels[symbol]))
+    return automaton
+
+
+# the grammar of the worker processes of _build_parallel
+_worker_grammar = None
+
+
+def _init_worker(grammar):
+    global _worker_grammar
+    _worker_grammar = grammar
+
+
+def _expand(kernel):
+    """
+    Gotos of the kernel given as (prod_id, dot) pairs: returns [(symbol id,
+    kernel pairs)] by symbol. The closure is not sent back, the parent
+    takes it from the grammar's predictions.
+    """
+    grammar = _worker_grammar
+    productions = grammar.productions
+    prod_rhs = grammar.prod_rhs
+    items = closure(
+        [productions[prod_id].item(dot) for prod_id, dot in kernel],
+        grammar
+    )
+    kernels = {}
+    for item in items:
+        rhs = prod_rhs[item.prod_id]
+        if item.dot < len(rhs):
+            kernels.setdefault(rhs[item.dot], []).append(
+                (item.prod_id, item.dot + 1)
+            )
+    return [(symbol, tuple(sorted(kernels[symbol])))
+            for symbol in sorted(kernels)]
+
+
+def _build_parallel(grammar, processes):
+    """
+    The states discovered from one frontier only depend on that frontier,
+    so each frontier is expanded by the pool and the results are merged in
+    the order of its states, which numbers the new states exactly as the
+    sequential worklist does. Kernels travel as (prod_id, dot) pairs and
+    only the gotos come back; the parent closes each new kernel itself,
+    which is a union of cached predictions.
+    """
+    automaton = LR0Automaton(grammar)
+    productions = grammar.productions
+    start = grammar.get_productions_for_variable('#')[0]
+    # computed once here, so the workers get them with the grammar
+    grammar.predictions
+    state_of = {}
+    keys = []
+    frontier = []
+
+    def add_state(key):
+        state = state_of.get(key)
+        if state is None:
+            state = state_of[key] = len(keys)
+            keys.append(key)
+            kernel = frozenset(
+                productions[prod_id].item(dot) for prod_id, dot in key
+            )
+            automaton.kernels.append(kernel)
+            automaton.states.append(frozenset(closure(kernel, grammar)))
+            automaton.transitions.append({})
+            frontier.append(state)
+        return state
+
+    add_state(((start.id_, 0),))
+    pool = Pool(processes, _init_worker, (grammar,))
+    try:
+        while len(frontier) > 0:
+            level = frontier[:]
+            del frontier[:]
+            chunksize = max(1, len(level) // (processes * 4))
+            results = pool.map(
+                _expand,
+                [keys[state] for state in level],
+                chunksize
+            )
+            for state, gotos in zip(level, results):
+                transitions = automaton.transitions[state]
+                for symbol, key in gotos:
+                    transitions[symbol] = add_state(key)
+    finally:
+        pool.close()
+        pool.join()
+    return automaton
+
 
 def items(grammar):
-    c = [
-        closure(
-            [Item(grammar.get_productions_for_variable('#')[0], 0)],
-            grammar
+    return build_automaton(grammar).states
+
+
+class LRConflict(object):
+    def __init__(self, state, term, chosen, rejected):
+        self.state = state
+        self.term = term
+        self.chosen = chosen
+        self.rejected = rejected
+
+    def __str__(self):
+        return 'action[' + str(self.state) + '][' + self.term + ']: ' + \
+               self.chosen + ' (chosen) / ' + self.rejected
+
+
+class LRTable(object):
+    """
+    ACTION and GOTO tables of an LR parser over the interned grammar.
+    action_rows[state] maps the terminal ids with an action in state to it:
+    s > 0 to shift and go to state s, -(p + 1) to reduce by production p
+    (no shift goes back to state 0). Reducing by the augmented production
+    accepts. goto_rows[state] maps var - n_terminals to the state after
+    reducing to var. Missing entries are errors, 0 for get_action and
+    get_goto. action[state][term] and goto[state][var - n_terminals] are
+    the same as dense arrays, one per state, made on first use.
+
+    compress() replaces them with packed arrays, as yacc does: every state
+    gets a default reduction (its most common one) taken when it has no
+    other entry for the terminal, so errors may be noticed a few reductions
+    later but never missed, and every variable a default goto. The other
+    entries are packed with row displacement (runtime.pack_rows), like the
+    rows of DenseParseTable.
+
+    The columns of action are the terminal ids of the grammar, named by
+    terminal_names, until renumber_terminals puts them in the order of a
+    lexer's token ids.
+
+    lookaheads(state, prod_id) gives the bitset of terminals on which the
+    complete item of prod_id in state is reduced, which is all that tells
+    SLR, LALR and friends apart. Shift/reduce conflicts are resolved in
+    favour of the shift and reduce/reduce ones in favour of the production
+    defined first, as yacc does; both are recorded in conflicts.
+    """
+
+    def __init__(self, automaton, lookaheads, strict=False):
+        grammar = automaton.grammar
+        self.grammar = grammar
+        self.n_terminals = n_terminals = grammar.n_terminals
+        self.accept = len(grammar.productions) - 1
+        self.terminal_names = grammar.symbol_names[:n_terminals]
+        n_states = len(automaton.states)
+        big = max(n_states, len(grammar.productions) + 1) >= 2 ** 15
+        self.typecode = 'i' if big else 'h'
+        self.action_rows = []
+        self.goto_rows = []
+        self._action = self._goto = None
+        self.default_action = self.default_goto = None
+        self.action_base = self.action_check = self.action_value = None
+        self.goto_base = self.goto_check = self.goto_value = None
+        self.conflicts = []
+        prod_rhs = grammar.prod_rhs
+        for state, items in enumerate(automaton.states):
+            action = {}
+            goto = {}
+            for symbol, target in automaton.transitions[state].iteritems():
+                if symbol < n_terminals:
+                    action[symbol] = target
+                else:
+                    goto[symbol - n_terminals] = target
+            complete = sorted(item.prod_id for item in items
+                              if item.dot == len(prod_rhs[item.prod_id]))
+            for prod_id in complete:
+                for term in iter_bits(lookaheads(state, prod_id)):
+                    self._add_reduce(state, action, term, prod_id)
+            self.action_rows.append(action)
+            self.goto_rows.append(goto)
+        if strict and len(self.conflicts) > 0:
+            raise AmbiguousGrammar(self.conflicts)
+
+    def _add_reduce(self, state, action, term, prod_id):
+        current = action.get(term, 0)
+        if current == 0:
+            action[term] = -(prod_id + 1)
+            return
+        self.conflicts.append(LRConflict(
+            state,
+            self.grammar.symbol_names[term],
+            self.describe(current),
+            self.describe(-(prod_id + 1))
+        ))
+
+    def _dense(self, rows, width):
+        empty = array(self.typecode, [0]) * width
+        dense = []
+        for row in rows:
+            array_ = array(self.typecode, empty)
+            for column, value in row.iteritems():
+                array_[column] = value
+            dense.append(array_)
+        return dense
+
+    @property
+    def action(self):
+        """action_rows as arrays, None once compressed"""
+        if self._action is None and self.action_rows is not None:
+            self._action = self._dense(
+                self.action_rows,
+                len(self.terminal_names)
+            )
+        return self._action
+
+    @property
+    def goto(self):
+        """goto_rows as arrays, None once compressed"""
+        if self._goto is None and self.goto_rows is not None:
+            self._goto = self._dense(
+                self.goto_rows,
+                len(self.grammar.symbol_names) - self.n_terminals
+            )
+        return self._goto
+
+    def describe(self, action):
+        if action > 0:
+            return 'shift ' + str(action)
+        prod_id = -action - 1
+        if prod_id == self.accept:
+            return 'accept'
+        return 'reduce ' + str(self.grammar.productions[prod_id])
+
+    def get_action(self, state, term):
+        if self.action_rows is not None:
+            return self.action_rows[state].get(term, 0)
+        slot = self.action_base[state] + term
+        if self.action_check[slot] != state:
+            return self.default_action[state]
+        return self.action_value[slot]
+
+    def get_goto(self, state, var):
+        """Target of the goto on variable id var from state, 0 if none"""
+        index = var - self.n_terminals
+        if self.goto_rows is not None:
+            return self.goto_rows[state].get(index, 0)
+        slot = self.goto_base[index] + state
+        if self.goto_check[slot] != index:
+            return self.default_goto[index]
+        return self.goto_value[slot]
+
+    def expected(self, state):
+        """Names of the terminals with an action in state"""
+        names = self.terminal_names
+        if self.action_rows is not None:
+            return [names[term] for term in sorted(self.action_rows[state])
+                    if term >= END]
+        # errors are only found in states without a default reduction, but
+        # for accepting (which still needs the end of the input)
+        base = self.action_base[state]
+        expected = [names[term] for term in xrange(END, len(names))
+                    if self.action_check[base + term] == state]
+        if self.default_action[state] == -(self.accept + 1):
+            expected.append(names[END])
+        return expected
+
+    def bypass_unit_reductions(self):
+        """
+        Skips the reductions by unit productions A -> B in the states that do
+        nothing else: the goto on B that leads to such a state goes to the
+        goto on A instead (repeatedly, for chains like T -> F, E -> T).
+        Those productions are then never reduced, so the drivers do not call
+        reduce for them and their nodes are missing from the trees. Must be
+        called before compress. Returns the number of gotos changed.
+        """
+        if self.action_rows is None:
+            raise ValueError('The table is already compressed')
+        grammar = self.grammar
+        n_terminals = self.n_terminals
+        # the unit production reduced by every state that does nothing else
+        unit = [None] * len(self.action_rows)
+        for state, action in enumerate(self.action_rows):
+            acts = set(action.itervalues())
+            if len(acts) != 1:
+                continue
+            act = acts.pop()
+            prod_id = -act - 1
+            if act > 0 or prod_id == self.accept:
+                continue
+            rhs = grammar.prod_rhs[prod_id]
+            if len(rhs) == 1 and rhs[0] >= n_terminals:
+                unit[state] = prod_id
+        changed = 0
+        for goto in self.goto_rows:
+            for index, target in sorted(goto.iteritems()):
+                seen = set()
+                while target != 0 and unit[target] is not None and \
+                        target not in seen:
+                    seen.add(target)
+                    lhs = grammar.prod_lhs[unit[target]]
+                    target = goto.get(lhs - n_terminals, 0)
+                if target != goto[index]:
+                    goto[index] = target
+                    changed += 1
+        self._goto = None
+        return changed
+
+    def renumber_terminals(self, names):
+        """
+        Reorders the columns of action so the id of every terminal is its
+        index in names (the token names of a lexer, starting with '' and
+        '$' like the grammar's). Must be called before compress. Returns
+        the terminals of the grammar missing from names, which can never be
+        shifted.
+        """
+        if self.action_rows is None:
+            raise ValueError('The table is already compressed')
+        if list(names[:END + 1]) != self.terminal_names[:END + 1]:
+            raise ValueError("The names must start with '' and '$'")
+        position = dict((name, id_) for id_, name in enumerate(names))
+        missing = [name for name in self.terminal_names[END + 1:]
+                   if name not in position]
+        new_id = [position.get(name) for name in self.terminal_names]
+        self.action_rows = [
+            dict((new_id[term], act) for term, act in row.iteritems()
+                 if new_id[term] is not None)
+            for row in self.action_rows
+        ]
+        self._action = None
+        self.terminal_names = list(names)
+        return missing
+
+    def compress(self):
+        """
+        Packs the tables with default entries and row displacement, taking
+        the defaults and the packed entries straight from the sparse rows.
+        """
+        typecode = self.typecode
+        n_states = len(self.action_rows)
+        n_vars = len(self.grammar.symbol_names) - self.n_terminals
+        self.default_action = array(typecode, [0]) * n_states
+        action_rows = []
+        for state, action in enumerate(self.action_rows):
+            counts = {}
+            for act in action.itervalues():
+                if act < 0:
+                    counts[act] = counts.get(act, 0) + 1
+            if len(counts) > 0:
+                # ties go to the production defined first
+                default = min(counts, key=lambda act: (-counts[act], -act))
+                self.default_action[state] = default
+            default = self.default_action[state]
+            action_rows.append([(term, act) for term, act in action.iteritems()
+                                if act != default])
+        columns = [[] for index in xrange(n_vars)]
+        for state, goto in enumerate(self.goto_rows):
+            for index, target in goto.iteritems():
+                if target != 0:
+                    columns[index].append((state, target))
+        self.default_goto = array(typecode, [0]) * n_vars
+        goto_rows = []
+        for index, column in enumerate(columns):
+            counts = {}
+            for state, target in column:
+                counts[target] = counts.get(target, 0) + 1
+            if len(counts) > 0:
+                default = min(counts, key=lambda target: (-counts[target],
+                                                          target))
+                self.default_goto[index] = default
+            default = self.default_goto[index]
+            goto_rows.append([(state, target) for state, target in column
+                              if target != default])
+        self.action_base, self.action_check, self.action_value = pack_rows(
+            action_rows, len(self.terminal_names), typecode
         )
-    ]
-    added = True
-    while added:
-        added = False
-        update_set = set()
-        last_size = len(c)
-        print c
-        for citems in c:
-            for symbol in chain(grammar.terminals, grammar.variables):
-                goto_symbols = goto(citems, symbol, grammar)
-                if len(goto_symbols) > 0:
-                    update_set.update(goto_symbols)
-        if len(update_set) > 0:
-            c.append(update_set)
-        added = len(c) > last_size
-        last_size = len(c)
-    return c
+        self.goto_base, self.goto_check, self.goto_value = pack_rows(
+            goto_rows, n_states, typecode
+        )
+        self.action_rows = self.goto_rows = None
+        self._action = self._goto = None
+        return self
+
+
+def build_slr_table(grammar, automaton=None, strict=False):
+    """
+    SLR(1) table of grammar: a complete item A -> x. is reduced on every
+    terminal of FOLLOW(A). Useless symbols are not removed here, the table
+    has states and columns for them unless the grammar comes from
+    transform.reduce_grammar (as lrgen does).
+    """
+    if automaton is None:
+        automaton = build_automaton(grammar)
+    follow_bits = grammar.follow_bits
+    prod_lhs = grammar.prod_lhs
+    return LRTable(
+        automaton,
+        lambda state, prod_id: follow_bits[prod_lhs[prod_id]],
+        strict
+    )
+
+
+def token_ids(lexer, grammar):
+    """
+    Reads every token of lexer and returns the array of their terminal ids
+    (ending with the id of '$'), and the list of tokens (ending with None).
+    Token types the grammar does not know get the id of the empty string,
+    which never has an action.
+    """
+    terminal_ids = grammar.terminal_ids
+    typecode = 'h' if grammar.n_terminals < 2 ** 15 else 'i'
+    ids = array(typecode)
+    tokens = []
+    token = lexer.get_next_token()
+    while token is not None:
+        ids.append(terminal_ids.get(token.type_, EMPTY))
+        tokens.append(token)
+        token = lexer.get_next_token()
+    ids.append(END)
+    tokens.append(None)
+    return ids, tokens
+
+
+def _leaf(token):
+    return ParseNode(token.type_, token=token)
+
+
+def _node(production, children):
+    return ParseNode(production.variable.name, production, children)
+
+
+class LRParser(object):
+    """
+    Shift-reduce driver over an LRTable. It keeps an explicit stack of
+    states and one of values, so every token costs a constant amount of
+    work and stack (plus the reductions it triggers) whatever the
+    recursion of the grammar.
+    """
+
+    def __init__(self, grammar, table=None):
+        self.grammar = grammar
+        self.table = table if table is not None else build_slr_table(grammar)
+
+    def parse(self, lexer, reduce=None):
+        """
+        Parses the tokens of lexer. Without reduce the result is the parse
+        tree of ParseNodes. Otherwise reduce(production, values) is called
+        on every reduction with the values of the symbols of the production
+        (the tokens for terminals) and the result is what it returns for
+        the start symbol.
+        """
+        ids, tokens = token_ids(lexer, self.grammar)
+        return self.parse_ids(ids, tokens, reduce)
+
+    def events(self, lexer):
+        """
+        Generator of the shift and reduce events (see runtime) of parsing
+        the tokens of lexer. Tokens are read as they are needed and only the
+        stack is kept, so memory depends on the nesting of the input, not
+        its size.
+        """
+        table = self.table
+        get_action = table.get_action
+        get_goto = table.get_goto
+        accept = table.accept
+        terminal_ids = self.grammar.terminal_ids
+        prod_lhs = self.grammar.prod_lhs
+        prod_rhs = self.grammar.prod_rhs
+
+        states = [0]
+        # the position where every symbol in the stack starts
+        starts = []
+        position = 0
+        token = lexer.get_next_token()
+        term = END if token is None else terminal_ids.get(token.type_, EMPTY)
+        while True:
+            state = states[-1]
+            act = get_action(state, term)
+            if act > 0:
+                yield (SHIFT, term, position, token)
+                states.append(act)
+                starts.append(position)
+                position += 1
+                token = lexer.get_next_token()
+                term = END if token is None else \
+                    terminal_ids.get(token.type_, EMPTY)
+            elif act < 0:
+                prod_id = -act - 1
+                if prod_id == accept:
+                    if term != END:
+                        break
+                    return
+                size = len(prod_rhs[prod_id])
+                if size > 0:
+                    start = starts[-size]
+                    del starts[-size:]
+                    del states[-size:]
+                else:
+                    start = position
+                yield (REDUCE, prod_id, start, position)
+                starts.append(start)
+                states.append(get_goto(states[-1], prod_lhs[prod_id]))
+            else:
+                break
+        raise UnexpectedToken(token, table.expected(states[-1]))
+
+    def parse_ids(self, ids, tokens, reduce=None):
+        """Like parse, over the terminal ids and tokens of token_ids"""
+        if reduce is None:
+            shift = _leaf
+            reduce = _node
+        else:
+            shift = None
+        if self.table.action is None:
+            return self._parse_compressed(ids, tokens, shift, reduce)
+        table = self.table
+        action = table.action
+        goto = table.goto
+        accept = table.accept
+        n_terminals = table.n_terminals
+        productions = self.grammar.productions
+        prod_lhs = self.grammar.prod_lhs
+        prod_rhs = self.grammar.prod_rhs
+
+        states = [0]
+        values = []
+        state = 0
+        position = 0
+        term = ids[0]
+        while True:
+            act = action[state][term]
+            if act > 0:
+                token = tokens[position]
+                values.append(token if shift is None else shift(token))
+                states.append(act)
+                state = act
+                position += 1
+                term = ids[position]
+            elif act < 0:
+                prod_id = -act - 1
+                if prod_id == accept:
+                    if term != END:
+                        break
+                    return values[-1]
+                size = len(prod_rhs[prod_id])
+                if size > 0:
+                    children = values[-size:]
+                    del values[-size:]
+                    del states[-size:]
+                else:
+                    children = []
+                state = goto[states[-1]][prod_lhs[prod_id] - n_terminals]
+                states.append(state)
+                values.append(reduce(productions[prod_id], children))
+            else:
+                break
+        raise UnexpectedToken(tokens[position], table.expected(state))
+
+    def _parse_compressed(self, ids, tokens, shift, reduce):
+        """parse_ids over the packed arrays of a compressed LRTable"""
+        table = self.table
+        default_action = table.default_action
+        action_base = table.action_base
+        action_check = table.action_check
+        action_value = table.action_value
+        default_goto = table.default_goto
+        goto_base = table.goto_base
+        goto_check = table.goto_check
+        goto_value = table.goto_value
+        accept = table.accept
+        n_terminals = table.n_terminals
+        productions = self.grammar.productions
+        prod_lhs = self.grammar.prod_lhs
+        prod_rhs = self.grammar.prod_rhs
 
+        states = [0]
+        values = []
+        state = 0
+        position = 0
+        term = ids[0]
+        while True:
+            slot = action_base[state] + term
+            if action_check[slot] == state:
+                act = action_value[slot]
+            else:
+                act = default_action[state]
+            if act > 0:
+                token = tokens[position]
+                values.append(token if shift is None else shift(token))
+                states.append(act)
+                state = act
+                position += 1
+                term = ids[position]
+            elif act < 0:
+                prod_id = -act - 1
+                if prod_id == accept:
+                    if term != END:
+                        break
+                    return values[-1]
+                size = len(prod_rhs[prod_id])
+                if size > 0:
+                    children = values[-size:]
+                    del values[-size:]
+                    del states[-size:]
+                else:
+                    children = []
+                var = prod_lhs[prod_id] - n_terminals
+                slot = goto_base[var] + states[-1]
+                if goto_check[slot] == var:
+                    state = goto_value[slot]
+                else:
+                    state = default_goto[var]
+                states.append(state)
+                values.append(reduce(productions[prod_id], children))
+            else:
+                break
+        raise UnexpectedToken(tokens[position], table.expected(state))
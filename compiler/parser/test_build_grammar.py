@@ -3,12 +3,16 @@ from bnf_parser import build_grammar_and_commands
 from slr import items
 from itertools import chain
 import sys
+import os
 
 if __name__ == '__main__':
     filename = sys.argv[1]
     with open(filename) as f:
         code = f.read()
-    g, commands = build_grammar_and_commands(code)
+    g, commands = build_grammar_and_commands(
+        code,
+        os.path.dirname(filename)
+    )
     print str(g.variables)
     print str(g.terminals)
     print str(g.productions)
@@ -0,0 +1,50 @@
+#!/usr/bin/env python
+"""
+Checks that a grammar loaded back from the GrammarCache comes with its
+analysis: FIRST, FOLLOW and the predictions must not be computed again.
+
+    python -m compiler.parser.test_cache compiler/parser/example.bnf
+"""
+
+from bnf_parser import Grammar
+from cache import GrammarCache
+import shutil
+import sys
+import tempfile
+
+
+def _recomputed(grammar):
+    raise AssertionError('the analysis of the cached grammar was recomputed')
+
+
+def check(filename):
+    cache_dir = tempfile.mkdtemp()
+    try:
+        GrammarCache(cache_dir).load(filename)
+        builders = (Grammar._build_first, Grammar._build_follow,
+                    Grammar._build_predictions)
+        Grammar._build_first = Grammar._build_follow = \
+            Grammar._build_predictions = _recomputed
+        try:
+            grammar = GrammarCache(cache_dir).load(filename).grammar
+            grammar.first_bits
+            grammar.follow_bits
+            grammar.predictions
+        except AssertionError as e:
+            print filename + ': ' + str(e)
+            return False
+        finally:
+            (Grammar._build_first, Grammar._build_follow,
+             Grammar._build_predictions) = builders
+    finally:
+        shutil.rmtree(cache_dir)
+    print filename + ': analysis loaded from the cache'
+    return True
+
+
+if __name__ == '__main__':
+    if len(sys.argv) < 2:
+        raise ValueError('Required argument missing')
+    results = [check(filename) for filename in sys.argv[1:]]
+    if not all(results):
+        sys.exit(1)
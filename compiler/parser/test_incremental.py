@@ -0,0 +1,138 @@
+#!/usr/bin/env python
+"""
+Checks IncrementalParser.edit against parsing the edited tokens from
+scratch, with plain and compressed LALR(1) tables. Every edit either
+replaces the tokens of a random subtree with a new random derivation of its
+variable, or (one in four) inserts, deletes or replaces a single token,
+which usually makes the input wrong; then both parses must fail and edit
+must keep the previous tree.
+
+The arguments are .bnf files or benchmark shapes with their size:
+
+    python -m compiler.parser.test_incremental compiler/parser/example.bnf
+"""
+
+from incremental import IncrementalParser
+from lalr import build_lalr_table
+from runtime import UnexpectedToken
+from slr import build_automaton
+from test_lr_tables import Token, load_argument, production_heights, \
+    random_edit, random_sentence
+import random
+import sys
+
+EDITS = 300
+
+
+def _subtrees(tree):
+    """(node, start) of every variable node of tree, by its first token"""
+    subtrees = []
+    pending = [(tree, 0)]
+    while len(pending) > 0:
+        node, start = pending.pop()
+        if node.production is None:
+            continue
+        subtrees.append((node, start))
+        for child in reversed(node.children):
+            pending.append((child, start))
+            start += child.width
+    return subtrees
+
+
+def same_tree(tree, other):
+    pending = [(tree, other)]
+    while len(pending) > 0:
+        node, other = pending.pop()
+        if node.symbol != other.symbol or node.width != other.width or \
+           node.production is not other.production or \
+           node.token is not other.token or \
+           len(node.children) != len(other.children):
+            return False
+        pending.extend(zip(node.children, other.children))
+    return True
+
+
+def _parse(grammar, table, tokens):
+    try:
+        return IncrementalParser(grammar, table).parse(tokens)
+    except UnexpectedToken:
+        return None
+
+
+def check(argument, table_name, grammar, table, rng):
+    prod_heights = production_heights(grammar)
+    parser = IncrementalParser(grammar, table)
+    tokens = [Token(type_)
+              for type_ in random_sentence(grammar, rng, prod_heights)]
+    parser.parse(tokens)
+    errors = []
+    reused = 0
+    for i in xrange(EDITS):
+        tokens = parser.tokens
+        if rng.randint(0, 3) == 0:
+            edited = random_edit(grammar, rng, [t.type_ for t in tokens])
+            # the edit is the part that differs from tokens
+            start = 0
+            while start < min(len(edited), len(tokens)) and \
+                    edited[start] == tokens[start].type_:
+                start += 1
+            end = len(tokens)
+            new_end = len(edited)
+            while end > start and new_end > start and \
+                    edited[new_end - 1] == tokens[end - 1].type_:
+                end -= 1
+                new_end -= 1
+            new_tokens = [Token(type_) for type_ in edited[start:new_end]]
+        else:
+            node, start = rng.choice(_subtrees(parser.tree))
+            end = start + node.width
+            new_tokens = [Token(type_) for type_ in random_sentence(
+                grammar,
+                rng,
+                prod_heights,
+                node.symbol
+            )]
+        previous = parser.tree
+        expected = _parse(
+            grammar,
+            table,
+            tokens[:start] + new_tokens + tokens[end:]
+        )
+        try:
+            tree = parser.edit(start, end, new_tokens)
+        except UnexpectedToken:
+            if expected is not None:
+                errors.append('edit %d rejected, a full parse accepts' % i)
+            elif parser.tree is not previous:
+                errors.append('edit %d lost the previous tree' % i)
+            continue
+        reused += parser.reused
+        if expected is None:
+            errors.append('edit %d accepted, a full parse rejects' % i)
+        elif not same_tree(tree, expected):
+            errors.append('edit %d differs from a full parse' % i)
+    print '%s (%s table): %d edits, %d subtrees reused' % (
+        argument,
+        table_name,
+        EDITS,
+        reused
+    )
+    for error in errors:
+        print '  ' + error
+    return len(errors) == 0
+
+
+if __name__ == '__main__':
+    if len(sys.argv) < 2:
+        raise ValueError('Required argument missing')
+    rng = random.Random(0)
+    results = []
+    for argument in sys.argv[1:]:
+        grammar = load_argument(argument)
+        automaton = build_automaton(grammar)
+        plain = build_lalr_table(grammar, automaton)
+        compressed = build_lalr_table(grammar, automaton).compress()
+        for name, table in (('plain', plain), ('compressed', compressed)):
+            results.append(check(argument, name, grammar, table, rng))
+    if not all(results):
+        sys.exit(1)
@@ -0,0 +1,211 @@
+#!/usr/bin/env python
+"""
+Checks the LR tables of grammars against each other:
+
+* every shift of the LALR(1) table is in the SLR(1) table, and every
+  reduction too unless the SLR table has a conflict there (LALR lookaheads
+  are a subset of FOLLOW)
+* random sentences of the grammar are accepted by the LALR table, and, if
+  the SLR table has no conflicts, random sentences and random edits of them
+  are accepted and rejected alike by both
+* the compressed LALR table (see LRTable.compress) and the one without unit
+  reductions (see LRTable.bypass_unit_reductions), compressed or not, accept
+  and reject them like the plain one
+
+The arguments are .bnf files or benchmark shapes with their size:
+
+    python -m compiler.parser.test_lr_tables compiler/parser/lvalue.bnf expr:4
+"""
+
+from benchmark import SHAPES
+from bnf_parser import END, build_grammar_and_commands
+from lalr import build_lalr_table
+from runtime import UnexpectedToken
+from slr import LRParser, build_automaton, build_slr_table
+import random
+import sys
+
+SENTENCES = 200
+MAX_DEPTH = 8
+
+
+class Token(object):
+    def __init__(self, type_):
+        self.type_ = type_
+        self.lexeme = type_
+
+
+class _ListLexer(object):
+    def __init__(self, types):
+        self.tokens = iter([Token(type_) for type_ in types])
+
+    def get_next_token(self):
+        return next(self.tokens, None)
+
+
+def load_argument(argument):
+    if ':' in argument:
+        shape, size = argument.split(':')
+        code = SHAPES[shape](int(size))
+    else:
+        with open(argument) as f:
+            code = f.read()
+    grammar, commands = build_grammar_and_commands(code)
+    return grammar
+
+
+def production_heights(grammar):
+    """Height of the lowest derivation tree of every symbol and production"""
+    n_terminals = grammar.n_terminals
+    symbol_heights = [0] * n_terminals + \
+        [None] * (len(grammar.symbol_names) - n_terminals)
+    prod_heights = [None] * len(grammar.prod_rhs)
+    changed = True
+    while changed:
+        changed = False
+        for prod_id, rhs in enumerate(grammar.prod_rhs):
+            heights = [symbol_heights[sym] for sym in rhs]
+            if None in heights:
+                continue
+            height = 1 + max(heights + [0])
+            if prod_heights[prod_id] is None or height < prod_heights[prod_id]:
+                prod_heights[prod_id] = height
+                lhs = grammar.prod_lhs[prod_id]
+                if symbol_heights[lhs] is None or \
+                   height < symbol_heights[lhs]:
+                    symbol_heights[lhs] = height
+                changed = True
+    return prod_heights
+
+
+def random_sentence(grammar, rng, prod_heights, variable=None):
+    """
+    Terminal names of a random derivation of variable (a name, the start
+    symbol by default)
+    """
+    if variable is None:
+        variable = grammar.start
+    names = grammar.symbol_names
+    sentence = []
+    pending = [(grammar.variable_ids[variable], 0)]
+    while len(pending) > 0:
+        sym, depth = pending.pop()
+        if sym < grammar.n_terminals:
+            sentence.append(names[sym])
+            continue
+        prods = [prod_id for prod_id in grammar.prods_of[sym]
+                 if prod_heights[prod_id] is not None]
+        if depth >= MAX_DEPTH:
+            # head for the shortest way out
+            lowest = min(prod_heights[prod_id] for prod_id in prods)
+            prods = [prod_id for prod_id in prods
+                     if prod_heights[prod_id] == lowest]
+        rhs = grammar.prod_rhs[rng.choice(prods)]
+        pending.extend((child, depth + 1) for child in reversed(rhs))
+    return sentence
+
+
+def random_edit(grammar, rng, sentence):
+    """sentence with a token deleted, inserted or replaced"""
+    terminals = grammar.symbol_names[END + 1:grammar.n_terminals]
+    edited = list(sentence)
+    position = rng.randint(0, len(edited))
+    choice = rng.randint(0, 2)
+    if choice == 0 and position < len(edited):
+        del edited[position]
+    elif choice == 1 or position == len(edited):
+        edited.insert(position, rng.choice(terminals))
+    else:
+        edited[position] = rng.choice(terminals)
+    return edited
+
+
+def accepts(parser, sentence):
+    try:
+        parser.parse(_ListLexer(sentence))
+    except UnexpectedToken:
+        return False
+    return True
+
+
+def compare_tables(grammar, lalr, slr):
+    """Errors of the LALR entries that are not in the SLR table"""
+    errors = []
+    conflicted = set((conflict.state, conflict.term)
+                     for conflict in slr.conflicts)
+    names = grammar.symbol_names
+    for state in xrange(len(lalr.action)):
+        for term in xrange(END, grammar.n_terminals):
+            act = lalr.action[state][term]
+            if act == 0 or act == slr.action[state][term]:
+                continue
+            if act < 0 and (state, names[term]) in conflicted:
+                continue
+            errors.append('state %d, %s: LALR %s, SLR %s' % (
+                state,
+                names[term],
+                lalr.describe(act),
+                slr.describe(slr.action[state][term])
+            ))
+    return errors
+
+
+def check(argument, rng):
+    grammar = load_argument(argument)
+    automaton = build_automaton(grammar)
+    slr = build_slr_table(grammar, automaton)
+    lalr = build_lalr_table(grammar, automaton)
+    print '%s: %d states, %d SLR conflicts, %d LALR conflicts' % (
+        argument,
+        len(automaton.states),
+        len(slr.conflicts),
+        len(lalr.conflicts)
+    )
+    errors = compare_tables(grammar, lalr, slr)
+
+    prod_heights = production_heights(grammar)
+    lalr_parser = LRParser(grammar, lalr)
+    # the tables checked against the plain LALR one
+    bypassed = build_lalr_table(grammar, automaton)
+    bypassed.bypass_unit_reductions()
+    bypassed_compressed = build_lalr_table(grammar, automaton)
+    bypassed_compressed.bypass_unit_reductions()
+    others = [
+        ('compressed LALR',
+         LRParser(grammar, build_lalr_table(grammar, automaton).compress())),
+        ('LALR without units', LRParser(grammar, bypassed)),
+        ('compressed LALR without units',
+         LRParser(grammar, bypassed_compressed.compress())),
+    ]
+    if len(slr.conflicts) == 0:
+        others.append(('SLR', LRParser(grammar, slr)))
+    rejected = 0
+    for i in xrange(SENTENCES):
+        sentence = random_sentence(grammar, rng, prod_heights)
+        if not accepts(lalr_parser, sentence):
+            errors.append('LALR rejects ' + ' '.join(sentence))
+        edited = random_edit(grammar, rng, sentence)
+        lalr_accepts = accepts(lalr_parser, edited)
+        rejected += not lalr_accepts
+        for name, parser in others:
+            for tokens, expected in ((sentence, True), (edited, lalr_accepts)):
+                if accepts(parser, tokens) != expected:
+                    errors.append(name + ' and LALR differ on ' +
+                                  ' '.join(tokens))
+    print '  %d sentences and edits, %d edits rejected' % (
+        SENTENCES,
+        rejected
+    )
+    print '  checked ' + ', '.join(name for name, parser in others)
+    for error in errors:
+        print '  ' + error
+    return len(errors) == 0
+
+
+if __name__ == '__main__':
+    if len(sys.argv) < 2:
+        raise ValueError('Required argument missing')
+    rng = random.Random(0)
+    results = [check(argument, rng) for argument in sys.argv[1:]]
+    if not all(results):
+        sys.exit(1)
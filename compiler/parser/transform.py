@@ -0,0 +1,272 @@
+"""
+Grammar transformations: removal of useless symbols, and the removal of left
+recursion and left factoring that make a grammar suitable for a predictive
+(LL(1)) parser.
+
+They return a new Grammar; the variables they introduce are named after the
+variable they come from, like the hand written examplenonleftrecursive.bnf
+(<E-prime> for <E>, <E-factor> for the common prefixes of <E>).
+"""
+
+from bnf_parser import END, Grammar, Production, Variable
+from collections import deque
+from digraph import digraph
+
+
+def _split(grammar):
+    """
+    The start symbol and the productions of grammar (without the one of the
+    augmented start '#') as an ordered {name: [body]} where the bodies are
+    lists of symbols and [] is the empty string.
+    """
+    start = grammar.productions[-1].production[0]
+    order = []
+    bodies = {}
+    seen = set()
+    for prod in grammar.productions[:-1]:
+        name = prod.variable.name
+        if name not in bodies:
+            order.append(name)
+            bodies[name] = []
+        body = [sym for sym in prod.production if sym != '']
+        if (name, tuple(body)) not in seen:
+            seen.add((name, tuple(body)))
+            bodies[name].append(body)
+    return start, order, bodies
+
+
+def _join(start, order, bodies):
+    prods = []
+    for name in order:
+        variable = Variable(name)
+        for body in bodies[name]:
+            if len(body) == 0:
+                body = ['']
+            prods.append(Production(variable, body))
+    return Grammar(set(), set(), start, prods)
+
+
+def _fresh_name(name, suffix, taken):
+    candidate = name + '-' + suffix
+    counter = 2
+    while candidate in taken:
+        candidate = name + '-' + suffix + str(counter)
+        counter += 1
+    taken.add(candidate)
+    return candidate
+
+
+def _left_recursive(order, bodies):
+    """
+    Variables that can derive a string starting with themselves, found by
+    closing the 'leftmost symbol' relation over the grammar.
+    """
+    relation = dict((name, set()) for name in order)
+    for name in order:
+        for body in bodies[name]:
+            if len(body) > 0 and isinstance(body[0], Variable) and \
+               body[0].name in bodies:
+                relation[name].add(body[0].name)
+    initial = dict((name, frozenset(relation[name])) for name in order)
+    reachable = digraph(order, relation, initial)
+    return set(name for name in order if name in reachable[name])
+
+
+def remove_left_recursion(grammar):
+    """
+    Removes direct and indirect left recursion. For every left recursive
+    variable Ai (in order of definition) the productions Ai -> Aj x with Aj
+    an earlier left recursive variable are expanded with the productions of
+    Aj, and then the direct recursion Ai -> Ai x | y is rewritten as
+    Ai -> y Ai-prime, Ai-prime -> x Ai-prime | "".
+
+    Left recursion hidden behind nullable symbols (A -> B A with B
+    nullable) is not visible to this method and is left as it is.
+    """
+    start, order, bodies = _split(grammar)
+    recursive = _left_recursive(order, bodies)
+    if len(recursive) == 0:
+        return grammar
+    taken = set(order)
+    new_order = []
+    done = []
+    for name in order:
+        new_order.append(name)
+        if name not in recursive:
+            continue
+        for previous in done:
+            expanded = []
+            for body in bodies[name]:
+                if len(body) > 0 and body[0] == Variable(previous):
+                    for other in bodies[previous]:
+                        expanded.append(other + body[1:])
+                else:
+                    expanded.append(body)
+            bodies[name] = expanded
+        done.append(name)
+
+        variable = Variable(name)
+        recursions = [body[1:] for body in bodies[name]
+                      if len(body) > 0 and body[0] == variable]
+        if len(recursions) == 0:
+            continue
+        prime = Variable(_fresh_name(name, 'prime', taken))
+        bodies[name] = [body + [prime] for body in bodies[name]
+                        if len(body) == 0 or body[0] != variable]
+        # A -> A derives nothing new, so it is dropped
+        bodies[prime.name] = [body + [prime] for body in recursions
+                              if len(body) > 0] + [[]]
+        new_order.append(prime.name)
+    return _join(start, new_order, bodies)
+
+
+def left_factor(grammar):
+    """
+    Rewrites A -> x y1 | x y2 (with x the longest prefix shared by the
+    productions starting with the same symbol) as A -> x A-factor,
+    A-factor -> y1 | y2, until no two productions of a variable start with
+    the same symbol.
+    """
+    start, order, bodies = _split(grammar)
+    taken = set(order)
+    new_order = []
+    pending = deque(order)
+    changed = False
+    while len(pending) > 0:
+        name = pending.popleft()
+        new_order.append(name)
+        groups = []
+        by_first = {}
+        for body in bodies[name]:
+            key = body[0] if len(body) > 0 else None
+            if key not in by_first:
+                group = by_first[key] = []
+                groups.append(group)
+            by_first[key].append(body)
+        factored = []
+        for group in groups:
+            if len(group) == 1:
+                factored.append(group[0])
+                continue
+            prefix = _common_prefix(group)
+            factor = Variable(_fresh_name(name, 'factor', taken))
+            factored.append(prefix + [factor])
+            bodies[factor.name] = [body[len(prefix):] for body in group]
+            # the new variable may need to be factored too
+            pending.append(factor.name)
+            changed = True
+        bodies[name] = factored
+    if not changed:
+        return grammar
+    return _join(start, new_order, bodies)
+
+
+def _common_prefix(group):
+    prefix = []
+    for symbols in zip(*group):
+        if any(sym != symbols[0] for sym in symbols[1:]):
+            break
+        prefix.append(symbols[0])
+    return prefix
+
+
+class ReductionReport(object):
+    def __init__(self, non_generating, unreachable, unused_terminals, removed):
+        self.non_generating = non_generating
+        self.unreachable = unreachable
+        self.unused_terminals = unused_terminals
+        self.removed = removed
+
+    def __str__(self):
+        return '\n'.join([
+            'Non generating variables: ' + ', '.join(self.non_generating),
+            'Unreachable variables: ' + ', '.join(self.unreachable),
+            'Unused terminals: ' + ', '.join(self.unused_terminals),
+            'Removed productions: ' + str(len(self.removed)),
+        ])
+
+
+def reduce_grammar(grammar):
+    """
+    Removes the variables that cannot derive any string of terminals and
+    then the symbols that cannot be reached from the start symbol, together
+    with every production using them. Only the interned productions are
+    looked at, so the original grammar is never analyzed.
+
+    Returns the reduced grammar (grammar itself if nothing was removed)
+    and a ReductionReport. to_ll1 and lrgen apply it, the LR table builders
+    take the grammar as it is given.
+    """
+    n_terminals = grammar.n_terminals
+    n_symbols = len(grammar.symbol_names)
+    lhs = grammar.prod_lhs
+    rhs = grammar.prod_rhs
+
+    # a production generates once all the variables in it generate
+    missing = [0] * len(rhs)
+    uses = [[] for i in xrange(n_symbols)]
+    for prod_id, symbols in enumerate(rhs):
+        for sym in symbols:
+            if sym >= n_terminals:
+                missing[prod_id] += 1
+                uses[sym].append(prod_id)
+    generating = [id_ < n_terminals for id_ in xrange(n_symbols)]
+    worklist = [lhs[prod_id] for prod_id in xrange(len(rhs))
+                if missing[prod_id] == 0]
+    while len(worklist) > 0:
+        var = worklist.pop()
+        if generating[var]:
+            continue
+        generating[var] = True
+        for prod_id in uses[var]:
+            missing[prod_id] -= 1
+            if missing[prod_id] == 0:
+                worklist.append(lhs[prod_id])
+
+    start = grammar.variable_ids['#']
+    if not generating[start]:
+        raise ValueError('The grammar does not generate any string')
+
+    reachable = [False] * n_symbols
+    reachable[start] = True
+    worklist = [start]
+    while len(worklist) > 0:
+        var = worklist.pop()
+        for prod_id in grammar.prods_of[var]:
+            if missing[prod_id] > 0:
+                continue
+            for sym in rhs[prod_id]:
+                if not reachable[sym]:
+                    reachable[sym] = True
+                    if sym >= n_terminals:
+                        worklist.append(sym)
+
+    kept = []
+    removed = []
+    for prod in grammar.productions[:-1]:
+        if reachable[lhs[prod.id_]] and missing[prod.id_] == 0:
+            kept.append(
+                Production(prod.variable, prod.production, prod.action)
+            )
+        else:
+            removed.append(prod)
+    names = grammar.symbol_names
+    report = ReductionReport(
+        [names[id_] for id_ in xrange(n_terminals, n_symbols)
+         if not generating[id_]],
+        [names[id_] for id_ in xrange(n_terminals, n_symbols)
+         if generating[id_] and not reachable[id_]],
+        [names[id_] for id_ in xrange(END + 1, n_terminals)
+         if not reachable[id_]],
+        removed
+    )
+    if len(removed) == 0:
+        return grammar, report
+    start_symbol = grammar.productions[-1].production[0]
+    return Grammar(set(), set(), start_symbol, kept), report
+
+
+def to_ll1(grammar):
+    """The pipeline applied before building a predictive parser table"""
+    grammar, report = reduce_grammar(grammar)
+    return left_factor(remove_left_recursion(grammar))
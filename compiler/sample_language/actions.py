@@ -0,0 +1,112 @@
+"""
+Semantic actions of lang.bnf. They emit the quadruples of the program into
+the QTable of a Translation while it is parsed, backpatching the jumps like
+the expressions of defs.py do, but without building the expressions first.
+
+The values are the names of the places of expressions, the (true, false)
+lists of jumps of conditions, the list of jumps to the next statement of
+statements, and the next instruction for markers.
+"""
+
+from ..ir import Environment, QTable, Quadruple, UndefinedVariableException
+from ..ir import get_next_temp
+
+
+class Translation(object):
+    """The context of the actions: the QTable being filled and the names"""
+
+    def __init__(self, env=None):
+        self.qtable = QTable()
+        self.env = env if env is not None else Environment()
+
+    def emit(self, op, arg1, arg2, result):
+        """Appends the quadruple and returns its index"""
+        index = self.qtable.next_instruction
+        self.qtable.append(Quadruple(op, arg1, arg2, result))
+        return index
+
+    def backpatch(self, jumps, target):
+        for inst in jumps:
+            self.qtable[inst].result = str(target)
+
+    def lookup(self, name):
+        symbol = self.env.get(name)
+        if symbol is None:
+            raise UndefinedVariableException(name)
+        return symbol['name']
+
+
+def program(translation, values):
+    translation.backpatch(values[0], translation.qtable.next_instruction)
+    return translation.qtable
+
+
+def statements(translation, values):
+    translation.backpatch(values[0], values[1])
+    return values[2]
+
+
+def definition(translation, values):
+    type_, name = values[0].lexeme, values[1].lexeme
+    translation.env.put(name, {'type': type_, 'name': name})
+    return []
+
+
+def assignment(translation, values):
+    name = translation.lookup(values[0].lexeme)
+    translation.emit('=', values[2], None, name)
+    return []
+
+
+def if_statement(translation, values):
+    true, false = values[2]
+    translation.backpatch(true, values[4])
+    return false + values[5]
+
+
+def while_statement(translation, values):
+    before_loop = values[1]
+    true, false = values[3]
+    translation.backpatch(values[6], before_loop)
+    translation.backpatch(true, values[5])
+    translation.emit('goto', None, None, str(before_loop))
+    return false
+
+
+def block(translation, values):
+    return values[1]
+
+
+def empty_block(translation, values):
+    return []
+
+
+def comparison(translation, values):
+    left, relop, right = values
+    true = translation.emit('if' + relop.lexeme, left, right, None)
+    false = translation.emit('goto', None, None, None)
+    return [true], [false]
+
+
+def operation(translation, values):
+    left, op, right = values
+    name = 't' + str(get_next_temp())
+    translation.env.put(name, {'type': 'int', 'name': name, 'temp': True})
+    translation.emit(op.lexeme, left, right, name)
+    return name
+
+
+def symbol(translation, values):
+    return translation.lookup(values[0].lexeme)
+
+
+def constant(translation, values):
+    return values[0].lexeme
+
+
+def parenthesized(translation, values):
+    return values[1]
+
+
+def marker(translation, values):
+    return translation.qtable.next_instruction
@@ -0,0 +1,235 @@
+
+from array import array
+
+TOKEN_NAMES = ['', '$', 'ASSIGN', 'CLOSE_BRACE', 'CLOSE_PARENS', 'ID', 'IF', 'MUL_OPERATOR', 'NUMBER', 'OPEN_BRACE', 'OPEN_PARENS', 'RELOP', 'SEMICOLON', 'SUM_OPERATOR', 'WHILE']
+END = 1
+# transitions of every DFA state, and the id of the token it accepts (or 0)
+TRANSITIONS = [
+    {')': 2, '(': 1, '+': 4, '*': 3, '-': 5, '/': 6, '1': 8, '0': 7, '3': 10, '2': 9, '5': 12, '4': 11, '7': 14, '6': 13, '9': 16, '8': 15, ';': 17, '=': 19, '<': 18, '>': 20, 'A': 21, 'C': 23, 'B': 22, 'E': 25, 'D': 24, 'G': 27, 'F': 26, 'I': 29, 'H': 28, 'K': 31, 'J': 30, 'M': 33, 'L': 32, 'O': 35, 'N': 34, 'Q': 37, 'P': 36, 'S': 39, 'R': 38, 'U': 41, 'T': 40, 'W': 43, 'V': 42, 'Y': 45, 'X': 44, 'Z': 46, '_': 47, 'a': 48, 'c': 50, 'b': 49, 'e': 52, 'd': 51, 'g': 54, 'f': 53, 'i': 56, 'h': 55, 'k': 58, 'j': 57, 'm': 60, 'l': 59, 'o': 62, 'n': 61, 'q': 64, 'p': 63, 's': 66, 'r': 65, 'u': 68, 't': 67, 'w': 70, 'v': 69, 'y': 72, 'x': 71, '{': 74, 'z': 73, '}': 75},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {'1': 77, '0': 76, '3': 79, '2': 78, '5': 81, '4': 80, '7': 83, '6': 82, '9': 85, '8': 84},
+    {'1': 77, '0': 76, '3': 79, '2': 78, '5': 81, '4': 80, '7': 83, '6': 82, '9': 85, '8': 84},
+    {'1': 77, '0': 76, '3': 79, '2': 78, '5': 81, '4': 80, '7': 83, '6': 82, '9': 85, '8': 84},
+    {'1': 77, '0': 76, '3': 79, '2': 78, '5': 81, '4': 80, '7': 83, '6': 82, '9': 85, '8': 84},
+    {'1': 77, '0': 76, '3': 79, '2': 78, '5': 81, '4': 80, '7': 83, '6': 82, '9': 85, '8': 84},
+    {'1': 77, '0': 76, '3': 79, '2': 78, '5': 81, '4': 80, '7': 83, '6': 82, '9': 85, '8': 84},
+    {'1': 77, '0': 76, '3': 79, '2': 78, '5': 81, '4': 80, '7': 83, '6': 82, '9': 85, '8': 84},
+    {'1': 77, '0': 76, '3': 79, '2': 78, '5': 81, '4': 80, '7': 83, '6': 82, '9': 85, '8': 84},
+    {'1': 77, '0': 76, '3': 79, '2': 78, '5': 81, '4': 80, '7': 83, '6': 82, '9': 85, '8': 84},
+    {'1': 77, '0': 76, '3': 79, '2': 78, '5': 81, '4': 80, '7': 83, '6': 82, '9': 85, '8': 84},
+    {},
+    {'=': 86},
+    {'=': 87},
+    {'=': 88},
+    {'1': 90, '0': 89, '3': 92, '2': 91, '5': 94, '4': 93, '7': 96, '6': 95, '9': 98, '8': 97, 'A': 99, 'C': 101, 'B': 100, 'E': 103, 'D': 102, 'G': 105, 'F': 104, 'I': 107, 'H': 106, 'K': 109, 'J': 108, 'M': 111, 'L': 110, 'O': 113, 'N': 112, 'Q': 115, 'P': 114, 'S': 117, 'R': 116, 'U': 119, 'T': 118, 'W': 121, 'V': 120, 'Y': 123, 'X': 122, 'Z': 124, '_': 125, 'a': 126, 'c': 128, 'b': 127, 'e': 130, 'd': 129, 'g': 132, 'f': 131, 'i': 134, 'h': 133, 'k': 136, 'j': 135, 'm': 138, 'l': 137, 'o': 140, 'n': 139, 'q': 142, 'p': 141, 's': 144, 'r': 143, 'u': 146, 't': 145, 'w': 148, 'v': 147, 'y': 150, 'x': 149, 'z': 151},
+    {'1': 90, '0': 89, '3': 92, '2': 91, '5': 94, '4': 93, '7': 96, '6': 95, '9': 98, '8': 97, 'A': 99, 'C': 101, 'B': 100, 'E': 103, 'D': 102, 'G': 105, 'F': 104, 'I': 107, 'H': 106, 'K': 109, 'J': 108, 'M': 111, 'L': 110, 'O': 113, 'N': 112, 'Q': 115, 'P': 114, 'S': 117, 'R': 116, 'U': 119, 'T': 118, 'W': 121, 'V': 120, 'Y': 123, 'X': 122, 'Z': 124, '_': 125, 'a': 126, 'c': 128, 'b': 127, 'e': 130, 'd': 129, 'g': 132, 'f': 131, 'i': 134, 'h': 133, 'k': 136, 'j': 135, 'm': 138, 'l': 137, 'o': 140, 'n': 139, 'q': 142, 'p': 141, 's': 144, 'r': 143, 'u': 146, 't': 145, 'w': 148, 'v': 147, 'y': 150, 'x': 149, 'z': 151},
+    {'1': 90, '0': 89, '3': 92, '2': 91, '5': 94, '4': 93, '7': 96, '6': 95, '9': 98, '8': 97, 'A': 99, 'C': 101, 'B': 100, 'E': 103, 'D': 102, 'G': 105, 'F': 104, 'I': 107, 'H': 106, 'K': 109, 'J': 108, 'M': 111, 'L': 110, 'O': 113, 'N': 112, 'Q': 115, 'P': 114, 'S': 117, 'R': 116, 'U': 119, 'T': 118, 'W': 121, 'V': 120, 'Y': 123, 'X': 122, 'Z': 124, '_': 125, 'a': 126, 'c': 128, 'b': 127, 'e': 130, 'd': 129, 'g': 132, 'f': 131, 'i': 134, 'h': 133, 'k': 136, 'j': 135, 'm': 138, 'l': 137, 'o': 140, 'n': 139, 'q': 142, 'p': 141, 's': 144, 'r': 143, 'u': 146, 't': 145, 'w': 148, 'v': 147, 'y': 150, 'x': 149, 'z': 151},
+    {'1': 90, '0': 89, '3': 92, '2': 91, '5': 94, '4': 93, '7': 96, '6': 95, '9': 98, '8': 97, 'A': 99, 'C': 101, 'B': 100, 'E': 103, 'D': 102, 'G': 105, 'F': 104, 'I': 107, 'H': 106, 'K': 109, 'J': 108, 'M': 111, 'L': 110, 'O': 113, 'N': 112, 'Q': 115, 'P': 114, 'S': 117, 'R': 116, 'U': 119, 'T': 118, 'W': 121, 'V': 120, 'Y': 123, 'X': 122, 'Z': 124, '_': 125, 'a': 126, 'c': 128, 'b': 127, 'e': 130, 'd': 129, 'g': 132, 'f': 131, 'i': 134, 'h': 133, 'k': 136, 'j': 135, 'm': 138, 'l': 137, 'o': 140, 'n': 139, 'q': 142, 'p': 141, 's': 144, 'r': 143, 'u': 146, 't': 145, 'w': 148, 'v': 147, 'y': 150, 'x': 149, 'z': 151},
+    {'1': 90, '0': 89, '3': 92, '2': 91, '5': 94, '4': 93, '7': 96, '6': 95, '9': 98, '8': 97, 'A': 99, 'C': 101, 'B': 100, 'E': 103, 'D': 102, 'G': 105, 'F': 104, 'I': 107, 'H': 106, 'K': 109, 'J': 108, 'M': 111, 'L': 110, 'O': 113, 'N': 112, 'Q': 115, 'P': 114, 'S': 117, 'R': 116, 'U': 119, 'T': 118, 'W': 121, 'V': 120, 'Y': 123, 'X': 122, 'Z': 124, '_': 125, 'a': 126, 'c': 128, 'b': 127, 'e': 130, 'd': 129, 'g': 132, 'f': 131, 'i': 134, 'h': 133, 'k': 136, 'j': 135, 'm': 138, 'l': 137, 'o': 140, 'n': 139, 'q': 142, 'p': 141, 's': 144, 'r': 143, 'u': 146, 't': 145, 'w': 148, 'v': 147, 'y': 150, 'x': 149, 'z': 151},
+    {'1': 90, '0': 89, '3': 92, '2': 91, '5': 94, '4': 93, '7': 96, '6': 95, '9': 98, '8': 97, 'A': 99, 'C': 101, 'B': 100, 'E': 103, 'D': 102, 'G': 105, 'F': 104, 'I': 107, 'H': 106, 'K': 109, 'J': 108, 'M': 111, 'L': 110, 'O': 113, 'N': 112, 'Q': 115, 'P': 114, 'S': 117, 'R': 116, 'U': 119, 'T': 118, 'W': 121, 'V': 120, 'Y': 123, 'X': 122, 'Z': 124, '_': 125, 'a': 126, 'c': 128, 'b': 127, 'e': 130, 'd': 129, 'g': 132, 'f': 131, 'i': 134, 'h': 133, 'k': 136, 'j': 135, 'm': 138, 'l': 137, 'o': 140, 'n': 139, 'q': 142, 'p': 141, 's': 144, 'r': 143, 'u': 146, 't': 145, 'w': 148, 'v': 147, 'y': 150, 'x': 149, 'z': 151},
+    {'1': 90, '0': 89, '3': 92, '2': 91, '5': 94, '4': 93, '7': 96, '6': 95, '9': 98, '8': 97, 'A': 99, 'C': 101, 'B': 100, 'E': 103, 'D': 102, 'G': 105, 'F': 104, 'I': 107, 'H': 106, 'K': 109, 'J': 108, 'M': 111, 'L': 110, 'O': 113, 'N': 112, 'Q': 115, 'P': 114, 'S': 117, 'R': 116, 'U': 119, 'T': 118, 'W': 121, 'V': 120, 'Y': 123, 'X': 122, 'Z': 124, '_': 125, 'a': 126, 'c': 128, 'b': 127, 'e': 130, 'd': 129, 'g': 132, 'f': 131, 'i': 134, 'h': 133, 'k': 136, 'j': 135, 'm': 138, 'l': 137, 'o': 140, 'n': 139, 'q': 142, 'p': 141, 's': 144, 'r': 143, 'u': 146, 't': 145, 'w': 148, 'v': 147, 'y': 150, 'x': 149, 'z': 151},
+    {'1': 90, '0': 89, '3': 92, '2': 91, '5': 94, '4': 93, '7': 96, '6': 95, '9': 98, '8': 97, 'A': 99, 'C': 101, 'B': 100, 'E': 103, 'D': 102, 'G': 105, 'F': 104, 'I': 107, 'H': 106, 'K': 109, 'J': 108, 'M': 111, 'L': 110, 'O': 113, 'N': 112, 'Q': 115, 'P': 114, 'S': 117, 'R': 116, 'U': 119, 'T': 118, 'W': 121, 'V': 120, 'Y': 123, 'X': 122, 'Z': 124, '_': 125, 'a': 126, 'c': 128, 'b': 127, 'e': 130, 'd': 129, 'g': 132, 'f': 131, 'i': 134, 'h': 133, 'k': 136, 'j': 135, 'm': 138, 'l': 137, 'o': 140, 'n': 139, 'q': 142, 'p': 141, 's': 144, 'r': 143, 'u': 146, 't': 145, 'w': 148, 'v': 147, 'y': 150, 'x': 149, 'z': 151},
+    {'1': 90, '0': 89, '3': 92, '2': 91, '5': 94, '4': 93, '7': 96, '6': 95, '9': 98, '8': 97, 'A': 99, 'C': 101, 'B': 100, 'E': 103, 'D': 102, 'G': 105, 'F': 104, 'I': 107, 'H': 106, 'K': 109, 'J': 108, 'M': 111, 'L': 110, 'O': 113, 'N': 112, 'Q': 115, 'P': 114, 'S': 117, 'R': 116, 'U': 119, 'T': 118, 'W': 121, 'V': 120, 'Y': 123, 'X': 122, 'Z': 124, '_': 125, 'a': 126, 'c': 128, 'b': 127, 'e': 130, 'd': 129, 'g': 132, 'f': 131, 'i': 134, 'h': 133, 'k': 136, 'j': 135, 'm': 138, 'l': 137, 'o': 140, 'n': 139, 'q': 142, 'p': 141, 's': 144, 'r': 143, 'u': 146, 't': 145, 'w': 148, 'v': 147, 'y': 150, 'x': 149, 'z': 151},
+    {'1': 90, '0': 89, '3': 92, '2': 91, '5': 94, '4': 93, '7': 96, '6': 95, '9': 98, '8': 97, 'A': 99, 'C': 101, 'B': 100, 'E': 103, 'D': 102, 'G': 105, 'F': 104, 'I': 107, 'H': 106, 'K': 109, 'J': 108, 'M': 111, 'L': 110, 'O': 113, 'N': 112, 'Q': 115, 'P': 114, 'S': 117, 'R': 116, 'U': 119, 'T': 118, 'W': 121, 'V': 120, 'Y': 123, 'X': 122, 'Z': 124, '_': 125, 'a': 126, 'c': 128, 'b': 127, 'e': 130, 'd': 129, 'g': 132, 'f': 131, 'i': 134, 'h': 133, 'k': 136, 'j': 135, 'm': 138, 'l': 137, 'o': 140, 'n': 139, 'q': 142, 'p': 141, 's': 144, 'r': 143, 'u': 146, 't': 145, 'w': 148, 'v': 147, 'y': 150, 'x': 149, 'z': 151},
+    {'1': 90, '0': 89, '3': 92, '2': 91, '5': 94, '4': 93, '7': 96, '6': 95, '9': 98, '8': 97, 'A': 99, 'C': 101, 'B': 100, 'E': 103, 'D': 102, 'G': 105, 'F': 104, 'I': 107, 'H': 106, 'K': 109, 'J': 108, 'M': 111, 'L': 110, 'O': 113, 'N': 112, 'Q': 115, 'P': 114, 'S': 117, 'R': 116, 'U': 119, 'T': 118, 'W': 121, 'V': 120, 'Y': 123, 'X': 122, 'Z': 124, '_': 125, 'a': 126, 'c': 128, 'b': 127, 'e': 130, 'd': 129, 'g': 132, 'f': 131, 'i': 134, 'h': 133, 'k': 136, 'j': 135, 'm': 138, 'l': 137, 'o': 140, 'n': 139, 'q': 142, 'p': 141, 's': 144, 'r': 143, 'u': 146, 't': 145, 'w': 148, 'v': 147, 'y': 150, 'x': 149, 'z': 151},
+    {'1': 90, '0': 89, '3': 92, '2': 91, '5': 94, '4': 93, '7': 96, '6': 95, '9': 98, '8': 97, 'A': 99, 'C': 101, 'B': 100, 'E': 103, 'D': 102, 'G': 105, 'F': 104, 'I': 107, 'H': 106, 'K': 109, 'J': 108, 'M': 111, 'L': 110, 'O': 113, 'N': 112, 'Q': 115, 'P': 114, 'S': 117, 'R': 116, 'U': 119, 'T': 118, 'W': 121, 'V': 120, 'Y': 123, 'X': 122, 'Z': 124, '_': 125, 'a': 126, 'c': 128, 'b': 127, 'e': 130, 'd': 129, 'g': 132, 'f': 131, 'i': 134, 'h': 133, 'k': 136, 'j': 135, 'm': 138, 'l': 137, 'o': 140, 'n': 139, 'q': 142, 'p': 141, 's': 144, 'r': 143, 'u': 146, 't': 145, 'w': 148, 'v': 147, 'y': 150, 'x': 149, 'z': 151},
+    {'1': 90, '0': 89, '3': 92, '2': 91, '5': 94, '4': 93, '7': 96, '6': 95, '9': 98, '8': 97, 'A': 99, 'C': 101, 'B': 100, 'E': 103, 'D': 102, 'G': 105, 'F': 104, 'I': 107, 'H': 106, 'K': 109, 'J': 108, 'M': 111, 'L': 110, 'O': 113, 'N': 112, 'Q': 115, 'P': 114, 'S': 117, 'R': 116, 'U': 119, 'T': 118, 'W': 121, 'V': 120, 'Y': 123, 'X': 122, 'Z': 124, '_': 125, 'a': 126, 'c': 128, 'b': 127, 'e': 130, 'd': 129, 'g': 132, 'f': 131, 'i': 134, 'h': 133, 'k': 136, 'j': 135, 'm': 138, 'l': 137, 'o': 140, 'n': 139, 'q': 142, 'p': 141, 's': 144, 'r': 143, 'u': 146, 't': 145, 'w': 148, 'v': 147, 'y': 150, 'x': 149, 'z': 151},
+    {'1': 90, '0': 89, '3': 92, '2': 91, '5': 94, '4': 93, '7': 96, '6': 95, '9': 98, '8': 97, 'A': 99, 'C': 101, 'B': 100, 'E': 103, 'D': 102, 'G': 105, 'F': 104, 'I': 107, 'H': 106, 'K': 109, 'J': 108, 'M': 111, 'L': 110, 'O': 113, 'N': 112, 'Q': 115, 'P': 114, 'S': 117, 'R': 116, 'U': 119, 'T': 118, 'W': 121, 'V': 120, 'Y': 123, 'X': 122, 'Z': 124, '_': 125, 'a': 126, 'c': 128, 'b': 127, 'e': 130, 'd': 129, 'g': 132, 'f': 131, 'i': 134, 'h': 133, 'k': 136, 'j': 135, 'm': 138, 'l': 137, 'o': 140, 'n': 139, 'q': 142, 'p': 141, 's': 144, 'r': 143, 'u': 146, 't': 145, 'w': 148, 'v': 147, 'y': 150, 'x': 149, 'z': 151},
+    {'1': 90, '0': 89, '3': 92, '2': 91, '5': 94, '4': 93, '7': 96, '6': 95, '9': 98, '8': 97, 'A': 99, 'C': 101, 'B': 100, 'E': 103, 'D': 102, 'G': 105, 'F': 104, 'I': 107, 'H': 106, 'K': 109, 'J': 108, 'M': 111, 'L': 110, 'O': 113, 'N': 112, 'Q': 115, 'P': 114, 'S': 117, 'R': 116, 'U': 119, 'T': 118, 'W': 121, 'V': 120, 'Y': 123, 'X': 122, 'Z': 124, '_': 125, 'a': 126, 'c': 128, 'b': 127, 'e': 130, 'd': 129, 'g': 132, 'f': 131, 'i': 134, 'h': 133, 'k': 136, 'j': 135, 'm': 138, 'l': 137, 'o': 140, 'n': 139, 'q': 142, 'p': 141, 's': 144, 'r': 143, 'u': 146, 't': 145, 'w': 148, 'v': 147, 'y': 150, 'x': 149, 'z': 151},
+    {'1': 90, '0': 89, '3': 92, '2': 91, '5': 94, '4': 93, '7': 96, '6': 95, '9': 98, '8': 97, 'A': 99, 'C': 101, 'B': 100, 'E': 103, 'D': 102, 'G': 105, 'F': 104, 'I': 107, 'H': 106, 'K': 109, 'J': 108, 'M': 111, 'L': 110, 'O': 113, 'N': 112, 'Q': 115, 'P': 114, 'S': 117, 'R': 116, 'U': 119, 'T': 118, 'W': 121, 'V': 120, 'Y': 123, 'X': 122, 'Z': 124, '_': 125, 'a': 126, 'c': 128, 'b': 127, 'e': 130, 'd': 129, 'g': 132, 'f': 131, 'i': 134, 'h': 133, 'k': 136, 'j': 135, 'm': 138, 'l': 137, 'o': 140, 'n': 139, 'q': 142, 'p': 141, 's': 144, 'r': 143, 'u': 146, 't': 145, 'w': 148, 'v': 147, 'y': 150, 'x': 149, 'z': 151},
+    {'1': 90, '0': 89, '3': 92, '2': 91, '5': 94, '4': 93, '7': 96, '6': 95, '9': 98, '8': 97, 'A': 99, 'C': 101, 'B': 100, 'E': 103, 'D': 102, 'G': 105, 'F': 104, 'I': 107, 'H': 106, 'K': 109, 'J': 108, 'M': 111, 'L': 110, 'O': 113, 'N': 112, 'Q': 115, 'P': 114, 'S': 117, 'R': 116, 'U': 119, 'T': 118, 'W': 121, 'V': 120, 'Y': 123, 'X': 122, 'Z': 124, '_': 125, 'a': 126, 'c': 128, 'b': 127, 'e': 130, 'd': 129, 'g': 132, 'f': 131, 'i': 134, 'h': 133, 'k': 136, 'j': 135, 'm': 138, 'l': 137, 'o': 140, 'n': 139, 'q': 142, 'p': 141, 's': 144, 'r': 143, 'u': 146, 't': 145, 'w': 148, 'v': 147, 'y': 150, 'x': 149, 'z': 151},
+    {'1': 90, '0': 89, '3': 92, '2': 91, '5': 94, '4': 93, '7': 96, '6': 95, '9': 98, '8': 97, 'A': 99, 'C': 101, 'B': 100, 'E': 103, 'D': 102, 'G': 105, 'F': 104, 'I': 107, 'H': 106, 'K': 109, 'J': 108, 'M': 111, 'L': 110, 'O': 113, 'N': 112, 'Q': 115, 'P': 114, 'S': 117, 'R': 116, 'U': 119, 'T': 118, 'W': 121, 'V': 120, 'Y': 123, 'X': 122, 'Z': 124, '_': 125, 'a': 126, 'c': 128, 'b': 127, 'e': 130, 'd': 129, 'g': 132, 'f': 131, 'i': 134, 'h': 133, 'k': 136, 'j': 135, 'm': 138, 'l': 137, 'o': 140, 'n': 139, 'q': 142, 'p': 141, 's': 144, 'r': 143, 'u': 146, 't': 145, 'w': 148, 'v': 147, 'y': 150, 'x': 149, 'z': 151},
+    {'1': 90, '0': 89, '3': 92, '2': 91, '5': 94, '4': 93, '7': 96, '6': 95, '9': 98, '8': 97, 'A': 99, 'C': 101, 'B': 100, 'E': 103, 'D': 102, 'G': 105, 'F': 104, 'I': 107, 'H': 106, 'K': 109, 'J': 108, 'M': 111, 'L': 110, 'O': 113, 'N': 112, 'Q': 115, 'P': 114, 'S': 117, 'R': 116, 'U': 119, 'T': 118, 'W': 121, 'V': 120, 'Y': 123, 'X': 122, 'Z': 124, '_': 125, 'a': 126, 'c': 128, 'b': 127, 'e': 130, 'd': 129, 'g': 132, 'f': 131, 'i': 134, 'h': 133, 'k': 136, 'j': 135, 'm': 138, 'l': 137, 'o': 140, 'n': 139, 'q': 142, 'p': 141, 's': 144, 'r': 143, 'u': 146, 't': 145, 'w': 148, 'v': 147, 'y': 150, 'x': 149, 'z': 151},
+    {'1': 90, '0': 89, '3': 92, '2': 91, '5': 94, '4': 93, '7': 96, '6': 95, '9': 98, '8': 97, 'A': 99, 'C': 101, 'B': 100, 'E': 103, 'D': 102, 'G': 105, 'F': 104, 'I': 107, 'H': 106, 'K': 109, 'J': 108, 'M': 111, 'L': 110, 'O': 113, 'N': 112, 'Q': 115, 'P': 114, 'S': 117, 'R': 116, 'U': 119, 'T': 118, 'W': 121, 'V': 120, 'Y': 123, 'X': 122, 'Z': 124, '_': 125, 'a': 126, 'c': 128, 'b': 127, 'e': 130, 'd': 129, 'g': 132, 'f': 131, 'i': 134, 'h': 133, 'k': 136, 'j': 135, 'm': 138, 'l': 137, 'o': 140, 'n': 139, 'q': 142, 'p': 141, 's': 144, 'r': 143, 'u': 146, 't': 145, 'w': 148, 'v': 147, 'y': 150, 'x': 149, 'z': 151},
+    {'1': 90, '0': 89, '3': 92, '2': 91, '5': 94, '4': 93, '7': 96, '6': 95, '9': 98, '8': 97, 'A': 99, 'C': 101, 'B': 100, 'E': 103, 'D': 102, 'G': 105, 'F': 104, 'I': 107, 'H': 106, 'K': 109, 'J': 108, 'M': 111, 'L': 110, 'O': 113, 'N': 112, 'Q': 115, 'P': 114, 'S': 117, 'R': 116, 'U': 119, 'T': 118, 'W': 121, 'V': 120, 'Y': 123, 'X': 122, 'Z': 124, '_': 125, 'a': 126, 'c': 128, 'b': 127, 'e': 130, 'd': 129, 'g': 132, 'f': 131, 'i': 134, 'h': 133, 'k': 136, 'j': 135, 'm': 138, 'l': 137, 'o': 140, 'n': 139, 'q': 142, 'p': 141, 's': 144, 'r': 143, 'u': 146, 't': 145, 'w': 148, 'v': 147, 'y': 150, 'x': 149, 'z': 151},
+    {'1': 90, '0': 89, '3': 92, '2': 91, '5': 94, '4': 93, '7': 96, '6': 95, '9': 98, '8': 97, 'A': 99, 'C': 101, 'B': 100, 'E': 103, 'D': 102, 'G': 105, 'F': 104, 'I': 107, 'H': 106, 'K': 109, 'J': 108, 'M': 111, 'L': 110, 'O': 113, 'N': 112, 'Q': 115, 'P': 114, 'S': 117, 'R': 116, 'U': 119, 'T': 118, 'W': 121, 'V': 120, 'Y': 123, 'X': 122, 'Z': 124, '_': 125, 'a': 126, 'c': 128, 'b': 127, 'e': 130, 'd': 129, 'g': 132, 'f': 131, 'i': 134, 'h': 133, 'k': 136, 'j': 135, 'm': 138, 'l': 137, 'o': 140, 'n': 139, 'q': 142, 'p': 141, 's': 144, 'r': 143, 'u': 146, 't': 145, 'w': 148, 'v': 147, 'y': 150, 'x': 149, 'z': 151},
+    {'1': 90, '0': 89, '3': 92, '2': 91, '5': 94, '4': 93, '7': 96, '6': 95, '9': 98, '8': 97, 'A': 99, 'C': 101, 'B': 100, 'E': 103, 'D': 102, 'G': 105, 'F': 104, 'I': 107, 'H': 106, 'K': 109, 'J': 108, 'M': 111, 'L': 110, 'O': 113, 'N': 112, 'Q': 115, 'P': 114, 'S': 117, 'R': 116, 'U': 119, 'T': 118, 'W': 121, 'V': 120, 'Y': 123, 'X': 122, 'Z': 124, '_': 125, 'a': 126, 'c': 128, 'b': 127, 'e': 130, 'd': 129, 'g': 132, 'f': 131, 'i': 134, 'h': 133, 'k': 136, 'j': 135, 'm': 138, 'l': 137, 'o': 140, 'n': 139, 'q': 142, 'p': 141, 's': 144, 'r': 143, 'u': 146, 't': 145, 'w': 148, 'v': 147, 'y': 150, 'x': 149, 'z': 151},
+    {'1': 90, '0': 89, '3': 92, '2': 91, '5': 94, '4': 93, '7': 96, '6': 95, '9': 98, '8': 97, 'A': 99, 'C': 101, 'B': 100, 'E': 103, 'D': 102, 'G': 105, 'F': 104, 'I': 107, 'H': 106, 'K': 109, 'J': 108, 'M': 111, 'L': 110, 'O': 113, 'N': 112, 'Q': 115, 'P': 114, 'S': 117, 'R': 116, 'U': 119, 'T': 118, 'W': 121, 'V': 120, 'Y': 123, 'X': 122, 'Z': 124, '_': 125, 'a': 126, 'c': 128, 'b': 127, 'e': 130, 'd': 129, 'g': 132, 'f': 131, 'i': 134, 'h': 133, 'k': 136, 'j': 135, 'm': 138, 'l': 137, 'o': 140, 'n': 139, 'q': 142, 'p': 141, 's': 144, 'r': 143, 'u': 146, 't': 145, 'w': 148, 'v': 147, 'y': 150, 'x': 149, 'z': 151},
+    {'1': 90, '0': 89, '3': 92, '2': 91, '5': 94, '4': 93, '7': 96, '6': 95, '9': 98, '8': 97, 'A': 99, 'C': 101, 'B': 100, 'E': 103, 'D': 102, 'G': 105, 'F': 104, 'I': 107, 'H': 106, 'K': 109, 'J': 108, 'M': 111, 'L': 110, 'O': 113, 'N': 112, 'Q': 115, 'P': 114, 'S': 117, 'R': 116, 'U': 119, 'T': 118, 'W': 121, 'V': 120, 'Y': 123, 'X': 122, 'Z': 124, '_': 125, 'a': 126, 'c': 128, 'b': 127, 'e': 130, 'd': 129, 'g': 132, 'f': 131, 'i': 134, 'h': 133, 'k': 136, 'j': 135, 'm': 138, 'l': 137, 'o': 140, 'n': 139, 'q': 142, 'p': 141, 's': 144, 'r': 143, 'u': 146, 't': 145, 'w': 148, 'v': 147, 'y': 150, 'x': 149, 'z': 151},
+    {'1': 90, '0': 89, '3': 92, '2': 91, '5': 94, '4': 93, '7': 96, '6': 95, '9': 98, '8': 97, 'A': 99, 'C': 101, 'B': 100, 'E': 103, 'D': 102, 'G': 105, 'F': 104, 'I': 107, 'H': 106, 'K': 109, 'J': 108, 'M': 111, 'L': 110, 'O': 113, 'N': 112, 'Q': 115, 'P': 114, 'S': 117, 'R': 116, 'U': 119, 'T': 118, 'W': 121, 'V': 120, 'Y': 123, 'X': 122, 'Z': 124, '_': 125, 'a': 126, 'c': 128, 'b': 127, 'e': 130, 'd': 129, 'g': 132, 'f': 131, 'i': 134, 'h': 133, 'k': 136, 'j': 135, 'm': 138, 'l': 137, 'o': 140, 'n': 139, 'q': 142, 'p': 141, 's': 144, 'r': 143, 'u': 146, 't': 145, 'w': 148, 'v': 147, 'y': 150, 'x': 149, 'z': 151},
+    {'1': 90, '0': 89, '3': 92, '2': 91, '5': 94, '4': 93, '7': 96, '6': 95, '9': 98, '8': 97, 'A': 99, 'C': 101, 'B': 100, 'E': 103, 'D': 102, 'G': 105, 'F': 104, 'I': 107, 'H': 106, 'K': 109, 'J': 108, 'M': 111, 'L': 110, 'O': 113, 'N': 112, 'Q': 115, 'P': 114, 'S': 117, 'R': 116, 'U': 119, 'T': 118, 'W': 121, 'V': 120, 'Y': 123, 'X': 122, 'Z': 124, '_': 125, 'a': 126, 'c': 128, 'b': 127, 'e': 130, 'd': 129, 'g': 132, 'f': 131, 'i': 134, 'h': 133, 'k': 136, 'j': 135, 'm': 138, 'l': 137, 'o': 140, 'n': 139, 'q': 142, 'p': 141, 's': 144, 'r': 143, 'u': 146, 't': 145, 'w': 148, 'v': 147, 'y': 150, 'x': 149, 'z': 151},
+    {'1': 90, '0': 89, '3': 92, '2': 91, '5': 94, '4': 93, '7': 96, '6': 95, '9': 98, '8': 97, 'A': 99, 'C': 101, 'B': 100, 'E': 103, 'D': 102, 'G': 105, 'F': 104, 'I': 107, 'H': 106, 'K': 109, 'J': 108, 'M': 111, 'L': 110, 'O': 113, 'N': 112, 'Q': 115, 'P': 114, 'S': 117, 'R': 116, 'U': 119, 'T': 118, 'W': 121, 'V': 120, 'Y': 123, 'X': 122, 'Z': 124, '_': 125, 'a': 126, 'c': 128, 'b': 127, 'e': 130, 'd': 129, 'g': 132, 'f': 131, 'i': 134, 'h': 133, 'k': 136, 'j': 135, 'm': 138, 'l': 137, 'o': 140, 'n': 139, 'q': 142, 'p': 141, 's': 144, 'r': 143, 'u': 146, 't': 145, 'w': 148, 'v': 147, 'y': 150, 'x': 149, 'z': 151},
+    {'1': 90, '0': 89, '3': 92, '2': 91, '5': 94, '4': 93, '7': 96, '6': 95, '9': 98, '8': 97, 'A': 99, 'C': 101, 'B': 100, 'E': 103, 'D': 102, 'G': 105, 'F': 104, 'I': 107, 'H': 106, 'K': 109, 'J': 108, 'M': 111, 'L': 110, 'O': 113, 'N': 112, 'Q': 115, 'P': 114, 'S': 117, 'R': 116, 'U': 119, 'T': 118, 'W': 121, 'V': 120, 'Y': 123, 'X': 122, 'Z': 124, '_': 125, 'a': 126, 'c': 128, 'b': 127, 'e': 130, 'd': 129, 'g': 132, 'f': 131, 'i': 134, 'h': 133, 'k': 136, 'j': 135, 'm': 138, 'l': 137, 'o': 140, 'n': 139, 'q': 142, 'p': 141, 's': 144, 'r': 143, 'u': 146, 't': 145, 'w': 148, 'v': 147, 'y': 150, 'x': 149, 'z': 151},
+    {'1': 90, '0': 89, '3': 92, '2': 91, '5': 94, '4': 93, '7': 96, '6': 95, '9': 98, '8': 97, 'A': 99, 'C': 101, 'B': 100, 'E': 103, 'D': 102, 'G': 105, 'F': 104, 'I': 107, 'H': 106, 'K': 109, 'J': 108, 'M': 111, 'L': 110, 'O': 113, 'N': 112, 'Q': 115, 'P': 114, 'S': 117, 'R': 116, 'U': 119, 'T': 118, 'W': 121, 'V': 120, 'Y': 123, 'X': 122, 'Z': 124, '_': 125, 'a': 126, 'c': 128, 'b': 127, 'e': 130, 'd': 129, 'g': 132, 'f': 131, 'i': 134, 'h': 133, 'k': 136, 'j': 135, 'm': 138, 'l': 137, 'o': 140, 'n': 139, 'q': 142, 'p': 141, 's': 144, 'r': 143, 'u': 146, 't': 145, 'w': 148, 'v': 147, 'y': 150, 'x': 149, 'z': 151},
+    {'1': 90, '0': 89, '3': 92, '2': 91, '5': 94, '4': 93, '7': 96, '6': 95, '9': 98, '8': 97, 'A': 99, 'C': 101, 'B': 100, 'E': 103, 'D': 102, 'G': 105, 'F': 104, 'I': 107, 'H': 106, 'K': 109, 'J': 108, 'M': 111, 'L': 110, 'O': 113, 'N': 112, 'Q': 115, 'P': 114, 'S': 117, 'R': 116, 'U': 119, 'T': 118, 'W': 121, 'V': 120, 'Y': 123, 'X': 122, 'Z': 124, '_': 125, 'a': 126, 'c': 128, 'b': 127, 'e': 130, 'd': 129, 'g': 132, 'f': 131, 'i': 134, 'h': 133, 'k': 136, 'j': 135, 'm': 138, 'l': 137, 'o': 140, 'n': 139, 'q': 142, 'p': 141, 's': 144, 'r': 143, 'u': 146, 't': 145, 'w': 148, 'v': 147, 'y': 150, 'x': 149, 'z': 151},
+    {'1': 90, '0': 89, '3': 92, '2': 91, '5': 94, '4': 93, '7': 96, '6': 95, '9': 98, '8': 97, 'A': 99, 'C': 101, 'B': 100, 'E': 103, 'D': 102, 'G': 105, 'F': 104, 'I': 107, 'H': 106, 'K': 109, 'J': 108, 'M': 111, 'L': 110, 'O': 113, 'N': 112, 'Q': 115, 'P': 114, 'S': 117, 'R': 116, 'U': 119, 'T': 118, 'W': 121, 'V': 120, 'Y': 123, 'X': 122, 'Z': 124, '_': 125, 'a': 126, 'c': 128, 'b': 127, 'e': 130, 'd': 129, 'g': 132, 'f': 131, 'i': 134, 'h': 133, 'k': 136, 'j': 135, 'm': 138, 'l': 137, 'o': 140, 'n': 139, 'q': 142, 'p': 141, 's': 144, 'r': 143, 'u': 146, 't': 145, 'w': 148, 'v': 147, 'y': 150, 'x': 149, 'z': 151},
+    {'1': 90, '0': 89, '3': 92, '2': 91, '5': 94, '4': 93, '7': 96, '6': 95, '9': 98, '8': 97, 'A': 99, 'C': 101, 'B': 100, 'E': 103, 'D': 102, 'G': 105, 'F': 104, 'I': 107, 'H': 106, 'K': 109, 'J': 108, 'M': 111, 'L': 110, 'O': 113, 'N': 112, 'Q': 115, 'P': 114, 'S': 117, 'R': 116, 'U': 119, 'T': 118, 'W': 121, 'V': 120, 'Y': 123, 'X': 122, 'Z': 124, '_': 125, 'a': 126, 'c': 128, 'b': 127, 'e': 130, 'd': 129, 'g': 132, 'f': 131, 'i': 134, 'h': 133, 'k': 136, 'j': 135, 'm': 138, 'l': 137, 'o': 140, 'n': 139, 'q': 142, 'p': 141, 's': 144, 'r': 143, 'u': 146, 't': 145, 'w': 148, 'v': 147, 'y': 150, 'x': 149, 'z': 151},
+    {'1': 90, '0': 89, '3': 92, '2': 91, '5': 94, '4': 93, '7': 96, '6': 95, '9': 98, '8': 97, 'A': 99, 'C': 101, 'B': 100, 'E': 103, 'D': 102, 'G': 105, 'F': 104, 'I': 107, 'H': 106, 'K': 109, 'J': 108, 'M': 111, 'L': 110, 'O': 113, 'N': 112, 'Q': 115, 'P': 114, 'S': 117, 'R': 116, 'U': 119, 'T': 118, 'W': 121, 'V': 120, 'Y': 123, 'X': 122, 'Z': 124, '_': 125, 'a': 126, 'c': 128, 'b': 127, 'e': 130, 'd': 129, 'g': 132, 'f': 131, 'i': 134, 'h': 133, 'k': 136, 'j': 135, 'm': 138, 'l': 137, 'o': 140, 'n': 139, 'q': 142, 'p': 141, 's': 144, 'r': 143, 'u': 146, 't': 145, 'w': 148, 'v': 147, 'y': 150, 'x': 149, 'z': 151},
+    {'1': 90, '0': 89, '3': 92, '2': 91, '5': 94, '4': 93, '7': 96, '6': 95, '9': 98, '8': 97, 'A': 99, 'C': 101, 'B': 100, 'E': 103, 'D': 102, 'G': 105, 'F': 104, 'I': 107, 'H': 106, 'K': 109, 'J': 108, 'M': 111, 'L': 110, 'O': 113, 'N': 112, 'Q': 115, 'P': 114, 'S': 117, 'R': 116, 'U': 119, 'T': 118, 'W': 121, 'V': 120, 'Y': 123, 'X': 122, 'Z': 124, '_': 125, 'a': 126, 'c': 128, 'b': 127, 'e': 130, 'd': 129, 'g': 132, 'f': 131, 'i': 134, 'h': 133, 'k': 136, 'j': 135, 'm': 138, 'l': 137, 'o': 140, 'n': 139, 'q': 142, 'p': 141, 's': 144, 'r': 143, 'u': 146, 't': 145, 'w': 148, 'v': 147, 'y': 150, 'x': 149, 'z': 151},
+    {'1': 90, '0': 89, '3': 92, '2': 91, '5': 94, '4': 93, '7': 96, '6': 95, '9': 98, '8': 97, 'A': 99, 'C': 101, 'B': 100, 'E': 103, 'D': 102, 'G': 105, 'F': 104, 'I': 107, 'H': 106, 'K': 109, 'J': 108, 'M': 111, 'L': 110, 'O': 113, 'N': 112, 'Q': 115, 'P': 114, 'S': 117, 'R': 116, 'U': 119, 'T': 118, 'W': 121, 'V': 120, 'Y': 123, 'X': 122, 'Z': 124, '_': 125, 'a': 126, 'c': 128, 'b': 127, 'e': 130, 'd': 129, 'g': 132, 'f': 152, 'i': 134, 'h': 133, 'k': 136, 'j': 135, 'm': 138, 'l': 137, 'o': 140, 'n': 139, 'q': 142, 'p': 141, 's': 144, 'r': 143, 'u': 146, 't': 145, 'w': 148, 'v': 147, 'y': 150, 'x': 149, 'z': 151},
+    {'1': 90, '0': 89, '3': 92, '2': 91, '5': 94, '4': 93, '7': 96, '6': 95, '9': 98, '8': 97, 'A': 99, 'C': 101, 'B': 100, 'E': 103, 'D': 102, 'G': 105, 'F': 104, 'I': 107, 'H': 106, 'K': 109, 'J': 108, 'M': 111, 'L': 110, 'O': 113, 'N': 112, 'Q': 115, 'P': 114, 'S': 117, 'R': 116, 'U': 119, 'T': 118, 'W': 121, 'V': 120, 'Y': 123, 'X': 122, 'Z': 124, '_': 125, 'a': 126, 'c': 128, 'b': 127, 'e': 130, 'd': 129, 'g': 132, 'f': 131, 'i': 134, 'h': 133, 'k': 136, 'j': 135, 'm': 138, 'l': 137, 'o': 140, 'n': 139, 'q': 142, 'p': 141, 's': 144, 'r': 143, 'u': 146, 't': 145, 'w': 148, 'v': 147, 'y': 150, 'x': 149, 'z': 151},
+    {'1': 90, '0': 89, '3': 92, '2': 91, '5': 94, '4': 93, '7': 96, '6': 95, '9': 98, '8': 97, 'A': 99, 'C': 101, 'B': 100, 'E': 103, 'D': 102, 'G': 105, 'F': 104, 'I': 107, 'H': 106, 'K': 109, 'J': 108, 'M': 111, 'L': 110, 'O': 113, 'N': 112, 'Q': 115, 'P': 114, 'S': 117, 'R': 116, 'U': 119, 'T': 118, 'W': 121, 'V': 120, 'Y': 123, 'X': 122, 'Z': 124, '_': 125, 'a': 126, 'c': 128, 'b': 127, 'e': 130, 'd': 129, 'g': 132, 'f': 131, 'i': 134, 'h': 133, 'k': 136, 'j': 135, 'm': 138, 'l': 137, 'o': 140, 'n': 139, 'q': 142, 'p': 141, 's': 144, 'r': 143, 'u': 146, 't': 145, 'w': 148, 'v': 147, 'y': 150, 'x': 149, 'z': 151},
+    {'1': 90, '0': 89, '3': 92, '2': 91, '5': 94, '4': 93, '7': 96, '6': 95, '9': 98, '8': 97, 'A': 99, 'C': 101, 'B': 100, 'E': 103, 'D': 102, 'G': 105, 'F': 104, 'I': 107, 'H': 106, 'K': 109, 'J': 108, 'M': 111, 'L': 110, 'O': 113, 'N': 112, 'Q': 115, 'P': 114, 'S': 117, 'R': 116, 'U': 119, 'T': 118, 'W': 121, 'V': 120, 'Y': 123, 'X': 122, 'Z': 124, '_': 125, 'a': 126, 'c': 128, 'b': 127, 'e': 130, 'd': 129, 'g': 132, 'f': 131, 'i': 134, 'h': 133, 'k': 136, 'j': 135, 'm': 138, 'l': 137, 'o': 140, 'n': 139, 'q': 142, 'p': 141, 's': 144, 'r': 143, 'u': 146, 't': 145, 'w': 148, 'v': 147, 'y': 150, 'x': 149, 'z': 151},
+    {'1': 90, '0': 89, '3': 92, '2': 91, '5': 94, '4': 93, '7': 96, '6': 95, '9': 98, '8': 97, 'A': 99, 'C': 101, 'B': 100, 'E': 103, 'D': 102, 'G': 105, 'F': 104, 'I': 107, 'H': 106, 'K': 109, 'J': 108, 'M': 111, 'L': 110, 'O': 113, 'N': 112, 'Q': 115, 'P': 114, 'S': 117, 'R': 116, 'U': 119, 'T': 118, 'W': 121, 'V': 120, 'Y': 123, 'X': 122, 'Z': 124, '_': 125, 'a': 126, 'c': 128, 'b': 127, 'e': 130, 'd': 129, 'g': 132, 'f': 131, 'i': 134, 'h': 133, 'k': 136, 'j': 135, 'm': 138, 'l': 137, 'o': 140, 'n': 139, 'q': 142, 'p': 141, 's': 144, 'r': 143, 'u': 146, 't': 145, 'w': 148, 'v': 147, 'y': 150, 'x': 149, 'z': 151},
+    {'1': 90, '0': 89, '3': 92, '2': 91, '5': 94, '4': 93, '7': 96, '6': 95, '9': 98, '8': 97, 'A': 99, 'C': 101, 'B': 100, 'E': 103, 'D': 102, 'G': 105, 'F': 104, 'I': 107, 'H': 106, 'K': 109, 'J': 108, 'M': 111, 'L': 110, 'O': 113, 'N': 112, 'Q': 115, 'P': 114, 'S': 117, 'R': 116, 'U': 119, 'T': 118, 'W': 121, 'V': 120, 'Y': 123, 'X': 122, 'Z': 124, '_': 125, 'a': 126, 'c': 128, 'b': 127, 'e': 130, 'd': 129, 'g': 132, 'f': 131, 'i': 134, 'h': 133, 'k': 136, 'j': 135, 'm': 138, 'l': 137, 'o': 140, 'n': 139, 'q': 142, 'p': 141, 's': 144, 'r': 143, 'u': 146, 't': 145, 'w': 148, 'v': 147, 'y': 150, 'x': 149, 'z': 151},
+    {'1': 90, '0': 89, '3': 92, '2': 91, '5': 94, '4': 93, '7': 96, '6': 95, '9': 98, '8': 97, 'A': 99, 'C': 101, 'B': 100, 'E': 103, 'D': 102, 'G': 105, 'F': 104, 'I': 107, 'H': 106, 'K': 109, 'J': 108, 'M': 111, 'L': 110, 'O': 113, 'N': 112, 'Q': 115, 'P': 114, 'S': 117, 'R': 116, 'U': 119, 'T': 118, 'W': 121, 'V': 120, 'Y': 123, 'X': 122, 'Z': 124, '_': 125, 'a': 126, 'c': 128, 'b': 127, 'e': 130, 'd': 129, 'g': 132, 'f': 131, 'i': 134, 'h': 133, 'k': 136, 'j': 135, 'm': 138, 'l': 137, 'o': 140, 'n': 139, 'q': 142, 'p': 141, 's': 144, 'r': 143, 'u': 146, 't': 145, 'w': 148, 'v': 147, 'y': 150, 'x': 149, 'z': 151},
+    {'1': 90, '0': 89, '3': 92, '2': 91, '5': 94, '4': 93, '7': 96, '6': 95, '9': 98, '8': 97, 'A': 99, 'C': 101, 'B': 100, 'E': 103, 'D': 102, 'G': 105, 'F': 104, 'I': 107, 'H': 106, 'K': 109, 'J': 108, 'M': 111, 'L': 110, 'O': 113, 'N': 112, 'Q': 115, 'P': 114, 'S': 117, 'R': 116, 'U': 119, 'T': 118, 'W': 121, 'V': 120, 'Y': 123, 'X': 122, 'Z': 124, '_': 125, 'a': 126, 'c': 128, 'b': 127, 'e': 130, 'd': 129, 'g': 132, 'f': 131, 'i': 134, 'h': 133, 'k': 136, 'j': 135, 'm': 138, 'l': 137, 'o': 140, 'n': 139, 'q': 142, 'p': 141, 's': 144, 'r': 143, 'u': 146, 't': 145, 'w': 148, 'v': 147, 'y': 150, 'x': 149, 'z': 151},
+    {'1': 90, '0': 89, '3': 92, '2': 91, '5': 94, '4': 93, '7': 96, '6': 95, '9': 98, '8': 97, 'A': 99, 'C': 101, 'B': 100, 'E': 103, 'D': 102, 'G': 105, 'F': 104, 'I': 107, 'H': 106, 'K': 109, 'J': 108, 'M': 111, 'L': 110, 'O': 113, 'N': 112, 'Q': 115, 'P': 114, 'S': 117, 'R': 116, 'U': 119, 'T': 118, 'W': 121, 'V': 120, 'Y': 123, 'X': 122, 'Z': 124, '_': 125, 'a': 126, 'c': 128, 'b': 127, 'e': 130, 'd': 129, 'g': 132, 'f': 131, 'i': 134, 'h': 133, 'k': 136, 'j': 135, 'm': 138, 'l': 137, 'o': 140, 'n': 139, 'q': 142, 'p': 141, 's': 144, 'r': 143, 'u': 146, 't': 145, 'w': 148, 'v': 147, 'y': 150, 'x': 149, 'z': 151},
+    {'1': 90, '0': 89, '3': 92, '2': 91, '5': 94, '4': 93, '7': 96, '6': 95, '9': 98, '8': 97, 'A': 99, 'C': 101, 'B': 100, 'E': 103, 'D': 102, 'G': 105, 'F': 104, 'I': 107, 'H': 106, 'K': 109, 'J': 108, 'M': 111, 'L': 110, 'O': 113, 'N': 112, 'Q': 115, 'P': 114, 'S': 117, 'R': 116, 'U': 119, 'T': 118, 'W': 121, 'V': 120, 'Y': 123, 'X': 122, 'Z': 124, '_': 125, 'a': 126, 'c': 128, 'b': 127, 'e': 130, 'd': 129, 'g': 132, 'f': 131, 'i': 134, 'h': 133, 'k': 136, 'j': 135, 'm': 138, 'l': 137, 'o': 140, 'n': 139, 'q': 142, 'p': 141, 's': 144, 'r': 143, 'u': 146, 't': 145, 'w': 148, 'v': 147, 'y': 150, 'x': 149, 'z': 151},
+    {'1': 90, '0': 89, '3': 92, '2': 91, '5': 94, '4': 93, '7': 96, '6': 95, '9': 98, '8': 97, 'A': 99, 'C': 101, 'B': 100, 'E': 103, 'D': 102, 'G': 105, 'F': 104, 'I': 107, 'H': 106, 'K': 109, 'J': 108, 'M': 111, 'L': 110, 'O': 113, 'N': 112, 'Q': 115, 'P': 114, 'S': 117, 'R': 116, 'U': 119, 'T': 118, 'W': 121, 'V': 120, 'Y': 123, 'X': 122, 'Z': 124, '_': 125, 'a': 126, 'c': 128, 'b': 127, 'e': 130, 'd': 129, 'g': 132, 'f': 131, 'i': 134, 'h': 133, 'k': 136, 'j': 135, 'm': 138, 'l': 137, 'o': 140, 'n': 139, 'q': 142, 'p': 141, 's': 144, 'r': 143, 'u': 146, 't': 145, 'w': 148, 'v': 147, 'y': 150, 'x': 149, 'z': 151},
+    {'1': 90, '0': 89, '3': 92, '2': 91, '5': 94, '4': 93, '7': 96, '6': 95, '9': 98, '8': 97, 'A': 99, 'C': 101, 'B': 100, 'E': 103, 'D': 102, 'G': 105, 'F': 104, 'I': 107, 'H': 106, 'K': 109, 'J': 108, 'M': 111, 'L': 110, 'O': 113, 'N': 112, 'Q': 115, 'P': 114, 'S': 117, 'R': 116, 'U': 119, 'T': 118, 'W': 121, 'V': 120, 'Y': 123, 'X': 122, 'Z': 124, '_': 125, 'a': 126, 'c': 128, 'b': 127, 'e': 130, 'd': 129, 'g': 132, 'f': 131, 'i': 134, 'h': 133, 'k': 136, 'j': 135, 'm': 138, 'l': 137, 'o': 140, 'n': 139, 'q': 142, 'p': 141, 's': 144, 'r': 143, 'u': 146, 't': 145, 'w': 148, 'v': 147, 'y': 150, 'x': 149, 'z': 151},
+    {'1': 90, '0': 89, '3': 92, '2': 91, '5': 94, '4': 93, '7': 96, '6': 95, '9': 98, '8': 97, 'A': 99, 'C': 101, 'B': 100, 'E': 103, 'D': 102, 'G': 105, 'F': 104, 'I': 107, 'H': 106, 'K': 109, 'J': 108, 'M': 111, 'L': 110, 'O': 113, 'N': 112, 'Q': 115, 'P': 114, 'S': 117, 'R': 116, 'U': 119, 'T': 118, 'W': 121, 'V': 120, 'Y': 123, 'X': 122, 'Z': 124, '_': 125, 'a': 126, 'c': 128, 'b': 127, 'e': 130, 'd': 129, 'g': 132, 'f': 131, 'i': 134, 'h': 133, 'k': 136, 'j': 135, 'm': 138, 'l': 137, 'o': 140, 'n': 139, 'q': 142, 'p': 141, 's': 144, 'r': 143, 'u': 146, 't': 145, 'w': 148, 'v': 147, 'y': 150, 'x': 149, 'z': 151},
+    {'1': 90, '0': 89, '3': 92, '2': 91, '5': 94, '4': 93, '7': 96, '6': 95, '9': 98, '8': 97, 'A': 99, 'C': 101, 'B': 100, 'E': 103, 'D': 102, 'G': 105, 'F': 104, 'I': 107, 'H': 106, 'K': 109, 'J': 108, 'M': 111, 'L': 110, 'O': 113, 'N': 112, 'Q': 115, 'P': 114, 'S': 117, 'R': 116, 'U': 119, 'T': 118, 'W': 121, 'V': 120, 'Y': 123, 'X': 122, 'Z': 124, '_': 125, 'a': 126, 'c': 128, 'b': 127, 'e': 130, 'd': 129, 'g': 132, 'f': 131, 'i': 134, 'h': 133, 'k': 136, 'j': 135, 'm': 138, 'l': 137, 'o': 140, 'n': 139, 'q': 142, 'p': 141, 's': 144, 'r': 143, 'u': 146, 't': 145, 'w': 148, 'v': 147, 'y': 150, 'x': 149, 'z': 151},
+    {'1': 90, '0': 89, '3': 92, '2': 91, '5': 94, '4': 93, '7': 96, '6': 95, '9': 98, '8': 97, 'A': 99, 'C': 101, 'B': 100, 'E': 103, 'D': 102, 'G': 105, 'F': 104, 'I': 107, 'H': 106, 'K': 109, 'J': 108, 'M': 111, 'L': 110, 'O': 113, 'N': 112, 'Q': 115, 'P': 114, 'S': 117, 'R': 116, 'U': 119, 'T': 118, 'W': 121, 'V': 120, 'Y': 123, 'X': 122, 'Z': 124, '_': 125, 'a': 126, 'c': 128, 'b': 127, 'e': 130, 'd': 129, 'g': 132, 'f': 131, 'i': 134, 'h': 153, 'k': 136, 'j': 135, 'm': 138, 'l': 137, 'o': 140, 'n': 139, 'q': 142, 'p': 141, 's': 144, 'r': 143, 'u': 146, 't': 145, 'w': 148, 'v': 147, 'y': 150, 'x': 149, 'z': 151},
+    {'1': 90, '0': 89, '3': 92, '2': 91, '5': 94, '4': 93, '7': 96, '6': 95, '9': 98, '8': 97, 'A': 99, 'C': 101, 'B': 100, 'E': 103, 'D': 102, 'G': 105, 'F': 104, 'I': 107, 'H': 106, 'K': 109, 'J': 108, 'M': 111, 'L': 110, 'O': 113, 'N': 112, 'Q': 115, 'P': 114, 'S': 117, 'R': 116, 'U': 119, 'T': 118, 'W': 121, 'V': 120, 'Y': 123, 'X': 122, 'Z': 124, '_': 125, 'a': 126, 'c': 128, 'b': 127, 'e': 130, 'd': 129, 'g': 132, 'f': 131, 'i': 134, 'h': 133, 'k': 136, 'j': 135, 'm': 138, 'l': 137, 'o': 140, 'n': 139, 'q': 142, 'p': 141, 's': 144, 'r': 143, 'u': 146, 't': 145, 'w': 148, 'v': 147, 'y': 150, 'x': 149, 'z': 151},
+    {'1': 90, '0': 89, '3': 92, '2': 91, '5': 94, '4': 93, '7': 96, '6': 95, '9': 98, '8': 97, 'A': 99, 'C': 101, 'B': 100, 'E': 103, 'D': 102, 'G': 105, 'F': 104, 'I': 107, 'H': 106, 'K': 109, 'J': 108, 'M': 111, 'L': 110, 'O': 113, 'N': 112, 'Q': 115, 'P': 114, 'S': 117, 'R': 116, 'U': 119, 'T': 118, 'W': 121, 'V': 120, 'Y': 123, 'X': 122, 'Z': 124, '_': 125, 'a': 126, 'c': 128, 'b': 127, 'e': 130, 'd': 129, 'g': 132, 'f': 131, 'i': 134, 'h': 133, 'k': 136, 'j': 135, 'm': 138, 'l': 137, 'o': 140, 'n': 139, 'q': 142, 'p': 141, 's': 144, 'r': 143, 'u': 146, 't': 145, 'w': 148, 'v': 147, 'y': 150, 'x': 149, 'z': 151},
+    {'1': 90, '0': 89, '3': 92, '2': 91, '5': 94, '4': 93, '7': 96, '6': 95, '9': 98, '8': 97, 'A': 99, 'C': 101, 'B': 100, 'E': 103, 'D': 102, 'G': 105, 'F': 104, 'I': 107, 'H': 106, 'K': 109, 'J': 108, 'M': 111, 'L': 110, 'O': 113, 'N': 112, 'Q': 115, 'P': 114, 'S': 117, 'R': 116, 'U': 119, 'T': 118, 'W': 121, 'V': 120, 'Y': 123, 'X': 122, 'Z': 124, '_': 125, 'a': 126, 'c': 128, 'b': 127, 'e': 130, 'd': 129, 'g': 132, 'f': 131, 'i': 134, 'h': 133, 'k': 136, 'j': 135, 'm': 138, 'l': 137, 'o': 140, 'n': 139, 'q': 142, 'p': 141, 's': 144, 'r': 143, 'u': 146, 't': 145, 'w': 148, 'v': 147, 'y': 150, 'x': 149, 'z': 151},
+    {},
+    {},
+    {'1': 77, '0': 76, '3': 79, '2': 78, '5': 81, '4': 80, '7': 83, '6': 82, '9': 85, '8': 84},
+    {'1': 77, '0': 76, '3': 79, '2': 78, '5': 81, '4': 80, '7': 83, '6': 82, '9': 85, '8': 84},
+    {'1': 77, '0': 76, '3': 79, '2': 78, '5': 81, '4': 80, '7': 83, '6': 82, '9': 85, '8': 84},
+    {'1': 77, '0': 76, '3': 79, '2': 78, '5': 81, '4': 80, '7': 83, '6': 82, '9': 85, '8': 84},
+    {'1': 77, '0': 76, '3': 79, '2': 78, '5': 81, '4': 80, '7': 83, '6': 82, '9': 85, '8': 84},
+    {'1': 77, '0': 76, '3': 79, '2': 78, '5': 81, '4': 80, '7': 83, '6': 82, '9': 85, '8': 84},
+    {'1': 77, '0': 76, '3': 79, '2': 78, '5': 81, '4': 80, '7': 83, '6': 82, '9': 85, '8': 84},
+    {'1': 77, '0': 76, '3': 79, '2': 78, '5': 81, '4': 80, '7': 83, '6': 82, '9': 85, '8': 84},
+    {'1': 77, '0': 76, '3': 79, '2': 78, '5': 81, '4': 80, '7': 83, '6': 82, '9': 85, '8': 84},
+    {'1': 77, '0': 76, '3': 79, '2': 78, '5': 81, '4': 80, '7': 83, '6': 82, '9': 85, '8': 84},
+    {},
+    {},
+    {},
+    {'1': 90, '0': 89, '3': 92, '2': 91, '5': 94, '4': 93, '7': 96, '6': 95, '9': 98, '8': 97, 'A': 99, 'C': 101, 'B': 100, 'E': 103, 'D': 102, 'G': 105, 'F': 104, 'I': 107, 'H': 106, 'K': 109, 'J': 108, 'M': 111, 'L': 110, 'O': 113, 'N': 112, 'Q': 115, 'P': 114, 'S': 117, 'R': 116, 'U': 119, 'T': 118, 'W': 121, 'V': 120, 'Y': 123, 'X': 122, 'Z': 124, '_': 125, 'a': 126, 'c': 128, 'b': 127, 'e': 130, 'd': 129, 'g': 132, 'f': 131, 'i': 134, 'h': 133, 'k': 136, 'j': 135, 'm': 138, 'l': 137, 'o': 140, 'n': 139, 'q': 142, 'p': 141, 's': 144, 'r': 143, 'u': 146, 't': 145, 'w': 148, 'v': 147, 'y': 150, 'x': 149, 'z': 151},
+    {'1': 90, '0': 89, '3': 92, '2': 91, '5': 94, '4': 93, '7': 96, '6': 95, '9': 98, '8': 97, 'A': 99, 'C': 101, 'B': 100, 'E': 103, 'D': 102, 'G': 105, 'F': 104, 'I': 107, 'H': 106, 'K': 109, 'J': 108, 'M': 111, 'L': 110, 'O': 113, 'N': 112, 'Q': 115, 'P': 114, 'S': 117, 'R': 116, 'U': 119, 'T': 118, 'W': 121, 'V': 120, 'Y': 123, 'X': 122, 'Z': 124, '_': 125, 'a': 126, 'c': 128, 'b': 127, 'e': 130, 'd': 129, 'g': 132, 'f': 131, 'i': 134, 'h': 133, 'k': 136, 'j': 135, 'm': 138, 'l': 137, 'o': 140, 'n': 139, 'q': 142, 'p': 141, 's': 144, 'r': 143, 'u': 146, 't': 145, 'w': 148, 'v': 147, 'y': 150, 'x': 149, 'z': 151},
+    {'1': 90, '0': 89, '3': 92, '2': 91, '5': 94, '4': 93, '7': 96, '6': 95, '9': 98, '8': 97, 'A': 99, 'C': 101, 'B': 100, 'E': 103, 'D': 102, 'G': 105, 'F': 104, 'I': 107, 'H': 106, 'K': 109, 'J': 108, 'M': 111, 'L': 110, 'O': 113, 'N': 112, 'Q': 115, 'P': 114, 'S': 117, 'R': 116, 'U': 119, 'T': 118, 'W': 121, 'V': 120, 'Y': 123, 'X': 122, 'Z': 124, '_': 125, 'a': 126, 'c': 128, 'b': 127, 'e': 130, 'd': 129, 'g': 132, 'f': 131, 'i': 134, 'h': 133, 'k': 136, 'j': 135, 'm': 138, 'l': 137, 'o': 140, 'n': 139, 'q': 142, 'p': 141, 's': 144, 'r': 143, 'u': 146, 't': 145, 'w': 148, 'v': 147, 'y': 150, 'x': 149, 'z': 151},
+    {'1': 90, '0': 89, '3': 92, '2': 91, '5': 94, '4': 93, '7': 96, '6': 95, '9': 98, '8': 97, 'A': 99, 'C': 101, 'B': 100, 'E': 103, 'D': 102, 'G': 105, 'F': 104, 'I': 107, 'H': 106, 'K': 109, 'J': 108, 'M': 111, 'L': 110, 'O': 113, 'N': 112, 'Q': 115, 'P': 114, 'S': 117, 'R': 116, 'U': 119, 'T': 118, 'W': 121, 'V': 120, 'Y': 123, 'X': 122, 'Z': 124, '_': 125, 'a': 126, 'c': 128, 'b': 127, 'e': 130, 'd': 129, 'g': 132, 'f': 131, 'i': 134, 'h': 133, 'k': 136, 'j': 135, 'm': 138, 'l': 137, 'o': 140, 'n': 139, 'q': 142, 'p': 141, 's': 144, 'r': 143, 'u': 146, 't': 145, 'w': 148, 'v': 147, 'y': 150, 'x': 149, 'z': 151},
+    {'1': 90, '0': 89, '3': 92, '2': 91, '5': 94, '4': 93, '7': 96, '6': 95, '9': 98, '8': 97, 'A': 99, 'C': 101, 'B': 100, 'E': 103, 'D': 102, 'G': 105, 'F': 104, 'I': 107, 'H': 106, 'K': 109, 'J': 108, 'M': 111, 'L': 110, 'O': 113, 'N': 112, 'Q': 115, 'P': 114, 'S': 117, 'R': 116, 'U': 119, 'T': 118, 'W': 121, 'V': 120, 'Y': 123, 'X': 122, 'Z': 124, '_': 125, 'a': 126, 'c': 128, 'b': 127, 'e': 130, 'd': 129, 'g': 132, 'f': 131, 'i': 134, 'h': 133, 'k': 136, 'j': 135, 'm': 138, 'l': 137, 'o': 140, 'n': 139, 'q': 142, 'p': 141, 's': 144, 'r': 143, 'u': 146, 't': 145, 'w': 148, 'v': 147, 'y': 150, 'x': 149, 'z': 151},
+    {'1': 90, '0': 89, '3': 92, '2': 91, '5': 94, '4': 93, '7': 96, '6': 95, '9': 98, '8': 97, 'A': 99, 'C': 101, 'B': 100, 'E': 103, 'D': 102, 'G': 105, 'F': 104, 'I': 107, 'H': 106, 'K': 109, 'J': 108, 'M': 111, 'L': 110, 'O': 113, 'N': 112, 'Q': 115, 'P': 114, 'S': 117, 'R': 116, 'U': 119, 'T': 118, 'W': 121, 'V': 120, 'Y': 123, 'X': 122, 'Z': 124, '_': 125, 'a': 126, 'c': 128, 'b': 127, 'e': 130, 'd': 129, 'g': 132, 'f': 131, 'i': 134, 'h': 133, 'k': 136, 'j': 135, 'm': 138, 'l': 137, 'o': 140, 'n': 139, 'q': 142, 'p': 141, 's': 144, 'r': 143, 'u': 146, 't': 145, 'w': 148, 'v': 147, 'y': 150, 'x': 149, 'z': 151},
+    {'1': 90, '0': 89, '3': 92, '2': 91, '5': 94, '4': 93, '7': 96, '6': 95, '9': 98, '8': 97, 'A': 99, 'C': 101, 'B': 100, 'E': 103, 'D': 102, 'G': 105, 'F': 104, 'I': 107, 'H': 106, 'K': 109, 'J': 108, 'M': 111, 'L': 110, 'O': 113, 'N': 112, 'Q': 115, 'P': 114, 'S': 117, 'R': 116, 'U': 119, 'T': 118, 'W': 121, 'V': 120, 'Y': 123, 'X': 122, 'Z': 124, '_': 125, 'a': 126, 'c': 128, 'b': 127, 'e': 130, 'd': 129, 'g': 132, 'f': 131, 'i': 134, 'h': 133, 'k': 136, 'j': 135, 'm': 138, 'l': 137, 'o': 140, 'n': 139, 'q': 142, 'p': 141, 's': 144, 'r': 143, 'u': 146, 't': 145, 'w': 148, 'v': 147, 'y': 150, 'x': 149, 'z': 151},
+    {'1': 90, '0': 89, '3': 92, '2': 91, '5': 94, '4': 93, '7': 96, '6': 95, '9': 98, '8': 97, 'A': 99, 'C': 101, 'B': 100, 'E': 103, 'D': 102, 'G': 105, 'F': 104, 'I': 107, 'H': 106, 'K': 109, 'J': 108, 'M': 111, 'L': 110, 'O': 113, 'N': 112, 'Q': 115, 'P': 114, 'S': 117, 'R': 116, 'U': 119, 'T': 118, 'W': 121, 'V': 120, 'Y': 123, 'X': 122, 'Z': 124, '_': 125, 'a': 126, 'c': 128, 'b': 127, 'e': 130, 'd': 129, 'g': 132, 'f': 131, 'i': 134, 'h': 133, 'k': 136, 'j': 135, 'm': 138, 'l': 137, 'o': 140, 'n': 139, 'q': 142, 'p': 141, 's': 144, 'r': 143, 'u': 146, 't': 145, 'w': 148, 'v': 147, 'y': 150, 'x': 149, 'z': 151},
+    {'1': 90, '0': 89, '3': 92, '2': 91, '5': 94, '4': 93, '7': 96, '6': 95, '9': 98, '8': 97, 'A': 99, 'C': 101, 'B': 100, 'E': 103, 'D': 102, 'G': 105, 'F': 104, 'I': 107, 'H': 106, 'K': 109, 'J': 108, 'M': 111, 'L': 110, 'O': 113, 'N': 112, 'Q': 115, 'P': 114, 'S': 117, 'R': 116, 'U': 119, 'T': 118, 'W': 121, 'V': 120, 'Y': 123, 'X': 122, 'Z': 124, '_': 125, 'a': 126, 'c': 128, 'b': 127, 'e': 130, 'd': 129, 'g': 132, 'f': 131, 'i': 134, 'h': 133, 'k': 136, 'j': 135, 'm': 138, 'l': 137, 'o': 140, 'n': 139, 'q': 142, 'p': 141, 's': 144, 'r': 143, 'u': 146, 't': 145, 'w': 148, 'v': 147, 'y': 150, 'x': 149, 'z': 151},
+    {'1': 90, '0': 89, '3': 92, '2': 91, '5': 94, '4': 93, '7': 96, '6': 95, '9': 98, '8': 97, 'A': 99, 'C': 101, 'B': 100, 'E': 103, 'D': 102, 'G': 105, 'F': 104, 'I': 107, 'H': 106, 'K': 109, 'J': 108, 'M': 111, 'L': 110, 'O': 113, 'N': 112, 'Q': 115, 'P': 114, 'S': 117, 'R': 116, 'U': 119, 'T': 118, 'W': 121, 'V': 120, 'Y': 123, 'X': 122, 'Z': 124, '_': 125, 'a': 126, 'c': 128, 'b': 127, 'e': 130, 'd': 129, 'g': 132, 'f': 131, 'i': 134, 'h': 133, 'k': 136, 'j': 135, 'm': 138, 'l': 137, 'o': 140, 'n': 139, 'q': 142, 'p': 141, 's': 144, 'r': 143, 'u': 146, 't': 145, 'w': 148, 'v': 147, 'y': 150, 'x': 149, 'z': 151},
+    {'1': 90, '0': 89, '3': 92, '2': 91, '5': 94, '4': 93, '7': 96, '6': 95, '9': 98, '8': 97, 'A': 99, 'C': 101, 'B': 100, 'E': 103, 'D': 102, 'G': 105, 'F': 104, 'I': 107, 'H': 106, 'K': 109, 'J': 108, 'M': 111, 'L': 110, 'O': 113, 'N': 112, 'Q': 115, 'P': 114, 'S': 117, 'R': 116, 'U': 119, 'T': 118, 'W': 121, 'V': 120, 'Y': 123, 'X': 122, 'Z': 124, '_': 125, 'a': 126, 'c': 128, 'b': 127, 'e': 130, 'd': 129, 'g': 132, 'f': 131, 'i': 134, 'h': 133, 'k': 136, 'j': 135, 'm': 138, 'l': 137, 'o': 140, 'n': 139, 'q': 142, 'p': 141, 's': 144, 'r': 143, 'u': 146, 't': 145, 'w': 148, 'v': 147, 'y': 150, 'x': 149, 'z': 151},
+    {'1': 90, '0': 89, '3': 92, '2': 91, '5': 94, '4': 93, '7': 96, '6': 95, '9': 98, '8': 97, 'A': 99, 'C': 101, 'B': 100, 'E': 103, 'D': 102, 'G': 105, 'F': 104, 'I': 107, 'H': 106, 'K': 109, 'J': 108, 'M': 111, 'L': 110, 'O': 113, 'N': 112, 'Q': 115, 'P': 114, 'S': 117, 'R': 116, 'U': 119, 'T': 118, 'W': 121, 'V': 120, 'Y': 123, 'X': 122, 'Z': 124, '_': 125, 'a': 126, 'c': 128, 'b': 127, 'e': 130, 'd': 129, 'g': 132, 'f': 131, 'i': 134, 'h': 133, 'k': 136, 'j': 135, 'm': 138, 'l': 137, 'o': 140, 'n': 139, 'q': 142, 'p': 141, 's': 144, 'r': 143, 'u': 146, 't': 145, 'w': 148, 'v': 147, 'y': 150, 'x': 149, 'z': 151},
+    {'1': 90, '0': 89, '3': 92, '2': 91, '5': 94, '4': 93, '7': 96, '6': 95, '9': 98, '8': 97, 'A': 99, 'C': 101, 'B': 100, 'E': 103, 'D': 102, 'G': 105, 'F': 104, 'I': 107, 'H': 106, 'K': 109, 'J': 108, 'M': 111, 'L': 110, 'O': 113, 'N': 112, 'Q': 115, 'P': 114, 'S': 117, 'R': 116, 'U': 119, 'T': 118, 'W': 121, 'V': 120, 'Y': 123, 'X': 122, 'Z': 124, '_': 125, 'a': 126, 'c': 128, 'b': 127, 'e': 130, 'd': 129, 'g': 132, 'f': 131, 'i': 134, 'h': 133, 'k': 136, 'j': 135, 'm': 138, 'l': 137, 'o': 140, 'n': 139, 'q': 142, 'p': 141, 's': 144, 'r': 143, 'u': 146, 't': 145, 'w': 148, 'v': 147, 'y': 150, 'x': 149, 'z': 151},
+    {'1': 90, '0': 89, '3': 92, '2': 91, '5': 94, '4': 93, '7': 96, '6': 95, '9': 98, '8': 97, 'A': 99, 'C': 101, 'B': 100, 'E': 103, 'D': 102, 'G': 105, 'F': 104, 'I': 107, 'H': 106, 'K': 109, 'J': 108, 'M': 111, 'L': 110, 'O': 113, 'N': 112, 'Q': 115, 'P': 114, 'S': 117, 'R': 116, 'U': 119, 'T': 118, 'W': 121, 'V': 120, 'Y': 123, 'X': 122, 'Z': 124, '_': 125, 'a': 126, 'c': 128, 'b': 127, 'e': 130, 'd': 129, 'g': 132, 'f': 131, 'i': 134, 'h': 133, 'k': 136, 'j': 135, 'm': 138, 'l': 137, 'o': 140, 'n': 139, 'q': 142, 'p': 141, 's': 144, 'r': 143, 'u': 146, 't': 145, 'w': 148, 'v': 147, 'y': 150, 'x': 149, 'z': 151},
+    {'1': 90, '0': 89, '3': 92, '2': 91, '5': 94, '4': 93, '7': 96, '6': 95, '9': 98, '8': 97, 'A': 99, 'C': 101, 'B': 100, 'E': 103, 'D': 102, 'G': 105, 'F': 104, 'I': 107, 'H': 106, 'K': 109, 'J': 108, 'M': 111, 'L': 110, 'O': 113, 'N': 112, 'Q': 115, 'P': 114, 'S': 117, 'R': 116, 'U': 119, 'T': 118, 'W': 121, 'V': 120, 'Y': 123, 'X': 122, 'Z': 124, '_': 125, 'a': 126, 'c': 128, 'b': 127, 'e': 130, 'd': 129, 'g': 132, 'f': 131, 'i': 134, 'h': 133, 'k': 136, 'j': 135, 'm': 138, 'l': 137, 'o': 140, 'n': 139, 'q': 142, 'p': 141, 's': 144, 'r': 143, 'u': 146, 't': 145, 'w': 148, 'v': 147, 'y': 150, 'x': 149, 'z': 151},
+    {'1': 90, '0': 89, '3': 92, '2': 91, '5': 94, '4': 93, '7': 96, '6': 95, '9': 98, '8': 97, 'A': 99, 'C': 101, 'B': 100, 'E': 103, 'D': 102, 'G': 105, 'F': 104, 'I': 107, 'H': 106, 'K': 109, 'J': 108, 'M': 111, 'L': 110, 'O': 113, 'N': 112, 'Q': 115, 'P': 114, 'S': 117, 'R': 116, 'U': 119, 'T': 118, 'W': 121, 'V': 120, 'Y': 123, 'X': 122, 'Z': 124, '_': 125, 'a': 126, 'c': 128, 'b': 127, 'e': 130, 'd': 129, 'g': 132, 'f': 131, 'i': 134, 'h': 133, 'k': 136, 'j': 135, 'm': 138, 'l': 137, 'o': 140, 'n': 139, 'q': 142, 'p': 141, 's': 144, 'r': 143, 'u': 146, 't': 145, 'w': 148, 'v': 147, 'y': 150, 'x': 149, 'z': 151},
+    {'1': 90, '0': 89, '3': 92, '2': 91, '5': 94, '4': 93, '7': 96, '6': 95, '9': 98, '8': 97, 'A': 99, 'C': 101, 'B': 100, 'E': 103, 'D': 102, 'G': 105, 'F': 104, 'I': 107, 'H': 106, 'K': 109, 'J': 108, 'M': 111, 'L': 110, 'O': 113, 'N': 112, 'Q': 115, 'P': 114, 'S': 117, 'R': 116, 'U': 119, 'T': 118, 'W': 121, 'V': 120, 'Y': 123, 'X': 122, 'Z': 124, '_': 125, 'a': 126, 'c': 128, 'b': 127, 'e': 130, 'd': 129, 'g': 132, 'f': 131, 'i': 134, 'h': 133, 'k': 136, 'j': 135, 'm': 138, 'l': 137, 'o': 140, 'n': 139, 'q': 142, 'p': 141, 's': 144, 'r': 143, 'u': 146, 't': 145, 'w': 148, 'v': 147, 'y': 150, 'x': 149, 'z': 151},
+    {'1': 90, '0': 89, '3': 92, '2': 91, '5': 94, '4': 93, '7': 96, '6': 95, '9': 98, '8': 97, 'A': 99, 'C': 101, 'B': 100, 'E': 103, 'D': 102, 'G': 105, 'F': 104, 'I': 107, 'H': 106, 'K': 109, 'J': 108, 'M': 111, 'L': 110, 'O': 113, 'N': 112, 'Q': 115, 'P': 114, 'S': 117, 'R': 116, 'U': 119, 'T': 118, 'W': 121, 'V': 120, 'Y': 123, 'X': 122, 'Z': 124, '_': 125, 'a': 126, 'c': 128, 'b': 127, 'e': 130, 'd': 129, 'g': 132, 'f': 131, 'i': 134, 'h': 133, 'k': 136, 'j': 135, 'm': 138, 'l': 137, 'o': 140, 'n': 139, 'q': 142, 'p': 141, 's': 144, 'r': 143, 'u': 146, 't': 145, 'w': 148, 'v': 147, 'y': 150, 'x': 149, 'z': 151},
+    {'1': 90, '0': 89, '3': 92, '2': 91, '5': 94, '4': 93, '7': 96, '6': 95, '9': 98, '8': 97, 'A': 99, 'C': 101, 'B': 100, 'E': 103, 'D': 102, 'G': 105, 'F': 104, 'I': 107, 'H': 106, 'K': 109, 'J': 108, 'M': 111, 'L': 110, 'O': 113, 'N': 112, 'Q': 115, 'P': 114, 'S': 117, 'R': 116, 'U': 119, 'T': 118, 'W': 121, 'V': 120, 'Y': 123, 'X': 122, 'Z': 124, '_': 125, 'a': 126, 'c': 128, 'b': 127, 'e': 130, 'd': 129, 'g': 132, 'f': 131, 'i': 134, 'h': 133, 'k': 136, 'j': 135, 'm': 138, 'l': 137, 'o': 140, 'n': 139, 'q': 142, 'p': 141, 's': 144, 'r': 143, 'u': 146, 't': 145, 'w': 148, 'v': 147, 'y': 150, 'x': 149, 'z': 151},
+    {'1': 90, '0': 89, '3': 92, '2': 91, '5': 94, '4': 93, '7': 96, '6': 95, '9': 98, '8': 97, 'A': 99, 'C': 101, 'B': 100, 'E': 103, 'D': 102, 'G': 105, 'F': 104, 'I': 107, 'H': 106, 'K': 109, 'J': 108, 'M': 111, 'L': 110, 'O': 113, 'N': 112, 'Q': 115, 'P': 114, 'S': 117, 'R': 116, 'U': 119, 'T': 118, 'W': 121, 'V': 120, 'Y': 123, 'X': 122, 'Z': 124, '_': 125, 'a': 126, 'c': 128, 'b': 127, 'e': 130, 'd': 129, 'g': 132, 'f': 131, 'i': 134, 'h': 133, 'k': 136, 'j': 135, 'm': 138, 'l': 137, 'o': 140, 'n': 139, 'q': 142, 'p': 141, 's': 144, 'r': 143, 'u': 146, 't': 145, 'w': 148, 'v': 147, 'y': 150, 'x': 149, 'z': 151},
+    {'1': 90, '0': 89, '3': 92, '2': 91, '5': 94, '4': 93, '7': 96, '6': 95, '9': 98, '8': 97, 'A': 99, 'C': 101, 'B': 100, 'E': 103, 'D': 102, 'G': 105, 'F': 104, 'I': 107, 'H': 106, 'K': 109, 'J': 108, 'M': 111, 'L': 110, 'O': 113, 'N': 112, 'Q': 115, 'P': 114, 'S': 117, 'R': 116, 'U': 119, 'T': 118, 'W': 121, 'V': 120, 'Y': 123, 'X': 122, 'Z': 124, '_': 125, 'a': 126, 'c': 128, 'b': 127, 'e': 130, 'd': 129, 'g': 132, 'f': 131, 'i': 134, 'h': 133, 'k': 136, 'j': 135, 'm': 138, 'l': 137, 'o': 140, 'n': 139, 'q': 142, 'p': 141, 's': 144, 'r': 143, 'u': 146, 't': 145, 'w': 148, 'v': 147, 'y': 150, 'x': 149, 'z': 151},
+    {'1': 90, '0': 89, '3': 92, '2': 91, '5': 94, '4': 93, '7': 96, '6': 95, '9': 98, '8': 97, 'A': 99, 'C': 101, 'B': 100, 'E': 103, 'D': 102, 'G': 105, 'F': 104, 'I': 107, 'H': 106, 'K': 109, 'J': 108, 'M': 111, 'L': 110, 'O': 113, 'N': 112, 'Q': 115, 'P': 114, 'S': 117, 'R': 116, 'U': 119, 'T': 118, 'W': 121, 'V': 120, 'Y': 123, 'X': 122, 'Z': 124, '_': 125, 'a': 126, 'c': 128, 'b': 127, 'e': 130, 'd': 129, 'g': 132, 'f': 131, 'i': 134, 'h': 133, 'k': 136, 'j': 135, 'm': 138, 'l': 137, 'o': 140, 'n': 139, 'q': 142, 'p': 141, 's': 144, 'r': 143, 'u': 146, 't': 145, 'w': 148, 'v': 147, 'y': 150, 'x': 149, 'z': 151},
+    {'1': 90, '0': 89, '3': 92, '2': 91, '5': 94, '4': 93, '7': 96, '6': 95, '9': 98, '8': 97, 'A': 99, 'C': 101, 'B': 100, 'E': 103, 'D': 102, 'G': 105, 'F': 104, 'I': 107, 'H': 106, 'K': 109, 'J': 108, 'M': 111, 'L': 110, 'O': 113, 'N': 112, 'Q': 115, 'P': 114, 'S': 117, 'R': 116, 'U': 119, 'T': 118, 'W': 121, 'V': 120, 'Y': 123, 'X': 122, 'Z': 124, '_': 125, 'a': 126, 'c': 128, 'b': 127, 'e': 130, 'd': 129, 'g': 132, 'f': 131, 'i': 134, 'h': 133, 'k': 136, 'j': 135, 'm': 138, 'l': 137, 'o': 140, 'n': 139, 'q': 142, 'p': 141, 's': 144, 'r': 143, 'u': 146, 't': 145, 'w': 148, 'v': 147, 'y': 150, 'x': 149, 'z': 151},
+    {'1': 90, '0': 89, '3': 92, '2': 91, '5': 94, '4': 93, '7': 96, '6': 95, '9': 98, '8': 97, 'A': 99, 'C': 101, 'B': 100, 'E': 103, 'D': 102, 'G': 105, 'F': 104, 'I': 107, 'H': 106, 'K': 109, 'J': 108, 'M': 111, 'L': 110, 'O': 113, 'N': 112, 'Q': 115, 'P': 114, 'S': 117, 'R': 116, 'U': 119, 'T': 118, 'W': 121, 'V': 120, 'Y': 123, 'X': 122, 'Z': 124, '_': 125, 'a': 126, 'c': 128, 'b': 127, 'e': 130, 'd': 129, 'g': 132, 'f': 131, 'i': 134, 'h': 133, 'k': 136, 'j': 135, 'm': 138, 'l': 137, 'o': 140, 'n': 139, 'q': 142, 'p': 141, 's': 144, 'r': 143, 'u': 146, 't': 145, 'w': 148, 'v': 147, 'y': 150, 'x': 149, 'z': 151},
+    {'1': 90, '0': 89, '3': 92, '2': 91, '5': 94, '4': 93, '7': 96, '6': 95, '9': 98, '8': 97, 'A': 99, 'C': 101, 'B': 100, 'E': 103, 'D': 102, 'G': 105, 'F': 104, 'I': 107, 'H': 106, 'K': 109, 'J': 108, 'M': 111, 'L': 110, 'O': 113, 'N': 112, 'Q': 115, 'P': 114, 'S': 117, 'R': 116, 'U': 119, 'T': 118, 'W': 121, 'V': 120, 'Y': 123, 'X': 122, 'Z': 124, '_': 125, 'a': 126, 'c': 128, 'b': 127, 'e': 130, 'd': 129, 'g': 132, 'f': 131, 'i': 134, 'h': 133, 'k': 136, 'j': 135, 'm': 138, 'l': 137, 'o': 140, 'n': 139, 'q': 142, 'p': 141, 's': 144, 'r': 143, 'u': 146, 't': 145, 'w': 148, 'v': 147, 'y': 150, 'x': 149, 'z': 151},
+    {'1': 90, '0': 89, '3': 92, '2': 91, '5': 94, '4': 93, '7': 96, '6': 95, '9': 98, '8': 97, 'A': 99, 'C': 101, 'B': 100, 'E': 103, 'D': 102, 'G': 105, 'F': 104, 'I': 107, 'H': 106, 'K': 109, 'J': 108, 'M': 111, 'L': 110, 'O': 113, 'N': 112, 'Q': 115, 'P': 114, 'S': 117, 'R': 116, 'U': 119, 'T': 118, 'W': 121, 'V': 120, 'Y': 123, 'X': 122, 'Z': 124, '_': 125, 'a': 126, 'c': 128, 'b': 127, 'e': 130, 'd': 129, 'g': 132, 'f': 131, 'i': 134, 'h': 133, 'k': 136, 'j': 135, 'm': 138, 'l': 137, 'o': 140, 'n': 139, 'q': 142, 'p': 141, 's': 144, 'r': 143, 'u': 146, 't': 145, 'w': 148, 'v': 147, 'y': 150, 'x': 149, 'z': 151},
+    {'1': 90, '0': 89, '3': 92, '2': 91, '5': 94, '4': 93, '7': 96, '6': 95, '9': 98, '8': 97, 'A': 99, 'C': 101, 'B': 100, 'E': 103, 'D': 102, 'G': 105, 'F': 104, 'I': 107, 'H': 106, 'K': 109, 'J': 108, 'M': 111, 'L': 110, 'O': 113, 'N': 112, 'Q': 115, 'P': 114, 'S': 117, 'R': 116, 'U': 119, 'T': 118, 'W': 121, 'V': 120, 'Y': 123, 'X': 122, 'Z': 124, '_': 125, 'a': 126, 'c': 128, 'b': 127, 'e': 130, 'd': 129, 'g': 132, 'f': 131, 'i': 134, 'h': 133, 'k': 136, 'j': 135, 'm': 138, 'l': 137, 'o': 140, 'n': 139, 'q': 142, 'p': 141, 's': 144, 'r': 143, 'u': 146, 't': 145, 'w': 148, 'v': 147, 'y': 150, 'x': 149, 'z': 151},
+    {'1': 90, '0': 89, '3': 92, '2': 91, '5': 94, '4': 93, '7': 96, '6': 95, '9': 98, '8': 97, 'A': 99, 'C': 101, 'B': 100, 'E': 103, 'D': 102, 'G': 105, 'F': 104, 'I': 107, 'H': 106, 'K': 109, 'J': 108, 'M': 111, 'L': 110, 'O': 113, 'N': 112, 'Q': 115, 'P': 114, 'S': 117, 'R': 116, 'U': 119, 'T': 118, 'W': 121, 'V': 120, 'Y': 123, 'X': 122, 'Z': 124, '_': 125, 'a': 126, 'c': 128, 'b': 127, 'e': 130, 'd': 129, 'g': 132, 'f': 131, 'i': 134, 'h': 133, 'k': 136, 'j': 135, 'm': 138, 'l': 137, 'o': 140, 'n': 139, 'q': 142, 'p': 141, 's': 144, 'r': 143, 'u': 146, 't': 145, 'w': 148, 'v': 147, 'y': 150, 'x': 149, 'z': 151},
+    {'1': 90, '0': 89, '3': 92, '2': 91, '5': 94, '4': 93, '7': 96, '6': 95, '9': 98, '8': 97, 'A': 99, 'C': 101, 'B': 100, 'E': 103, 'D': 102, 'G': 105, 'F': 104, 'I': 107, 'H': 106, 'K': 109, 'J': 108, 'M': 111, 'L': 110, 'O': 113, 'N': 112, 'Q': 115, 'P': 114, 'S': 117, 'R': 116, 'U': 119, 'T': 118, 'W': 121, 'V': 120, 'Y': 123, 'X': 122, 'Z': 124, '_': 125, 'a': 126, 'c': 128, 'b': 127, 'e': 130, 'd': 129, 'g': 132, 'f': 131, 'i': 134, 'h': 133, 'k': 136, 'j': 135, 'm': 138, 'l': 137, 'o': 140, 'n': 139, 'q': 142, 'p': 141, 's': 144, 'r': 143, 'u': 146, 't': 145, 'w': 148, 'v': 147, 'y': 150, 'x': 149, 'z': 151},
+    {'1': 90, '0': 89, '3': 92, '2': 91, '5': 94, '4': 93, '7': 96, '6': 95, '9': 98, '8': 97, 'A': 99, 'C': 101, 'B': 100, 'E': 103, 'D': 102, 'G': 105, 'F': 104, 'I': 107, 'H': 106, 'K': 109, 'J': 108, 'M': 111, 'L': 110, 'O': 113, 'N': 112, 'Q': 115, 'P': 114, 'S': 117, 'R': 116, 'U': 119, 'T': 118, 'W': 121, 'V': 120, 'Y': 123, 'X': 122, 'Z': 124, '_': 125, 'a': 126, 'c': 128, 'b': 127, 'e': 130, 'd': 129, 'g': 132, 'f': 131, 'i': 134, 'h': 133, 'k': 136, 'j': 135, 'm': 138, 'l': 137, 'o': 140, 'n': 139, 'q': 142, 'p': 141, 's': 144, 'r': 143, 'u': 146, 't': 145, 'w': 148, 'v': 147, 'y': 150, 'x': 149, 'z': 151},
+    {'1': 90, '0': 89, '3': 92, '2': 91, '5': 94, '4': 93, '7': 96, '6': 95, '9': 98, '8': 97, 'A': 99, 'C': 101, 'B': 100, 'E': 103, 'D': 102, 'G': 105, 'F': 104, 'I': 107, 'H': 106, 'K': 109, 'J': 108, 'M': 111, 'L': 110, 'O': 113, 'N': 112, 'Q': 115, 'P': 114, 'S': 117, 'R': 116, 'U': 119, 'T': 118, 'W': 121, 'V': 120, 'Y': 123, 'X': 122, 'Z': 124, '_': 125, 'a': 126, 'c': 128, 'b': 127, 'e': 130, 'd': 129, 'g': 132, 'f': 131, 'i': 134, 'h': 133, 'k': 136, 'j': 135, 'm': 138, 'l': 137, 'o': 140, 'n': 139, 'q': 142, 'p': 141, 's': 144, 'r': 143, 'u': 146, 't': 145, 'w': 148, 'v': 147, 'y': 150, 'x': 149, 'z': 151},
+    {'1': 90, '0': 89, '3': 92, '2': 91, '5': 94, '4': 93, '7': 96, '6': 95, '9': 98, '8': 97, 'A': 99, 'C': 101, 'B': 100, 'E': 103, 'D': 102, 'G': 105, 'F': 104, 'I': 107, 'H': 106, 'K': 109, 'J': 108, 'M': 111, 'L': 110, 'O': 113, 'N': 112, 'Q': 115, 'P': 114, 'S': 117, 'R': 116, 'U': 119, 'T': 118, 'W': 121, 'V': 120, 'Y': 123, 'X': 122, 'Z': 124, '_': 125, 'a': 126, 'c': 128, 'b': 127, 'e': 130, 'd': 129, 'g': 132, 'f': 131, 'i': 134, 'h': 133, 'k': 136, 'j': 135, 'm': 138, 'l': 137, 'o': 140, 'n': 139, 'q': 142, 'p': 141, 's': 144, 'r': 143, 'u': 146, 't': 145, 'w': 148, 'v': 147, 'y': 150, 'x': 149, 'z': 151},
+    {'1': 90, '0': 89, '3': 92, '2': 91, '5': 94, '4': 93, '7': 96, '6': 95, '9': 98, '8': 97, 'A': 99, 'C': 101, 'B': 100, 'E': 103, 'D': 102, 'G': 105, 'F': 104, 'I': 107, 'H': 106, 'K': 109, 'J': 108, 'M': 111, 'L': 110, 'O': 113, 'N': 112, 'Q': 115, 'P': 114, 'S': 117, 'R': 116, 'U': 119, 'T': 118, 'W': 121, 'V': 120, 'Y': 123, 'X': 122, 'Z': 124, '_': 125, 'a': 126, 'c': 128, 'b': 127, 'e': 130, 'd': 129, 'g': 132, 'f': 131, 'i': 134, 'h': 133, 'k': 136, 'j': 135, 'm': 138, 'l': 137, 'o': 140, 'n': 139, 'q': 142, 'p': 141, 's': 144, 'r': 143, 'u': 146, 't': 145, 'w': 148, 'v': 147, 'y': 150, 'x': 149, 'z': 151},
+    {'1': 90, '0': 89, '3': 92, '2': 91, '5': 94, '4': 93, '7': 96, '6': 95, '9': 98, '8': 97, 'A': 99, 'C': 101, 'B': 100, 'E': 103, 'D': 102, 'G': 105, 'F': 104, 'I': 107, 'H': 106, 'K': 109, 'J': 108, 'M': 111, 'L': 110, 'O': 113, 'N': 112, 'Q': 115, 'P': 114, 'S': 117, 'R': 116, 'U': 119, 'T': 118, 'W': 121, 'V': 120, 'Y': 123, 'X': 122, 'Z': 124, '_': 125, 'a': 126, 'c': 128, 'b': 127, 'e': 130, 'd': 129, 'g': 132, 'f': 131, 'i': 134, 'h': 133, 'k': 136, 'j': 135, 'm': 138, 'l': 137, 'o': 140, 'n': 139, 'q': 142, 'p': 141, 's': 144, 'r': 143, 'u': 146, 't': 145, 'w': 148, 'v': 147, 'y': 150, 'x': 149, 'z': 151},
+    {'1': 90, '0': 89, '3': 92, '2': 91, '5': 94, '4': 93, '7': 96, '6': 95, '9': 98, '8': 97, 'A': 99, 'C': 101, 'B': 100, 'E': 103, 'D': 102, 'G': 105, 'F': 104, 'I': 107, 'H': 106, 'K': 109, 'J': 108, 'M': 111, 'L': 110, 'O': 113, 'N': 112, 'Q': 115, 'P': 114, 'S': 117, 'R': 116, 'U': 119, 'T': 118, 'W': 121, 'V': 120, 'Y': 123, 'X': 122, 'Z': 124, '_': 125, 'a': 126, 'c': 128, 'b': 127, 'e': 130, 'd': 129, 'g': 132, 'f': 131, 'i': 134, 'h': 133, 'k': 136, 'j': 135, 'm': 138, 'l': 137, 'o': 140, 'n': 139, 'q': 142, 'p': 141, 's': 144, 'r': 143, 'u': 146, 't': 145, 'w': 148, 'v': 147, 'y': 150, 'x': 149, 'z': 151},
+    {'1': 90, '0': 89, '3': 92, '2': 91, '5': 94, '4': 93, '7': 96, '6': 95, '9': 98, '8': 97, 'A': 99, 'C': 101, 'B': 100, 'E': 103, 'D': 102, 'G': 105, 'F': 104, 'I': 107, 'H': 106, 'K': 109, 'J': 108, 'M': 111, 'L': 110, 'O': 113, 'N': 112, 'Q': 115, 'P': 114, 'S': 117, 'R': 116, 'U': 119, 'T': 118, 'W': 121, 'V': 120, 'Y': 123, 'X': 122, 'Z': 124, '_': 125, 'a': 126, 'c': 128, 'b': 127, 'e': 130, 'd': 129, 'g': 132, 'f': 131, 'i': 134, 'h': 133, 'k': 136, 'j': 135, 'm': 138, 'l': 137, 'o': 140, 'n': 139, 'q': 142, 'p': 141, 's': 144, 'r': 143, 'u': 146, 't': 145, 'w': 148, 'v': 147, 'y': 150, 'x': 149, 'z': 151},
+    {'1': 90, '0': 89, '3': 92, '2': 91, '5': 94, '4': 93, '7': 96, '6': 95, '9': 98, '8': 97, 'A': 99, 'C': 101, 'B': 100, 'E': 103, 'D': 102, 'G': 105, 'F': 104, 'I': 107, 'H': 106, 'K': 109, 'J': 108, 'M': 111, 'L': 110, 'O': 113, 'N': 112, 'Q': 115, 'P': 114, 'S': 117, 'R': 116, 'U': 119, 'T': 118, 'W': 121, 'V': 120, 'Y': 123, 'X': 122, 'Z': 124, '_': 125, 'a': 126, 'c': 128, 'b': 127, 'e': 130, 'd': 129, 'g': 132, 'f': 131, 'i': 134, 'h': 133, 'k': 136, 'j': 135, 'm': 138, 'l': 137, 'o': 140, 'n': 139, 'q': 142, 'p': 141, 's': 144, 'r': 143, 'u': 146, 't': 145, 'w': 148, 'v': 147, 'y': 150, 'x': 149, 'z': 151},
+    {'1': 90, '0': 89, '3': 92, '2': 91, '5': 94, '4': 93, '7': 96, '6': 95, '9': 98, '8': 97, 'A': 99, 'C': 101, 'B': 100, 'E': 103, 'D': 102, 'G': 105, 'F': 104, 'I': 107, 'H': 106, 'K': 109, 'J': 108, 'M': 111, 'L': 110, 'O': 113, 'N': 112, 'Q': 115, 'P': 114, 'S': 117, 'R': 116, 'U': 119, 'T': 118, 'W': 121, 'V': 120, 'Y': 123, 'X': 122, 'Z': 124, '_': 125, 'a': 126, 'c': 128, 'b': 127, 'e': 130, 'd': 129, 'g': 132, 'f': 131, 'i': 134, 'h': 133, 'k': 136, 'j': 135, 'm': 138, 'l': 137, 'o': 140, 'n': 139, 'q': 142, 'p': 141, 's': 144, 'r': 143, 'u': 146, 't': 145, 'w': 148, 'v': 147, 'y': 150, 'x': 149, 'z': 151},
+    {'1': 90, '0': 89, '3': 92, '2': 91, '5': 94, '4': 93, '7': 96, '6': 95, '9': 98, '8': 97, 'A': 99, 'C': 101, 'B': 100, 'E': 103, 'D': 102, 'G': 105, 'F': 104, 'I': 107, 'H': 106, 'K': 109, 'J': 108, 'M': 111, 'L': 110, 'O': 113, 'N': 112, 'Q': 115, 'P': 114, 'S': 117, 'R': 116, 'U': 119, 'T': 118, 'W': 121, 'V': 120, 'Y': 123, 'X': 122, 'Z': 124, '_': 125, 'a': 126, 'c': 128, 'b': 127, 'e': 130, 'd': 129, 'g': 132, 'f': 131, 'i': 134, 'h': 133, 'k': 136, 'j': 135, 'm': 138, 'l': 137, 'o': 140, 'n': 139, 'q': 142, 'p': 141, 's': 144, 'r': 143, 'u': 146, 't': 145, 'w': 148, 'v': 147, 'y': 150, 'x': 149, 'z': 151},
+    {'1': 90, '0': 89, '3': 92, '2': 91, '5': 94, '4': 93, '7': 96, '6': 95, '9': 98, '8': 97, 'A': 99, 'C': 101, 'B': 100, 'E': 103, 'D': 102, 'G': 105, 'F': 104, 'I': 107, 'H': 106, 'K': 109, 'J': 108, 'M': 111, 'L': 110, 'O': 113, 'N': 112, 'Q': 115, 'P': 114, 'S': 117, 'R': 116, 'U': 119, 'T': 118, 'W': 121, 'V': 120, 'Y': 123, 'X': 122, 'Z': 124, '_': 125, 'a': 126, 'c': 128, 'b': 127, 'e': 130, 'd': 129, 'g': 132, 'f': 131, 'i': 134, 'h': 133, 'k': 136, 'j': 135, 'm': 138, 'l': 137, 'o': 140, 'n': 139, 'q': 142, 'p': 141, 's': 144, 'r': 143, 'u': 146, 't': 145, 'w': 148, 'v': 147, 'y': 150, 'x': 149, 'z': 151},
+    {'1': 90, '0': 89, '3': 92, '2': 91, '5': 94, '4': 93, '7': 96, '6': 95, '9': 98, '8': 97, 'A': 99, 'C': 101, 'B': 100, 'E': 103, 'D': 102, 'G': 105, 'F': 104, 'I': 107, 'H': 106, 'K': 109, 'J': 108, 'M': 111, 'L': 110, 'O': 113, 'N': 112, 'Q': 115, 'P': 114, 'S': 117, 'R': 116, 'U': 119, 'T': 118, 'W': 121, 'V': 120, 'Y': 123, 'X': 122, 'Z': 124, '_': 125, 'a': 126, 'c': 128, 'b': 127, 'e': 130, 'd': 129, 'g': 132, 'f': 131, 'i': 134, 'h': 133, 'k': 136, 'j': 135, 'm': 138, 'l': 137, 'o': 140, 'n': 139, 'q': 142, 'p': 141, 's': 144, 'r': 143, 'u': 146, 't': 145, 'w': 148, 'v': 147, 'y': 150, 'x': 149, 'z': 151},
+    {'1': 90, '0': 89, '3': 92, '2': 91, '5': 94, '4': 93, '7': 96, '6': 95, '9': 98, '8': 97, 'A': 99, 'C': 101, 'B': 100, 'E': 103, 'D': 102, 'G': 105, 'F': 104, 'I': 107, 'H': 106, 'K': 109, 'J': 108, 'M': 111, 'L': 110, 'O': 113, 'N': 112, 'Q': 115, 'P': 114, 'S': 117, 'R': 116, 'U': 119, 'T': 118, 'W': 121, 'V': 120, 'Y': 123, 'X': 122, 'Z': 124, '_': 125, 'a': 126, 'c': 128, 'b': 127, 'e': 130, 'd': 129, 'g': 132, 'f': 131, 'i': 134, 'h': 133, 'k': 136, 'j': 135, 'm': 138, 'l': 137, 'o': 140, 'n': 139, 'q': 142, 'p': 141, 's': 144, 'r': 143, 'u': 146, 't': 145, 'w': 148, 'v': 147, 'y': 150, 'x': 149, 'z': 151},
+    {'1': 90, '0': 89, '3': 92, '2': 91, '5': 94, '4': 93, '7': 96, '6': 95, '9': 98, '8': 97, 'A': 99, 'C': 101, 'B': 100, 'E': 103, 'D': 102, 'G': 105, 'F': 104, 'I': 107, 'H': 106, 'K': 109, 'J': 108, 'M': 111, 'L': 110, 'O': 113, 'N': 112, 'Q': 115, 'P': 114, 'S': 117, 'R': 116, 'U': 119, 'T': 118, 'W': 121, 'V': 120, 'Y': 123, 'X': 122, 'Z': 124, '_': 125, 'a': 126, 'c': 128, 'b': 127, 'e': 130, 'd': 129, 'g': 132, 'f': 131, 'i': 134, 'h': 133, 'k': 136, 'j': 135, 'm': 138, 'l': 137, 'o': 140, 'n': 139, 'q': 142, 'p': 141, 's': 144, 'r': 143, 'u': 146, 't': 145, 'w': 148, 'v': 147, 'y': 150, 'x': 149, 'z': 151},
+    {'1': 90, '0': 89, '3': 92, '2': 91, '5': 94, '4': 93, '7': 96, '6': 95, '9': 98, '8': 97, 'A': 99, 'C': 101, 'B': 100, 'E': 103, 'D': 102, 'G': 105, 'F': 104, 'I': 107, 'H': 106, 'K': 109, 'J': 108, 'M': 111, 'L': 110, 'O': 113, 'N': 112, 'Q': 115, 'P': 114, 'S': 117, 'R': 116, 'U': 119, 'T': 118, 'W': 121, 'V': 120, 'Y': 123, 'X': 122, 'Z': 124, '_': 125, 'a': 126, 'c': 128, 'b': 127, 'e': 130, 'd': 129, 'g': 132, 'f': 131, 'i': 134, 'h': 133, 'k': 136, 'j': 135, 'm': 138, 'l': 137, 'o': 140, 'n': 139, 'q': 142, 'p': 141, 's': 144, 'r': 143, 'u': 146, 't': 145, 'w': 148, 'v': 147, 'y': 150, 'x': 149, 'z': 151},
+    {'1': 90, '0': 89, '3': 92, '2': 91, '5': 94, '4': 93, '7': 96, '6': 95, '9': 98, '8': 97, 'A': 99, 'C': 101, 'B': 100, 'E': 103, 'D': 102, 'G': 105, 'F': 104, 'I': 107, 'H': 106, 'K': 109, 'J': 108, 'M': 111, 'L': 110, 'O': 113, 'N': 112, 'Q': 115, 'P': 114, 'S': 117, 'R': 116, 'U': 119, 'T': 118, 'W': 121, 'V': 120, 'Y': 123, 'X': 122, 'Z': 124, '_': 125, 'a': 126, 'c': 128, 'b': 127, 'e': 130, 'd': 129, 'g': 132, 'f': 131, 'i': 134, 'h': 133, 'k': 136, 'j': 135, 'm': 138, 'l': 137, 'o': 140, 'n': 139, 'q': 142, 'p': 141, 's': 144, 'r': 143, 'u': 146, 't': 145, 'w': 148, 'v': 147, 'y': 150, 'x': 149, 'z': 151},
+    {'1': 90, '0': 89, '3': 92, '2': 91, '5': 94, '4': 93, '7': 96, '6': 95, '9': 98, '8': 97, 'A': 99, 'C': 101, 'B': 100, 'E': 103, 'D': 102, 'G': 105, 'F': 104, 'I': 107, 'H': 106, 'K': 109, 'J': 108, 'M': 111, 'L': 110, 'O': 113, 'N': 112, 'Q': 115, 'P': 114, 'S': 117, 'R': 116, 'U': 119, 'T': 118, 'W': 121, 'V': 120, 'Y': 123, 'X': 122, 'Z': 124, '_': 125, 'a': 126, 'c': 128, 'b': 127, 'e': 130, 'd': 129, 'g': 132, 'f': 131, 'i': 134, 'h': 133, 'k': 136, 'j': 135, 'm': 138, 'l': 137, 'o': 140, 'n': 139, 'q': 142, 'p': 141, 's': 144, 'r': 143, 'u': 146, 't': 145, 'w': 148, 'v': 147, 'y': 150, 'x': 149, 'z': 151},
+    {'1': 90, '0': 89, '3': 92, '2': 91, '5': 94, '4': 93, '7': 96, '6': 95, '9': 98, '8': 97, 'A': 99, 'C': 101, 'B': 100, 'E': 103, 'D': 102, 'G': 105, 'F': 104, 'I': 107, 'H': 106, 'K': 109, 'J': 108, 'M': 111, 'L': 110, 'O': 113, 'N': 112, 'Q': 115, 'P': 114, 'S': 117, 'R': 116, 'U': 119, 'T': 118, 'W': 121, 'V': 120, 'Y': 123, 'X': 122, 'Z': 124, '_': 125, 'a': 126, 'c': 128, 'b': 127, 'e': 130, 'd': 129, 'g': 132, 'f': 131, 'i': 134, 'h': 133, 'k': 136, 'j': 135, 'm': 138, 'l': 137, 'o': 140, 'n': 139, 'q': 142, 'p': 141, 's': 144, 'r': 143, 'u': 146, 't': 145, 'w': 148, 'v': 147, 'y': 150, 'x': 149, 'z': 151},
+    {'1': 90, '0': 89, '3': 92, '2': 91, '5': 94, '4': 93, '7': 96, '6': 95, '9': 98, '8': 97, 'A': 99, 'C': 101, 'B': 100, 'E': 103, 'D': 102, 'G': 105, 'F': 104, 'I': 107, 'H': 106, 'K': 109, 'J': 108, 'M': 111, 'L': 110, 'O': 113, 'N': 112, 'Q': 115, 'P': 114, 'S': 117, 'R': 116, 'U': 119, 'T': 118, 'W': 121, 'V': 120, 'Y': 123, 'X': 122, 'Z': 124, '_': 125, 'a': 126, 'c': 128, 'b': 127, 'e': 130, 'd': 129, 'g': 132, 'f': 131, 'i': 134, 'h': 133, 'k': 136, 'j': 135, 'm': 138, 'l': 137, 'o': 140, 'n': 139, 'q': 142, 'p': 141, 's': 144, 'r': 143, 'u': 146, 't': 145, 'w': 148, 'v': 147, 'y': 150, 'x': 149, 'z': 151},
+    {'1': 90, '0': 89, '3': 92, '2': 91, '5': 94, '4': 93, '7': 96, '6': 95, '9': 98, '8': 97, 'A': 99, 'C': 101, 'B': 100, 'E': 103, 'D': 102, 'G': 105, 'F': 104, 'I': 107, 'H': 106, 'K': 109, 'J': 108, 'M': 111, 'L': 110, 'O': 113, 'N': 112, 'Q': 115, 'P': 114, 'S': 117, 'R': 116, 'U': 119, 'T': 118, 'W': 121, 'V': 120, 'Y': 123, 'X': 122, 'Z': 124, '_': 125, 'a': 126, 'c': 128, 'b': 127, 'e': 130, 'd': 129, 'g': 132, 'f': 131, 'i': 134, 'h': 133, 'k': 136, 'j': 135, 'm': 138, 'l': 137, 'o': 140, 'n': 139, 'q': 142, 'p': 141, 's': 144, 'r': 143, 'u': 146, 't': 145, 'w': 148, 'v': 147, 'y': 150, 'x': 149, 'z': 151},
+    {'1': 90, '0': 89, '3': 92, '2': 91, '5': 94, '4': 93, '7': 96, '6': 95, '9': 98, '8': 97, 'A': 99, 'C': 101, 'B': 100, 'E': 103, 'D': 102, 'G': 105, 'F': 104, 'I': 107, 'H': 106, 'K': 109, 'J': 108, 'M': 111, 'L': 110, 'O': 113, 'N': 112, 'Q': 115, 'P': 114, 'S': 117, 'R': 116, 'U': 119, 'T': 118, 'W': 121, 'V': 120, 'Y': 123, 'X': 122, 'Z': 124, '_': 125, 'a': 126, 'c': 128, 'b': 127, 'e': 130, 'd': 129, 'g': 132, 'f': 131, 'i': 134, 'h': 133, 'k': 136, 'j': 135, 'm': 138, 'l': 137, 'o': 140, 'n': 139, 'q': 142, 'p': 141, 's': 144, 'r': 143, 'u': 146, 't': 145, 'w': 148, 'v': 147, 'y': 150, 'x': 149, 'z': 151},
+    {'1': 90, '0': 89, '3': 92, '2': 91, '5': 94, '4': 93, '7': 96, '6': 95, '9': 98, '8': 97, 'A': 99, 'C': 101, 'B': 100, 'E': 103, 'D': 102, 'G': 105, 'F': 104, 'I': 107, 'H': 106, 'K': 109, 'J': 108, 'M': 111, 'L': 110, 'O': 113, 'N': 112, 'Q': 115, 'P': 114, 'S': 117, 'R': 116, 'U': 119, 'T': 118, 'W': 121, 'V': 120, 'Y': 123, 'X': 122, 'Z': 124, '_': 125, 'a': 126, 'c': 128, 'b': 127, 'e': 130, 'd': 129, 'g': 132, 'f': 131, 'i': 134, 'h': 133, 'k': 136, 'j': 135, 'm': 138, 'l': 137, 'o': 140, 'n': 139, 'q': 142, 'p': 141, 's': 144, 'r': 143, 'u': 146, 't': 145, 'w': 148, 'v': 147, 'y': 150, 'x': 149, 'z': 151},
+    {'1': 90, '0': 89, '3': 92, '2': 91, '5': 94, '4': 93, '7': 96, '6': 95, '9': 98, '8': 97, 'A': 99, 'C': 101, 'B': 100, 'E': 103, 'D': 102, 'G': 105, 'F': 104, 'I': 107, 'H': 106, 'K': 109, 'J': 108, 'M': 111, 'L': 110, 'O': 113, 'N': 112, 'Q': 115, 'P': 114, 'S': 117, 'R': 116, 'U': 119, 'T': 118, 'W': 121, 'V': 120, 'Y': 123, 'X': 122, 'Z': 124, '_': 125, 'a': 126, 'c': 128, 'b': 127, 'e': 130, 'd': 129, 'g': 132, 'f': 131, 'i': 134, 'h': 133, 'k': 136, 'j': 135, 'm': 138, 'l': 137, 'o': 140, 'n': 139, 'q': 142, 'p': 141, 's': 144, 'r': 143, 'u': 146, 't': 145, 'w': 148, 'v': 147, 'y': 150, 'x': 149, 'z': 151},
+    {'1': 90, '0': 89, '3': 92, '2': 91, '5': 94, '4': 93, '7': 96, '6': 95, '9': 98, '8': 97, 'A': 99, 'C': 101, 'B': 100, 'E': 103, 'D': 102, 'G': 105, 'F': 104, 'I': 107, 'H': 106, 'K': 109, 'J': 108, 'M': 111, 'L': 110, 'O': 113, 'N': 112, 'Q': 115, 'P': 114, 'S': 117, 'R': 116, 'U': 119, 'T': 118, 'W': 121, 'V': 120, 'Y': 123, 'X': 122, 'Z': 124, '_': 125, 'a': 126, 'c': 128, 'b': 127, 'e': 130, 'd': 129, 'g': 132, 'f': 131, 'i': 134, 'h': 133, 'k': 136, 'j': 135, 'm': 138, 'l': 137, 'o': 140, 'n': 139, 'q': 142, 'p': 141, 's': 144, 'r': 143, 'u': 146, 't': 145, 'w': 148, 'v': 147, 'y': 150, 'x': 149, 'z': 151},
+    {'1': 90, '0': 89, '3': 92, '2': 91, '5': 94, '4': 93, '7': 96, '6': 95, '9': 98, '8': 97, 'A': 99, 'C': 101, 'B': 100, 'E': 103, 'D': 102, 'G': 105, 'F': 104, 'I': 107, 'H': 106, 'K': 109, 'J': 108, 'M': 111, 'L': 110, 'O': 113, 'N': 112, 'Q': 115, 'P': 114, 'S': 117, 'R': 116, 'U': 119, 'T': 118, 'W': 121, 'V': 120, 'Y': 123, 'X': 122, 'Z': 124, '_': 125, 'a': 126, 'c': 128, 'b': 127, 'e': 130, 'd': 129, 'g': 132, 'f': 131, 'i': 134, 'h': 133, 'k': 136, 'j': 135, 'm': 138, 'l': 137, 'o': 140, 'n': 139, 'q': 142, 'p': 141, 's': 144, 'r': 143, 'u': 146, 't': 145, 'w': 148, 'v': 147, 'y': 150, 'x': 149, 'z': 151},
+    {'1': 90, '0': 89, '3': 92, '2': 91, '5': 94, '4': 93, '7': 96, '6': 95, '9': 98, '8': 97, 'A': 99, 'C': 101, 'B': 100, 'E': 103, 'D': 102, 'G': 105, 'F': 104, 'I': 107, 'H': 106, 'K': 109, 'J': 108, 'M': 111, 'L': 110, 'O': 113, 'N': 112, 'Q': 115, 'P': 114, 'S': 117, 'R': 116, 'U': 119, 'T': 118, 'W': 121, 'V': 120, 'Y': 123, 'X': 122, 'Z': 124, '_': 125, 'a': 126, 'c': 128, 'b': 127, 'e': 130, 'd': 129, 'g': 132, 'f': 131, 'i': 134, 'h': 133, 'k': 136, 'j': 135, 'm': 138, 'l': 137, 'o': 140, 'n': 139, 'q': 142, 'p': 141, 's': 144, 'r': 143, 'u': 146, 't': 145, 'w': 148, 'v': 147, 'y': 150, 'x': 149, 'z': 151},
+    {'1': 90, '0': 89, '3': 92, '2': 91, '5': 94, '4': 93, '7': 96, '6': 95, '9': 98, '8': 97, 'A': 99, 'C': 101, 'B': 100, 'E': 103, 'D': 102, 'G': 105, 'F': 104, 'I': 107, 'H': 106, 'K': 109, 'J': 108, 'M': 111, 'L': 110, 'O': 113, 'N': 112, 'Q': 115, 'P': 114, 'S': 117, 'R': 116, 'U': 119, 'T': 118, 'W': 121, 'V': 120, 'Y': 123, 'X': 122, 'Z': 124, '_': 125, 'a': 126, 'c': 128, 'b': 127, 'e': 130, 'd': 129, 'g': 132, 'f': 131, 'i': 134, 'h': 133, 'k': 136, 'j': 135, 'm': 138, 'l': 137, 'o': 140, 'n': 139, 'q': 142, 'p': 141, 's': 144, 'r': 143, 'u': 146, 't': 145, 'w': 148, 'v': 147, 'y': 150, 'x': 149, 'z': 151},
+    {'1': 90, '0': 89, '3': 92, '2': 91, '5': 94, '4': 93, '7': 96, '6': 95, '9': 98, '8': 97, 'A': 99, 'C': 101, 'B': 100, 'E': 103, 'D': 102, 'G': 105, 'F': 104, 'I': 107, 'H': 106, 'K': 109, 'J': 108, 'M': 111, 'L': 110, 'O': 113, 'N': 112, 'Q': 115, 'P': 114, 'S': 117, 'R': 116, 'U': 119, 'T': 118, 'W': 121, 'V': 120, 'Y': 123, 'X': 122, 'Z': 124, '_': 125, 'a': 126, 'c': 128, 'b': 127, 'e': 130, 'd': 129, 'g': 132, 'f': 131, 'i': 134, 'h': 133, 'k': 136, 'j': 135, 'm': 138, 'l': 137, 'o': 140, 'n': 139, 'q': 142, 'p': 141, 's': 144, 'r': 143, 'u': 146, 't': 145, 'w': 148, 'v': 147, 'y': 150, 'x': 149, 'z': 151},
+    {'1': 90, '0': 89, '3': 92, '2': 91, '5': 94, '4': 93, '7': 96, '6': 95, '9': 98, '8': 97, 'A': 99, 'C': 101, 'B': 100, 'E': 103, 'D': 102, 'G': 105, 'F': 104, 'I': 107, 'H': 106, 'K': 109, 'J': 108, 'M': 111, 'L': 110, 'O': 113, 'N': 112, 'Q': 115, 'P': 114, 'S': 117, 'R': 116, 'U': 119, 'T': 118, 'W': 121, 'V': 120, 'Y': 123, 'X': 122, 'Z': 124, '_': 125, 'a': 126, 'c': 128, 'b': 127, 'e': 130, 'd': 129, 'g': 132, 'f': 131, 'i': 134, 'h': 133, 'k': 136, 'j': 135, 'm': 138, 'l': 137, 'o': 140, 'n': 139, 'q': 142, 'p': 141, 's': 144, 'r': 143, 'u': 146, 't': 145, 'w': 148, 'v': 147, 'y': 150, 'x': 149, 'z': 151},
+    {'1': 90, '0': 89, '3': 92, '2': 91, '5': 94, '4': 93, '7': 96, '6': 95, '9': 98, '8': 97, 'A': 99, 'C': 101, 'B': 100, 'E': 103, 'D': 102, 'G': 105, 'F': 104, 'I': 107, 'H': 106, 'K': 109, 'J': 108, 'M': 111, 'L': 110, 'O': 113, 'N': 112, 'Q': 115, 'P': 114, 'S': 117, 'R': 116, 'U': 119, 'T': 118, 'W': 121, 'V': 120, 'Y': 123, 'X': 122, 'Z': 124, '_': 125, 'a': 126, 'c': 128, 'b': 127, 'e': 130, 'd': 129, 'g': 132, 'f': 131, 'i': 134, 'h': 133, 'k': 136, 'j': 135, 'm': 138, 'l': 137, 'o': 140, 'n': 139, 'q': 142, 'p': 141, 's': 144, 'r': 143, 'u': 146, 't': 145, 'w': 148, 'v': 147, 'y': 150, 'x': 149, 'z': 151},
+    {'1': 90, '0': 89, '3': 92, '2': 91, '5': 94, '4': 93, '7': 96, '6': 95, '9': 98, '8': 97, 'A': 99, 'C': 101, 'B': 100, 'E': 103, 'D': 102, 'G': 105, 'F': 104, 'I': 107, 'H': 106, 'K': 109, 'J': 108, 'M': 111, 'L': 110, 'O': 113, 'N': 112, 'Q': 115, 'P': 114, 'S': 117, 'R': 116, 'U': 119, 'T': 118, 'W': 121, 'V': 120, 'Y': 123, 'X': 122, 'Z': 124, '_': 125, 'a': 126, 'c': 128, 'b': 127, 'e': 130, 'd': 129, 'g': 132, 'f': 131, 'i': 134, 'h': 133, 'k': 136, 'j': 135, 'm': 138, 'l': 137, 'o': 140, 'n': 139, 'q': 142, 'p': 141, 's': 144, 'r': 143, 'u': 146, 't': 145, 'w': 148, 'v': 147, 'y': 150, 'x': 149, 'z': 151},
+    {'1': 90, '0': 89, '3': 92, '2': 91, '5': 94, '4': 93, '7': 96, '6': 95, '9': 98, '8': 97, 'A': 99, 'C': 101, 'B': 100, 'E': 103, 'D': 102, 'G': 105, 'F': 104, 'I': 107, 'H': 106, 'K': 109, 'J': 108, 'M': 111, 'L': 110, 'O': 113, 'N': 112, 'Q': 115, 'P': 114, 'S': 117, 'R': 116, 'U': 119, 'T': 118, 'W': 121, 'V': 120, 'Y': 123, 'X': 122, 'Z': 124, '_': 125, 'a': 126, 'c': 128, 'b': 127, 'e': 130, 'd': 129, 'g': 132, 'f': 131, 'i': 134, 'h': 133, 'k': 136, 'j': 135, 'm': 138, 'l': 137, 'o': 140, 'n': 139, 'q': 142, 'p': 141, 's': 144, 'r': 143, 'u': 146, 't': 145, 'w': 148, 'v': 147, 'y': 150, 'x': 149, 'z': 151},
+    {'1': 90, '0': 89, '3': 92, '2': 91, '5': 94, '4': 93, '7': 96, '6': 95, '9': 98, '8': 97, 'A': 99, 'C': 101, 'B': 100, 'E': 103, 'D': 102, 'G': 105, 'F': 104, 'I': 107, 'H': 106, 'K': 109, 'J': 108, 'M': 111, 'L': 110, 'O': 113, 'N': 112, 'Q': 115, 'P': 114, 'S': 117, 'R': 116, 'U': 119, 'T': 118, 'W': 121, 'V': 120, 'Y': 123, 'X': 122, 'Z': 124, '_': 125, 'a': 126, 'c': 128, 'b': 127, 'e': 130, 'd': 129, 'g': 132, 'f': 131, 'i': 134, 'h': 133, 'k': 136, 'j': 135, 'm': 138, 'l': 137, 'o': 140, 'n': 139, 'q': 142, 'p': 141, 's': 144, 'r': 143, 'u': 146, 't': 145, 'w': 148, 'v': 147, 'y': 150, 'x': 149, 'z': 151},
+    {'1': 90, '0': 89, '3': 92, '2': 91, '5': 94, '4': 93, '7': 96, '6': 95, '9': 98, '8': 97, 'A': 99, 'C': 101, 'B': 100, 'E': 103, 'D': 102, 'G': 105, 'F': 104, 'I': 107, 'H': 106, 'K': 109, 'J': 108, 'M': 111, 'L': 110, 'O': 113, 'N': 112, 'Q': 115, 'P': 114, 'S': 117, 'R': 116, 'U': 119, 'T': 118, 'W': 121, 'V': 120, 'Y': 123, 'X': 122, 'Z': 124, '_': 125, 'a': 126, 'c': 128, 'b': 127, 'e': 130, 'd': 129, 'g': 132, 'f': 131, 'i': 134, 'h': 133, 'k': 136, 'j': 135, 'm': 138, 'l': 137, 'o': 140, 'n': 139, 'q': 142, 'p': 141, 's': 144, 'r': 143, 'u': 146, 't': 145, 'w': 148, 'v': 147, 'y': 150, 'x': 149, 'z': 151},
+    {'1': 90, '0': 89, '3': 92, '2': 91, '5': 94, '4': 93, '7': 96, '6': 95, '9': 98, '8': 97, 'A': 99, 'C': 101, 'B': 100, 'E': 103, 'D': 102, 'G': 105, 'F': 104, 'I': 107, 'H': 106, 'K': 109, 'J': 108, 'M': 111, 'L': 110, 'O': 113, 'N': 112, 'Q': 115, 'P': 114, 'S': 117, 'R': 116, 'U': 119, 'T': 118, 'W': 121, 'V': 120, 'Y': 123, 'X': 122, 'Z': 124, '_': 125, 'a': 126, 'c': 128, 'b': 127, 'e': 130, 'd': 129, 'g': 132, 'f': 131, 'i': 134, 'h': 133, 'k': 136, 'j': 135, 'm': 138, 'l': 137, 'o': 140, 'n': 139, 'q': 142, 'p': 141, 's': 144, 'r': 143, 'u': 146, 't': 145, 'w': 148, 'v': 147, 'y': 150, 'x': 149, 'z': 151},
+    {'1': 90, '0': 89, '3': 92, '2': 91, '5': 94, '4': 93, '7': 96, '6': 95, '9': 98, '8': 97, 'A': 99, 'C': 101, 'B': 100, 'E': 103, 'D': 102, 'G': 105, 'F': 104, 'I': 107, 'H': 106, 'K': 109, 'J': 108, 'M': 111, 'L': 110, 'O': 113, 'N': 112, 'Q': 115, 'P': 114, 'S': 117, 'R': 116, 'U': 119, 'T': 118, 'W': 121, 'V': 120, 'Y': 123, 'X': 122, 'Z': 124, '_': 125, 'a': 126, 'c': 128, 'b': 127, 'e': 130, 'd': 129, 'g': 132, 'f': 131, 'i': 154, 'h': 133, 'k': 136, 'j': 135, 'm': 138, 'l': 137, 'o': 140, 'n': 139, 'q': 142, 'p': 141, 's': 144, 'r': 143, 'u': 146, 't': 145, 'w': 148, 'v': 147, 'y': 150, 'x': 149, 'z': 151},
+    {'1': 90, '0': 89, '3': 92, '2': 91, '5': 94, '4': 93, '7': 96, '6': 95, '9': 98, '8': 97, 'A': 99, 'C': 101, 'B': 100, 'E': 103, 'D': 102, 'G': 105, 'F': 104, 'I': 107, 'H': 106, 'K': 109, 'J': 108, 'M': 111, 'L': 110, 'O': 113, 'N': 112, 'Q': 115, 'P': 114, 'S': 117, 'R': 116, 'U': 119, 'T': 118, 'W': 121, 'V': 120, 'Y': 123, 'X': 122, 'Z': 124, '_': 125, 'a': 126, 'c': 128, 'b': 127, 'e': 130, 'd': 129, 'g': 132, 'f': 131, 'i': 134, 'h': 133, 'k': 136, 'j': 135, 'm': 138, 'l': 155, 'o': 140, 'n': 139, 'q': 142, 'p': 141, 's': 144, 'r': 143, 'u': 146, 't': 145, 'w': 148, 'v': 147, 'y': 150, 'x': 149, 'z': 151},
+    {'1': 90, '0': 89, '3': 92, '2': 91, '5': 94, '4': 93, '7': 96, '6': 95, '9': 98, '8': 97, 'A': 99, 'C': 101, 'B': 100, 'E': 103, 'D': 102, 'G': 105, 'F': 104, 'I': 107, 'H': 106, 'K': 109, 'J': 108, 'M': 111, 'L': 110, 'O': 113, 'N': 112, 'Q': 115, 'P': 114, 'S': 117, 'R': 116, 'U': 119, 'T': 118, 'W': 121, 'V': 120, 'Y': 123, 'X': 122, 'Z': 124, '_': 125, 'a': 126, 'c': 128, 'b': 127, 'e': 156, 'd': 129, 'g': 132, 'f': 131, 'i': 134, 'h': 133, 'k': 136, 'j': 135, 'm': 138, 'l': 137, 'o': 140, 'n': 139, 'q': 142, 'p': 141, 's': 144, 'r': 143, 'u': 146, 't': 145, 'w': 148, 'v': 147, 'y': 150, 'x': 149, 'z': 151},
+    {'1': 90, '0': 89, '3': 92, '2': 91, '5': 94, '4': 93, '7': 96, '6': 95, '9': 98, '8': 97, 'A': 99, 'C': 101, 'B': 100, 'E': 103, 'D': 102, 'G': 105, 'F': 104, 'I': 107, 'H': 106, 'K': 109, 'J': 108, 'M': 111, 'L': 110, 'O': 113, 'N': 112, 'Q': 115, 'P': 114, 'S': 117, 'R': 116, 'U': 119, 'T': 118, 'W': 121, 'V': 120, 'Y': 123, 'X': 122, 'Z': 124, '_': 125, 'a': 126, 'c': 128, 'b': 127, 'e': 130, 'd': 129, 'g': 132, 'f': 131, 'i': 134, 'h': 133, 'k': 136, 'j': 135, 'm': 138, 'l': 137, 'o': 140, 'n': 139, 'q': 142, 'p': 141, 's': 144, 'r': 143, 'u': 146, 't': 145, 'w': 148, 'v': 147, 'y': 150, 'x': 149, 'z': 151},
+]
+ACCEPT = [0, 10, 4, 7, 13, 13, 7, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 12, 11, 2, 11, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 9, 3, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 11, 11, 11, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 6, 5, 5, 5, 14]
+STOP_CHARS = ' \t\n'
+
+
+class Token(object):
+    def __init__(self, type_, lexeme):
+        self.type_ = type_
+        self.lexeme = lexeme
+
+
+def _scan(code, current):
+    """
+    Skips the stop chars from current and matches the longest lexeme from
+    there. Returns (token id, start, end), with the id of END at the end of
+    code.
+    """
+    size = len(code)
+    while current < size and code[current] in STOP_CHARS:
+        current += 1
+    if current >= size:
+        return END, size, size
+    state = 0
+    position = current
+    token_id = 0
+    end = current
+    while position < size:
+        state = TRANSITIONS[state].get(code[position])
+        if state is None:
+            break
+        position += 1
+        if ACCEPT[state] != 0:
+            token_id = ACCEPT[state]
+            end = position
+    if token_id == 0:
+        raise ValueError('Unknown lexeme: ' + code[current:position + 1])
+    return token_id, current, end
+
+
+def tokenize(code):
+    """
+    The ids of the tokens of code and the offsets where each one starts and
+    ends, as arrays. The last id is END, with both offsets at len(code).
+    """
+    ids = array('h')
+    starts = array('i')
+    ends = array('i')
+    current = 0
+    while True:
+        token_id, start, current = _scan(code, current)
+        ids.append(token_id)
+        starts.append(start)
+        ends.append(current)
+        if token_id == END:
+            return ids, starts, ends
+
+
+class Lexer(object):
+    def __init__(self, code):
+        self.code = code
+        self.reset()
+
+    def reset(self):
+        self.current = 0
+
+    def get_next_token(self):
+        token_id, start, self.current = _scan(self.code, self.current)
+        if token_id == END:
+            return None
+        return Token(TOKEN_NAMES[token_id], self.code[start:self.current])
+
@@ -0,0 +1,42 @@
+#!/usr/bin/env python
+"""
+One pass translation of the sample language to quadruples: the tokens of the
+DFA lexer (generated from sample_lexer/lexer.lex) go to the LALR(1) parser
+of lang.bnf, whose actions fill the QTable as they reduce.
+
+    python -m compiler.sample_language.translate program.txt
+"""
+
+from ..parser.actions import Translator
+from ..parser.imports import load_grammar
+from .actions import Translation
+from .lexer import Lexer
+import os
+import sys
+
+_translator = None
+
+
+def get_translator():
+    global _translator
+    if _translator is None:
+        filename = os.path.join(os.path.dirname(__file__), 'lang.bnf')
+        grammar, resolved = load_grammar(filename)
+        _translator = Translator(grammar, resolved)
+    return _translator
+
+
+def translate(code, env=None):
+    """The QTable of the program in code"""
+    return get_translator().translate(Lexer(code), Translation(env))
+
+
+if __name__ == '__main__':
+    if len(sys.argv) < 2:
+        raise ValueError('Required argument missing')
+    with open(sys.argv[1]) as f:
+        qtable = translate(f.read())
+    print str(qtable)
+    for i, block in enumerate(qtable.get_basic_blocks()):
+        print 'Basic block ' + str(i + 1)
+        print str(block)